@@ -0,0 +1,61 @@
+"""Benchmarks for the integration and assembly of weak forms."""
+
+import felupe as fem
+
+
+class IntegralForm:
+    params = [6, 11, 21]
+    param_names = ["n"]
+
+    def setup(self, n):
+        region = fem.RegionHexahedron(fem.Cube(n=n))
+        self.field = fem.FieldContainer([fem.Field(region, dim=3)])
+        self.ncells = region.mesh.ncells
+
+        umat = fem.NeoHooke(mu=1.0, bulk=2.0)
+        F = self.field.extract()
+        self.linearform = fem.IntegralForm(
+            umat.gradient(F)[:-1], v=self.field, dV=region.dV
+        )
+        self.bilinearform = fem.IntegralForm(
+            umat.hessian(F), v=self.field, dV=region.dV, u=self.field
+        )
+        self.values = self.bilinearform.integrate()
+
+    def time_integrate_linearform(self, n):
+        self.linearform.integrate()
+
+    def time_assemble_linearform(self, n):
+        self.linearform.assemble()
+
+    def time_integrate_bilinearform(self, n):
+        self.bilinearform.integrate()
+
+    def time_assemble_bilinearform(self, n):
+        self.bilinearform.assemble(values=self.values)
+
+
+class SolidBody:
+    params = [6, 11, 21]
+    param_names = ["n"]
+
+    def setup(self, n):
+        region = fem.RegionHexahedron(fem.Cube(n=n))
+        field = fem.FieldContainer([fem.Field(region, dim=3)])
+        self.solid = fem.SolidBody(fem.NeoHooke(mu=1.0, bulk=2.0), field)
+        self.nearly_incompressible = fem.SolidBodyNearlyIncompressible(
+            fem.NeoHooke(mu=1.0), field, bulk=5000.0
+        )
+        self.ncells = region.mesh.ncells
+
+    def time_vector(self, n):
+        self.solid.assemble.vector()
+
+    def time_matrix(self, n):
+        self.solid.assemble.matrix()
+
+    def time_vector_nearly_incompressible(self, n):
+        self.nearly_incompressible.assemble.vector()
+
+    def time_matrix_nearly_incompressible(self, n):
+        self.nearly_incompressible.assemble.matrix()
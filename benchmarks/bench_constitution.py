@@ -0,0 +1,41 @@
+"""Benchmarks for the evaluation of constitutive material formulations."""
+
+import tensortrax.math as tm
+
+import felupe as fem
+
+
+def neo_hooke(F, mu):
+    "First Piola-Kirchhoff stress tensor of the Neo-Hookean material formulation."
+    C = tm.dot(tm.transpose(F), F)
+    S = mu * tm.special.dev(tm.linalg.det(C) ** (-1 / 3) * C) @ tm.linalg.inv(C)
+    return F @ S
+
+
+class Material:
+    params = [
+        [6, 11, 21],
+        ["NeoHooke", "Hyperelastic", "MaterialAD"],
+    ]
+    param_names = ["n", "material"]
+
+    def setup(self, n, material):
+        umat = {
+            "NeoHooke": lambda: fem.NeoHooke(mu=1.0),
+            "Hyperelastic": lambda: fem.Hyperelastic(fem.neo_hooke, mu=1.0),
+            "MaterialAD": lambda: fem.MaterialAD(neo_hooke, mu=1.0),
+        }
+        self.umat = umat[material]()
+
+        region = fem.RegionHexahedron(fem.Cube(n=n))
+        field = fem.FieldContainer([fem.Field(region, dim=3)])
+        field[0].values[:] = 0.1 * region.mesh.points
+
+        self.F = field.extract()
+        self.ncells = region.mesh.ncells
+
+    def time_gradient(self, n, material):
+        self.umat.gradient(self.F)
+
+    def time_hessian(self, n, material):
+        self.umat.hessian(self.F)
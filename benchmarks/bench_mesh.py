@@ -0,0 +1,44 @@
+"""Benchmarks for the generation and the manipulation of meshes."""
+
+import numpy as np
+
+import felupe as fem
+
+
+class Mesh:
+    params = [6, 11, 21, 31]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.mesh = fem.Cube(n=n)
+        self.ncells = self.mesh.ncells
+
+        # two cubes with coincident points on the common face
+        other = self.mesh.translate(1, axis=0)
+        self.merged = fem.mesh.concatenate([self.mesh, other])
+
+    def time_cube(self, n):
+        fem.Cube(n=n)
+
+    def time_triangulate(self, n):
+        self.mesh.triangulate()
+
+    def time_add_midpoints_edges(self, n):
+        self.mesh.add_midpoints_edges()
+
+    def time_merge_duplicate_points(self, n):
+        fem.mesh.merge_duplicate_points(self.merged)
+
+
+class Rectangle:
+    params = [11, 51, 101, 201]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.ncells = (n - 1) ** 2
+
+    def time_rectangle(self, n):
+        fem.Rectangle(n=n)
+
+    def time_region_quad(self, n):
+        fem.RegionQuad(fem.Rectangle(n=n))
@@ -0,0 +1,23 @@
+"""Benchmarks for the post-processing of results."""
+
+import felupe as fem
+
+
+class Project:
+    params = [6, 11, 21]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.region = fem.RegionHexahedron(fem.Cube(n=n))
+        field = fem.FieldContainer([fem.Field(self.region, dim=3)])
+        field[0].values[:] = 0.1 * self.region.mesh.points
+
+        solid = fem.SolidBody(fem.NeoHooke(mu=1.0, bulk=2.0), field)
+        self.stress = solid.evaluate.cauchy_stress()
+        self.ncells = self.region.mesh.ncells
+
+    def time_project(self, n):
+        fem.project(fem.math.tovoigt(self.stress), self.region)
+
+    def time_topoints(self, n):
+        fem.topoints(self.stress, self.region)
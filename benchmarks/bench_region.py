@@ -0,0 +1,42 @@
+"""Benchmarks for the creation of regions and fields."""
+
+import felupe as fem
+
+
+class Region:
+    params = [6, 11, 21, 31]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.mesh = fem.Cube(n=n)
+        self.quadratic = self.mesh.triangulate().add_midpoints_edges()
+        self.ncells = self.mesh.ncells
+
+    def time_region_hexahedron(self, n):
+        fem.RegionHexahedron(self.mesh)
+
+    def time_region_quadratic_tetra(self, n):
+        fem.RegionQuadraticTetra(self.quadratic)
+
+    def time_region_hexahedron_boundary(self, n):
+        fem.RegionHexahedronBoundary(self.mesh)
+
+
+class Field:
+    params = [6, 11, 21, 31]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.region = fem.RegionHexahedron(fem.Cube(n=n))
+        self.field = fem.FieldContainer([fem.Field(self.region, dim=3)])
+        self.mixed = fem.FieldsMixed(self.region, n=3)
+        self.ncells = self.region.mesh.ncells
+
+    def time_fields_mixed(self, n):
+        fem.FieldsMixed(self.region, n=3)
+
+    def time_extract(self, n):
+        self.field.extract()
+
+    def time_extract_mixed(self, n):
+        self.mixed.extract()
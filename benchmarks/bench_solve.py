@@ -0,0 +1,43 @@
+"""Benchmarks for linear solves, Newton's method and jobs."""
+
+import felupe as fem
+
+
+class NewtonRhapson:
+    params = [6, 11, 16]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.region = fem.RegionHexahedron(fem.Cube(n=n))
+        self.ncells = self.region.mesh.ncells
+
+    def time_newtonrhapson(self, n):
+        field = fem.FieldContainer([fem.Field(self.region, dim=3)])
+        boundaries, loadcase = fem.dof.uniaxial(field, move=0.2, clamped=True)
+        solid = fem.SolidBody(fem.NeoHooke(mu=1.0, bulk=2.0), field)
+        fem.newtonrhapson(items=[solid], verbose=0, **loadcase)
+
+
+class Job:
+    "Cantilever beam under gravity, see ``examples/ex01_beam.py``."
+
+    params = [26, 51, 101]
+    param_names = ["n"]
+
+    def setup(self, n):
+        self.mesh = fem.Cube(a=(0, 0, 0), b=(2000, 100, 100), n=(n, 6, 6))
+        self.ncells = self.mesh.ncells
+
+    def time_job(self, n):
+        region = fem.RegionHexahedron(self.mesh)
+        displacement = fem.Field(region, dim=3)
+        field = fem.FieldContainer([displacement])
+
+        boundaries = {"fixed": fem.dof.Boundary(displacement, fx=0)}
+
+        umat = fem.LinearElastic(E=206000, nu=0.3)
+        solid = fem.SolidBody(umat=umat, field=field)
+        gravity = fem.SolidBodyGravity(field, gravity=[0, 0, 9810], density=7.85e-9)
+
+        step = fem.Step(items=[solid, gravity], boundaries=boundaries)
+        fem.Job(steps=[step]).evaluate(verbose=0)
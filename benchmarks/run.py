@@ -0,0 +1,256 @@
+"""Run the benchmarks and write the results to a JSON file.
+
+The benchmark classes are compatible with airspeed velocity (asv): each class provides
+``params``, ``param_names``, ``setup()`` and ``time_*()`` methods. This runner doesn't
+need asv and works offline. The runtimes and the peak memory (traced by
+:mod:`tracemalloc`) are measured for all parameters and each number of threads. The
+number of threads is applied to the BLAS and OpenMP libraries by environment variables
+of a subprocess for each number of threads.
+
+Examples
+--------
+Run all benchmarks and plot the runtimes over the number of cells and threads.
+
+..  code-block:: shell
+
+    python benchmarks/run.py --threads 1 2 4 --output benchmarks.json --plot
+
+Run only the smallest models of the assembly benchmarks.
+
+..  code-block:: shell
+
+    python benchmarks/run.py --quick --filter assembly
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+
+DIRECTORY = Path(__file__).resolve().parent
+
+THREADS = [
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+]
+
+
+def discover(pattern=None):
+    "Return a list of all benchmark classes found in the modules ``bench_*.py``."
+
+    sys.path.insert(0, str(DIRECTORY.parent))
+
+    classes = []
+    for module in sorted(DIRECTORY.glob("bench_*.py")):
+        module = importlib.import_module(f"benchmarks.{module.stem}")
+
+        for name in dir(module):
+            obj = getattr(module, name)
+            if isinstance(obj, type) and obj.__module__ == module.__name__:
+                key = f"{module.__name__.split('.')[-1]}.{name}"
+                if pattern is None or pattern.lower() in key.lower():
+                    classes.append((key, obj))
+
+    return classes
+
+
+def parameters(cls, quick=False):
+    "Return a list of all combinations of the parameters of a benchmark class."
+
+    params = getattr(cls, "params", [[]])
+    if len(params) == 0 or not isinstance(params[0], (list, tuple)):
+        params = [params]
+
+    if quick:
+        params = [p[:1] for p in params]
+
+    return list(itertools.product(*params))
+
+
+def measure(method, args, repeat):
+    "Return the runtimes and the peak memory of a benchmark method."
+
+    # warm-up
+    method(*args)
+
+    times = []
+    for i in range(repeat):
+        start = perf_counter()
+        method(*args)
+        times.append(perf_counter() - start)
+
+    tracemalloc.start()
+    method(*args)
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "repeat": repeat,
+    }, memory
+
+
+def worker(pattern, quick, repeat, threads):
+    "Run all benchmarks in the current process."
+
+    results = []
+
+    for key, cls in discover(pattern):
+        names = getattr(cls, "param_names", [])
+        methods = [m for m in dir(cls) if m.startswith("time_")]
+
+        for args in parameters(cls, quick=quick):
+            benchmark = cls()
+            if hasattr(benchmark, "setup"):
+                benchmark.setup(*args)
+
+            for name in methods:
+                time, memory = measure(getattr(benchmark, name), args, repeat)
+                results.append(
+                    {
+                        "benchmark": f"{key}.{name}",
+                        "params": dict(zip(names, args)),
+                        "threads": threads,
+                        "cells": getattr(benchmark, "ncells", None),
+                        "time": time,
+                        "peakmem": memory,
+                    }
+                )
+                print(f"{key}.{name} {args} threads={threads}: {time['min']:.4g} s")
+
+    return results
+
+
+def machine():
+    "Return a dict with information about the machine and the installed packages."
+
+    import numpy
+    import scipy
+
+    import felupe
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "felupe": felupe.__version__,
+        "numpy": numpy.__version__,
+        "scipy": scipy.__version__,
+    }
+
+
+def plot(results, output):
+    "Plot the runtimes over the number of cells and the number of threads."
+
+    import matplotlib.pyplot as plt
+
+    groups = {}
+    for result in results:
+        group = result["benchmark"].rsplit(".", 1)[0]
+        groups.setdefault(group, []).append(result)
+
+    for group, items in groups.items():
+        threads = sorted(set(item["threads"] for item in items))
+        fig, axes = plt.subplots(1, 1 + (len(threads) > 1), squeeze=False)
+
+        lines = {}
+        for item in items:
+            params = {k: v for k, v in item["params"].items() if k != "n"}
+            label = " ".join(
+                [item["benchmark"].split(".")[-1], *map(str, params.values())]
+            )
+            lines.setdefault(label, []).append(item)
+
+        for label, line in lines.items():
+            first = [item for item in line if item["threads"] == threads[0]]
+            axes[0, 0].loglog(
+                [item["cells"] for item in first],
+                [item["time"]["min"] for item in first],
+                "o-",
+                label=label,
+            )
+
+            if len(threads) > 1:
+                largest = max(item["cells"] for item in line)
+                last = [item for item in line if item["cells"] == largest]
+                axes[0, 1].plot(
+                    [item["threads"] for item in last],
+                    [item["time"]["min"] for item in last],
+                    "o-",
+                    label=label,
+                )
+                axes[0, 1].set_xlabel(r"Number of threads $\longrightarrow$")
+                axes[0, 1].set_title("Largest model")
+
+        axes[0, 0].set_xlabel(r"Number of cells $\longrightarrow$")
+        axes[0, 0].set_ylabel(r"Runtime in s $\longrightarrow$")
+        axes[0, 0].set_title(f"{threads[0]} thread(s)")
+        axes[0, 0].legend(fontsize="small")
+        fig.suptitle(group)
+        fig.tight_layout()
+        fig.savefig(output.with_name(f"{output.stem}_{group}.png"))
+        plt.close(fig)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the FElupe benchmarks.")
+    parser.add_argument("--filter", default=None, help="select benchmarks by name")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="smallest models only")
+    parser.add_argument("--output", type=Path, default=Path("benchmarks.json"))
+    parser.add_argument("--plot", action="store_true", help="requires matplotlib")
+    parser.add_argument("--worker", type=Path, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker is not None:
+        results = worker(args.filter, args.quick, args.repeat, args.threads[0])
+        args.worker.write_text(json.dumps(results))
+        return
+
+    results = []
+    for threads in args.threads:
+        env = {**os.environ, **{key: str(threads) for key in THREADS}}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "results.json"
+            command = [sys.executable, __file__, "--worker", str(output)]
+            command += ["--threads", str(threads), "--repeat", str(args.repeat)]
+
+            if args.filter is not None:
+                command += ["--filter", args.filter]
+
+            if args.quick:
+                command += ["--quick"]
+
+            subprocess.run(command, env=env, check=True)
+            results.extend(json.loads(output.read_text()))
+
+    args.output.write_text(
+        json.dumps({"machine": machine(), "results": results}, indent=2)
+    )
+
+    if args.plot:
+        plot(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
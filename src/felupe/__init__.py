@@ -1,133 +1,198 @@
-from . import (
-    constitution,
-    dof,
-    element,
-    math,
-    mechanics,
-    mesh,
-    quadrature,
-    region,
-    solve,
-    tools,
-)
+"""The submodules and the public classes and functions of FElupe are imported on
+first access (PEP 562). Hence, ``import felupe`` is fast and heavy (optional)
+dependencies are only imported when they are needed."""
+
+import importlib
+
 from .__about__ import __version__
-from .assembly import IntegralForm
-from .assembly.expression import Form
-from .constitution import (
-    AreaChange,
-    CompositeMaterial,
-    ConstitutiveMaterial,
-    Hyperelastic,
-    LinearElastic,
-    LinearElasticLargeStrain,
-    LinearElasticPlaneStrain,
-    LinearElasticPlaneStress,
-    LinearElasticPlasticIsotropicHardening,
-    LineChange,
-    Material,
-    MaterialAD,
-    MaterialStrain,
-    NearlyIncompressible,
-    NeoHooke,
-    NeoHookeCompressible,
-    OgdenRoxburgh,
-    ThreeFieldVariation,
-    ViewMaterial,
-    ViewMaterialIncompressible,
-    VolumeChange,
-    Volumetric,
-    arruda_boyce,
-    extended_tube,
-    finite_strain_viscoelastic,
-    isochoric_volumetric_split,
-    linear_elastic,
-    linear_elastic_plastic_isotropic_hardening,
-    mooney_rivlin,
-    neo_hooke,
-    ogden,
-    saint_venant_kirchhoff,
-    third_order_deformation,
-    van_der_waals,
-    yeoh,
-)
-from .dof import Boundary
-from .element import ArbitraryOrderLagrange as ArbitraryOrderLagrangeElement
-from .element import (
-    BiQuadraticQuad,
-    ConstantHexahedron,
-    ConstantQuad,
-    Hexahedron,
-    Line,
-    Quad,
-    QuadraticHexahedron,
-    QuadraticQuad,
-    QuadraticTetra,
-    QuadraticTriangle,
-    Tetra,
-    TetraMINI,
-    Triangle,
-    TriangleMINI,
-    TriQuadraticHexahedron,
-)
-from .field import (
-    Field,
-    FieldAxisymmetric,
-    FieldContainer,
-    FieldDual,
-    FieldPlaneStrain,
-    FieldsMixed,
-)
-from .mechanics import (
-    CharacteristicCurve,
-    FormItem,
-    Job,
-    MultiPointConstraint,
-    MultiPointContact,
-    PointLoad,
-    SolidBody,
-    SolidBodyGravity,
-    SolidBodyNearlyIncompressible,
-    SolidBodyPressure,
-    StateNearlyIncompressible,
-    Step,
-)
-from .mesh import Circle, Cube, Grid, Mesh, MeshContainer, Point, Rectangle
-from .quadrature import BazantOh, GaussLegendre, GaussLegendreBoundary
-from .quadrature import Tetrahedron as TetrahedronQuadrature
-from .quadrature import Triangle as TriangleQuadrature
-from .region import (
-    Region,
-    RegionBiQuadraticQuad,
-    RegionBiQuadraticQuadBoundary,
-    RegionBoundary,
-    RegionConstantHexahedron,
-    RegionConstantQuad,
-    RegionHexahedron,
-    RegionHexahedronBoundary,
-    RegionLagrange,
-    RegionQuad,
-    RegionQuadBoundary,
-    RegionQuadraticHexahedron,
-    RegionQuadraticHexahedronBoundary,
-    RegionQuadraticQuad,
-    RegionQuadraticQuadBoundary,
-    RegionQuadraticTetra,
-    RegionQuadraticTriangle,
-    RegionTetra,
-    RegionTetraMINI,
-    RegionTriangle,
-    RegionTriangleMINI,
-    RegionTriQuadraticHexahedron,
-    RegionTriQuadraticHexahedronBoundary,
-)
-from .tools import ViewField, ViewMesh
-from .tools import ViewSolid
-from .tools import ViewSolid as View
-from .tools import ViewXdmf, newtonrhapson, project, runs_on, save, topoints
 
-UserMaterial = Material  # alias to be removed in v8.0.0
-UserMaterialStrain = MaterialStrain  # alias to be removed in v8.0.0
-UserMaterialHyperelastic = Hyperelastic  # alias to be removed in v8.0.0
+_submodules = [
+    "assembly",
+    "constitution",
+    "dof",
+    "element",
+    "field",
+    "math",
+    "mechanics",
+    "mesh",
+    "quadrature",
+    "region",
+    "solve",
+    "tools",
+]
+
+# the names of the lazily imported attributes of the submodules
+_attributes = {
+    "assembly": ["IntegralForm"],
+    "assembly.expression": ["Basis", "Form"],
+    "constitution": [
+        "AreaChange",
+        "CompositeMaterial",
+        "ConstitutiveMaterial",
+        "Hyperelastic",
+        "LinearElastic",
+        "LinearElasticLargeStrain",
+        "LinearElasticPlaneStrain",
+        "LinearElasticPlaneStress",
+        "LinearElasticPlasticIsotropicHardening",
+        "LineChange",
+        "Material",
+        "MaterialAD",
+        "MaterialStrain",
+        "NearlyIncompressible",
+        "NeoHooke",
+        "NeoHookeCompressible",
+        "OgdenRoxburgh",
+        "ThreeFieldVariation",
+        "ViewMaterial",
+        "ViewMaterialIncompressible",
+        "VolumeChange",
+        "Volumetric",
+        "arruda_boyce",
+        "extended_tube",
+        "finite_strain_viscoelastic",
+        "isochoric_volumetric_split",
+        "linear_elastic",
+        "linear_elastic_plastic_isotropic_hardening",
+        "mooney_rivlin",
+        "neo_hooke",
+        "ogden",
+        "saint_venant_kirchhoff",
+        "third_order_deformation",
+        "van_der_waals",
+        "yeoh",
+    ],
+    "dof": ["Boundary"],
+    "element": [
+        "BiQuadraticQuad",
+        "ConstantHexahedron",
+        "ConstantQuad",
+        "Hexahedron",
+        "Line",
+        "Quad",
+        "QuadraticHexahedron",
+        "QuadraticQuad",
+        "QuadraticTetra",
+        "QuadraticTriangle",
+        "Tetra",
+        "TetraMINI",
+        "Triangle",
+        "TriangleMINI",
+        "TriQuadraticHexahedron",
+    ],
+    "field": [
+        "Field",
+        "FieldAxisymmetric",
+        "FieldContainer",
+        "FieldDual",
+        "FieldPlaneStrain",
+        "FieldsMixed",
+    ],
+    "mechanics": [
+        "ArcLengthStep",
+        "CharacteristicCurve",
+        "ExplicitStep",
+        "FormItem",
+        "Job",
+        "MultiPointConstraint",
+        "MultiPointContact",
+        "PointLoad",
+        "SolidBody",
+        "SolidBodyDecomposed",
+        "SolidBodyGravity",
+        "SolidBodyInertia",
+        "SolidBodyNearlyIncompressible",
+        "SolidBodyPressure",
+        "StateNearlyIncompressible",
+        "Step",
+    ],
+    "mesh": ["Circle", "Cube", "Grid", "Mesh", "MeshContainer", "Point", "Rectangle"],
+    "quadrature": ["BazantOh", "GaussLegendre", "GaussLegendreBoundary"],
+    "region": [
+        "Region",
+        "RegionBiQuadraticQuad",
+        "RegionBiQuadraticQuadBoundary",
+        "RegionBoundary",
+        "RegionConstantHexahedron",
+        "RegionConstantQuad",
+        "RegionHexahedron",
+        "RegionHexahedronBoundary",
+        "RegionLagrange",
+        "RegionQuad",
+        "RegionQuadBoundary",
+        "RegionQuadraticHexahedron",
+        "RegionQuadraticHexahedronBoundary",
+        "RegionQuadraticQuad",
+        "RegionQuadraticQuadBoundary",
+        "RegionQuadraticTetra",
+        "RegionQuadraticTetraBoundary",
+        "RegionQuadraticTriangle",
+        "RegionQuadraticTriangleBoundary",
+        "RegionReducedHexahedron",
+        "RegionReducedQuad",
+        "RegionTetra",
+        "RegionTetraBoundary",
+        "RegionTetraMINI",
+        "RegionTetraMINIBoundary",
+        "RegionTriangle",
+        "RegionTriangleBoundary",
+        "RegionTriangleMINI",
+        "RegionTriangleMINIBoundary",
+        "RegionTriQuadraticHexahedron",
+        "RegionTriQuadraticHexahedronBoundary",
+    ],
+    "tools": [
+        "ViewField",
+        "ViewMesh",
+        "ViewSolid",
+        "ViewXdmf",
+        "newtonrhapson",
+        "project",
+        "runs_on",
+        "save",
+        "topoints",
+    ],
+}
+
+# aliases of lazily imported attributes of the submodules
+_aliases = {
+    "ArbitraryOrderLagrangeElement": ("element", "ArbitraryOrderLagrange"),
+    "TetrahedronQuadrature": ("quadrature", "Tetrahedron"),
+    "TriangleQuadrature": ("quadrature", "Triangle"),
+    "View": ("tools", "ViewSolid"),
+    "UserMaterial": ("constitution", "Material"),  # to be removed in v8.0.0
+    "UserMaterialStrain": ("constitution", "MaterialStrain"),  # to be removed in v8.0.0
+    "UserMaterialHyperelastic": ("constitution", "Hyperelastic"),  # to be removed
+}
+
+_lazy = {
+    **{name: (module, name) for module, names in _attributes.items() for name in names},
+    **_aliases,
+}
+
+
+def __getattr__(name):
+    "Import a submodule or an attribute of a submodule on first access."
+
+    if name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+
+    elif name in _lazy:
+        module, attribute = _lazy[name]
+        value = getattr(importlib.import_module(f".{module}", __name__), attribute)
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache the imported attribute, ``__getattr__`` isn't called again for this name
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules) | set(_lazy))
+
 
 __all__ = [
     "__version__",
@@ -210,11 +275,15 @@ __all__ = [
     "MeshContainer",
     "Point",
     "Rectangle",
+    "ArcLengthStep",
     "CharacteristicCurve",
+    "ExplicitStep",
     "Job",
     "PointLoad",
     "SolidBody",
+    "SolidBodyDecomposed",
     "SolidBodyGravity",
+    "SolidBodyInertia",
     "SolidBodyNearlyIncompressible",
     "SolidBodyPressure",
     "StateNearlyIncompressible",
@@ -242,11 +311,19 @@ __all__ = [
     "RegionQuadraticQuad",
     "RegionQuadraticQuadBoundary",
     "RegionQuadraticTetra",
+    "RegionQuadraticTetraBoundary",
     "RegionQuadraticTriangle",
+    "RegionQuadraticTriangleBoundary",
+    "RegionReducedHexahedron",
+    "RegionReducedQuad",
     "RegionTetra",
+    "RegionTetraBoundary",
     "RegionTetraMINI",
+    "RegionTetraMINIBoundary",
     "RegionTriangle",
+    "RegionTriangleBoundary",
     "RegionTriangleMINI",
+    "RegionTriangleMINIBoundary",
     "RegionTriQuadraticHexahedron",
     "RegionTriQuadraticHexahedronBoundary",
     "newtonrhapson",
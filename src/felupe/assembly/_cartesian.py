@@ -17,13 +17,50 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import numpy as np
+from scipy.sparse import csr_matrix as sparsematrix
 
-try:
-    from einsumt import einsumt
-except ModuleNotFoundError:
-    from numpy import einsum as einsumt
+from ..math._tensor import einsumt
 
-from scipy.sparse import csr_matrix as sparsematrix
+
+def _stencil(shape, cells, vdim, udim):
+    """Return the sparsity pattern in CSR-format (index pointers and column indices) of
+    a bilinear form of two fields on a structured grid with the number of points per
+    axis ``shape``. The neighbour points of a point are given by the offsets of the
+    stencil ``(-1, 0, 1)`` per axis, which are already sorted by the point ids. Hence,
+    the pattern is obtained without sorting. Additionally, the ranks of the neighbour
+    points in the rows of the points and the stencil-ids of the pairs of points of a
+    cell are returned."""
+
+    npoints = int(np.prod(shape))
+    ndim = len(shape)
+
+    # grid indices (i, j, k) of the points and the offsets of the neighbour points
+    index = np.stack(np.unravel_index(np.arange(npoints), shape[::-1])[::-1], axis=1)
+    grids = np.meshgrid(*[[-1, 0, 1]] * ndim, indexing="ij")
+    offsets = np.stack(grids[::-1], axis=-1).reshape(-1, ndim)
+
+    neighbours = index.reshape(npoints, 1, ndim) + offsets
+    valid = np.all((neighbours >= 0) & (neighbours < shape), axis=2)
+    rank = (np.cumsum(valid, axis=1) - 1).astype(np.int8)
+
+    # index pointers and column indices of the rows "ai" and the columns "bk"
+    count = np.repeat(udim * valid.sum(axis=1), vdim)
+    indptr = np.concatenate([[0], np.cumsum(count)])
+
+    strides = np.cumprod([1, *shape[:-1]])
+    columns = udim * (np.arange(npoints).reshape(-1, 1) + offsets @ strides)
+    columns = columns.reshape(npoints, 1, -1, 1) + np.arange(udim)
+
+    shape = (npoints, vdim, len(offsets), udim)
+    mask = np.broadcast_to(valid.reshape(npoints, 1, -1, 1), shape)
+    indices = np.broadcast_to(columns, mask.shape)[mask]
+
+    # stencil-ids of the pairs of points "ab" of the cells (equal for all cells)
+    local = index[cells[0]]
+    local = local.reshape(1, -1, ndim) - local.reshape(-1, 1, ndim)
+    local = ((local + 1) * 3 ** np.arange(ndim)).sum(axis=2)
+
+    return indptr, indices, rank, local
 
 
 class IntegralFormCartesian:
@@ -118,6 +155,16 @@ class IntegralFormCartesian:
             self.indices = self.v.indices.ai
             self.shape = self.v.indices.shape
 
+        # # bilinear form on a structured grid
+        elif self._structured():
+            mesh = self.v.region.mesh
+            self.indices = None
+            self.shape = (self.v.indices.shape[0], self.u.indices.shape[0])
+            self.stencil = mesh._cached(
+                ("stencil", self.v.dim, self.u.dim),
+                lambda: _stencil(mesh.structured, mesh.cells, self.v.dim, self.u.dim),
+            )
+
         # # bilinear form
         else:
             cai = self.v.indices.cai
@@ -129,12 +176,26 @@ class IntegralFormCartesian:
             self.indices = (caibk0, caibk1)
             self.shape = (self.v.indices.shape[0], self.u.indices.shape[0])
 
+    def _structured(self):
+        "Check if both fields of a bilinear form share the cells of a structured grid."
+
+        mesh = self.v.region.mesh
+
+        return (
+            mesh.structured is not None
+            and self.u.region.mesh.cells is mesh.cells
+            and mesh.cell_type in ["line", "quad", "hexahedron"]
+        )
+
     def assemble(self, values=None, parallel=False, out=None):
         "Assembly of sparse region vectors or matrices."
 
         if values is None:
             values = self.integrate(parallel=parallel, out=out)
 
+        if self.indices is None:
+            return self._assemble_stencil(values)
+
         permute = np.append(len(values.shape) - 1, range(len(values.shape) - 1)).astype(
             int
         )
@@ -145,6 +206,33 @@ class IntegralFormCartesian:
 
         return res
 
+    def _assemble_stencil(self, values):
+        """Assembly of a sparse matrix with the sparsity pattern of a structured grid.
+        The values of the cells are summed up at their positions in the data-array of
+        the sparse matrix in CSR-format."""
+
+        indptr, indices, rank, local = self.stencil
+        cells = self.v.region.mesh.cells
+        vdim, udim = self.v.dim, self.u.dim
+        ncells, npoints = cells.shape
+
+        # positions of the values "aibk" of the cells "c" in the data-array
+        rows = indptr[:-1].reshape(-1, vdim)[cells]
+        columns = rank[cells.reshape(ncells, npoints, 1), local].astype(np.int64)
+        position = (
+            rows.reshape(ncells, npoints, vdim, 1, 1)
+            + udim * columns.reshape(ncells, npoints, 1, npoints, 1)
+            + np.arange(udim)
+        )
+
+        data = np.bincount(
+            position.ravel(),
+            weights=np.moveaxis(values, -1, 0).ravel(),
+            minlength=len(indices),
+        )
+
+        return sparsematrix((data, indices, indptr), shape=self.shape)
+
     def integrate(self, parallel=False, out=None):
         "Return evaluated (but not assembled) integrals."
 
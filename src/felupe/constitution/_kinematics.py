@@ -18,12 +18,8 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
 
-try:
-    from einsumt import einsumt
-except ModuleNotFoundError:
-    from numpy import einsum as einsumt
-
 from ..math import cdya_ik, cdya_il, det, dot, dya, identity, inv, transpose
+from ..math._tensor import einsumt
 
 
 class LineChange:
@@ -20,6 +20,28 @@ import numpy as np
 
 
 class Element:
+    r"""The base class of the finite element formulations.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        The number of points and the dimension of the element.
+
+    Notes
+    -----
+    The shape functions :math:`\boldsymbol{h}(\boldsymbol{r})` and their gradients
+    w.r.t. the natural element coordinates are evaluated by ``function(r)`` and
+    ``gradient(r)`` at one point ``r`` of shape ``(dim,)``. Elements with the flag
+    ``batched = True`` also accept a batch of points of shape ``(npoints, dim)``, where
+    the points are appended as a trailing axis to the results, i.e. the shape
+    functions ``h_aq`` are of shape ``(nbasis, npoints)`` and their gradients
+    ``dhdr_aJq`` of shape ``(nbasis, dim, npoints)``.
+    """
+
+    # a flag to indicate that the shape functions and their gradients are evaluated
+    # for batches of points
+    batched = False
+
     def __init__(self, shape):
         self.shape = shape
         self.dim = self.shape[1]
@@ -53,6 +53,8 @@ class ConstantHexahedron(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         self.points = np.array(
             [
@@ -73,11 +75,11 @@ class ConstantHexahedron(Element):
 
     def function(self, rst):
         "Return the shape functions at given coordinates (r, s, t)."
-        return np.array([1])
+        return np.ones((1, *np.shape(rst)[:-1]))
 
     def gradient(self, rst):
         "Return the gradient of shape functions at given coordinates (r, s, t)."
-        return np.array([[0, 0, 0]])
+        return np.zeros((1, 3, *np.shape(rst)[:-1]))
 
 
 class Hexahedron(Element):
@@ -120,6 +122,8 @@ class Hexahedron(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         self.points = np.array(
             [
@@ -140,7 +144,7 @@ class Hexahedron(Element):
 
     def function(self, rst):
         "Return the shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
+        r, s, t = np.transpose(rst)
         return (
             np.array(
                 [
@@ -159,7 +163,7 @@ class Hexahedron(Element):
 
     def gradient(self, rst):
         "Return the gradient of shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
+        r, s, t = np.transpose(rst)
         return (
             np.array(
                 [
@@ -208,6 +212,8 @@ class QuadraticHexahedron(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         self.points = np.array(
             [
@@ -244,7 +250,7 @@ class QuadraticHexahedron(Element):
 
     def function(self, rst):
         "Return the shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
+        r, s, t = np.transpose(rst)
         return np.array(
             [
                 -(1 - r) * (1 - s) * (1 - t) * (2 + r + s + t) * 0.125,
@@ -276,7 +282,7 @@ class QuadraticHexahedron(Element):
 
     def gradient(self, rst):
         "Return the gradient of shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
+        r, s, t = np.transpose(rst)
         return np.array(
             [
                 [
@@ -447,6 +453,8 @@ class TriQuadraticHexahedron(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(27, 3))
 
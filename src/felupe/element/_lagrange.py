@@ -20,7 +20,6 @@ from copy import deepcopy as copy
 from string import ascii_lowercase as alphabet
 
 import numpy as np
-from scipy.special import factorial
 
 from ._base import Element
 
@@ -246,6 +245,8 @@ class ArbitraryOrderLagrange(Element):
        >>> element.plot().show()
     """
 
+    batched = True
+
     def __init__(self, order, dim, interval=(-1, 1), permute=True):
         self._order = order
         self._nshape = order + 1
@@ -265,11 +266,17 @@ class ArbitraryOrderLagrange(Element):
             np.array([self._polynomial(p, n) for p in self._points(n)])
         ).T
 
-        # indices for outer product in einstein notation
+        # indices for outer product in einstein notation with a trailing batch-axis
+        # of the points, where the first index is the fastest varying index
         # idx = ["a", "b", "c", ...][:dim]
-        # subscripts = "a,b,c -> abc"
+        # subscripts = "za,zb,zc -> cbaz"
         self._idx = [letter for letter in alphabet][: self.dim]
-        self._subscripts = ",".join(self._idx) + "->" + "".join(self._idx)
+        self._subscripts = (
+            ",".join(["z" + i for i in self._idx])
+            + "->"
+            + "".join(self._idx[::-1])
+            + "z"
+        )
 
         # init points
         grid = np.meshgrid(*np.tile(self._points(n), (dim, 1)), indexing="ij")[::-1]
@@ -291,40 +298,55 @@ class ArbitraryOrderLagrange(Element):
     def function(self, r):
         "Return the shape functions at given coordinate vector r."
         n = self._nshape
+        points = np.reshape(r, (-1, self.dim))
 
-        # 1d - basis function vectors per axis
-        fun = [self._AT @ self._polynomial(ra, n) for ra in r]
-        h = np.einsum(self._subscripts, *fun).ravel("F")
+        # 1d - basis function tables per axis
+        fun = [self._polynomial(ra, n) @ self._AT.T for ra in points.T]
+        h = self._outer(fun)
 
         if self.permute is not None:
             h = h[self.permute]
 
+        if np.ndim(r) == 1:
+            h = h[..., 0]
+
         return h
 
     def gradient(self, r):
         "Return the gradient of shape functions at given coordinate vector r."
         n = self._nshape
+        points = np.reshape(r, (-1, self.dim))
 
-        # 1d - basis function vectors per axis
-        h = [self._AT @ self._polynomial(ra, n) for ra in r]
+        # 1d - basis function tables per axis
+        polynomials = [self._polynomial(ra, n) for ra in points.T]
+        h = [p @ self._AT.T for p in polynomials]
 
-        # shifted 1d - basis function vectors per axis
-        k = [self._AT @ np.append(0, self._polynomial(ra, n)[:-1]) for ra in r]
+        # shifted 1d - basis function tables per axis
+        k = [np.pad(p[:, :-1], ((0, 0), (1, 0))) @ self._AT.T for p in polynomials]
 
         # init output
-        dhdr = np.zeros((n**self.dim, self.dim))
+        dhdr = np.zeros((n**self.dim, self.dim, len(points)))
 
         # loop over columns
         for i in range(self.dim):
             g = copy(h)
             g[i] = k[i]
-            dhdr[:, i] = np.einsum(self._subscripts, *g).ravel("F")
+            dhdr[:, i] = self._outer(g)
 
         if self.permute is not None:
             dhdr = dhdr[self.permute]
 
+        if np.ndim(r) == 1:
+            dhdr = dhdr[..., 0]
+
         return dhdr
 
+    def _outer(self, fun):
+        """Return the flattened outer (dyadic) products of the 1d - basis function
+        tables of shape ``(npoints, n)`` per axis as array of shape
+        ``(n**dim, npoints)``."""
+        return np.einsum(self._subscripts, *fun).reshape(-1, len(fun[0]))
+
     def _points(self, n):
         "Equidistant n-points in interval [-1, 1]."
         return np.linspace(*self._interval, n)
@@ -332,4 +354,5 @@ class ArbitraryOrderLagrange(Element):
     def _polynomial(self, r, n):
         "Lagrange-Polynomial of order n evaluated at coordinate vector r."
         m = np.arange(n)
-        return r**m / factorial(m)
+        factorial = np.cumprod(np.maximum(m, 1), dtype=float)
+        return np.expand_dims(r, -1) ** m / factorial
@@ -44,6 +44,8 @@ class Line(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(2, 1))
         self.points = np.array([-1, 1], dtype=float)
@@ -52,10 +54,11 @@ class Line(Element):
 
     def function(self, rv):
         "Return the shape functions at given coordinates (r,)."
-        (r,) = rv
+        (r,) = np.transpose(rv)
         return np.array([(1 - r), (1 + r)]) * 0.5
 
     def gradient(self, rv):
         "Return the gradient of shape functions at given coordinates (r,)."
-        (r,) = rv
-        return np.array([[-1], [1]]) * 0.5
+        (r,) = np.transpose(rv)
+        one = np.ones_like(r, dtype=float)
+        return np.array([[-one], [one]]) * 0.5
@@ -51,6 +51,8 @@ class ConstantQuad(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(1, 2))
         self.points = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]], dtype=float)
@@ -59,11 +61,11 @@ class ConstantQuad(Element):
 
     def function(self, rs):
         "Return the shape functions at given coordinates (r, s)."
-        return np.array([1])
+        return np.ones((1, *np.shape(rs)[:-1]))
 
     def gradient(self, rs):
         "Return the gradient of shape functions at given coordinates (r, s)."
-        return np.array([[0, 0]])
+        return np.zeros((1, 2, *np.shape(rs)[:-1]))
 
 
 class Quad(Element):
@@ -101,6 +103,8 @@ class Quad(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(4, 2))
         self.points = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]], dtype=float)
@@ -109,7 +113,7 @@ class Quad(Element):
 
     def function(self, rs):
         "Return the shape functions at given coordinates (r, s)."
-        r, s = rs
+        r, s = np.transpose(rs)
         return (
             np.array(
                 [
@@ -125,7 +129,7 @@ class Quad(Element):
     def gradient(self, rs):
         "Return the gradient of shape functions at given coordinates (r, s)."
 
-        r, s = rs
+        r, s = np.transpose(rs)
         return (
             np.array(
                 [
@@ -167,6 +171,8 @@ class QuadraticQuad(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(8, 2))
         self.points = np.array(
@@ -187,37 +193,43 @@ class QuadraticQuad(Element):
 
     def function(self, rs):
         "Return the shape functions at given coordinates (r, s)."
-        r, s = rs
-        ra, sa = self.points.T
+        r, s = np.transpose(rs)
+        ra, sa = self._points(r)
+        mr, ms = self.points.T == 0
 
         h = (1 + ra * r) * (1 + sa * s) * (ra * r + sa * s - 1) / 4
-        h[ra == 0] = (1 - r**2) * (1 + sa[ra == 0] * s) / 2
-        h[sa == 0] = (1 + ra[sa == 0] * r) * (1 - s**2) / 2
+        h[mr] = (1 - r**2) * (1 + sa[mr] * s) / 2
+        h[ms] = (1 + ra[ms] * r) * (1 - s**2) / 2
 
         return h
 
     def gradient(self, rs):
         "Return the gradient of shape functions at given coordinates (r, s)."
 
-        r, s = rs
-        ra, sa = self.points.T
+        r, s = np.transpose(rs)
+        ra, sa = self._points(r)
+        mr, ms = self.points.T == 0
 
         dhdr = (
             ra * (1 + sa * s) * (ra * r + sa * s - 1) / 4
             + (1 + ra * r) * (1 + sa * s) * ra / 4
         )
 
-        dhdr[ra == 0] = -2 * r * (1 + sa[ra == 0] * s) / 2
-        dhdr[sa == 0] = ra[sa == 0] * (1 - s**2) / 2
+        dhdr[mr] = -2 * r * (1 + sa[mr] * s) / 2
+        dhdr[ms] = ra[ms] * (1 - s**2) / 2
 
         dhds = (1 + ra * r) * sa * (ra * r + sa * s - 1) / 4 + (1 + ra * r) * (
             1 + sa * s
         ) * sa / 4
 
-        dhds[ra == 0] = (1 - r**2) * sa[ra == 0] / 2
-        dhds[sa == 0] = (1 + ra[sa == 0] * r) * -2 * s / 2
+        dhds[mr] = (1 - r**2) * sa[mr] / 2
+        dhds[ms] = (1 + ra[ms] * r) * -2 * s / 2
 
-        return np.vstack([dhdr, dhds]).T
+        return np.stack([dhdr, dhds], axis=1)
+
+    def _points(self, r):
+        "Return the point coordinates, broadcastable to a (batch of) coordinate(s) r."
+        return self.points.T.reshape(2, -1, *np.ones(np.ndim(r), dtype=int))
 
 
 class BiQuadraticQuad(Element):
@@ -246,6 +258,8 @@ class BiQuadraticQuad(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(9, 2))
 
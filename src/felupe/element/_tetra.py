@@ -56,6 +56,8 @@ class Tetra(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(4, 3))
         self.points = np.array(
@@ -66,13 +68,21 @@ class Tetra(Element):
 
     def function(self, rst):
         "Return the shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
+        r, s, t = np.transpose(rst)
         return np.array([1 - r - s - t, r, s, t])
 
     def gradient(self, rst):
         "Return the gradient of shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
-        return np.array([[-1, -1, -1], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=float)
+        r, s, t = np.transpose(rst)
+        one, zero = np.ones_like(r, dtype=float), np.zeros_like(r, dtype=float)
+        return np.array(
+            [
+                [-one, -one, -one],
+                [one, zero, zero],
+                [zero, one, zero],
+                [zero, zero, one],
+            ]
+        )
 
 
 class TetraMINI(Element):
@@ -112,6 +122,8 @@ class TetraMINI(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self, bubble_multiplier=1.0):
         super().__init__(shape=(5, 3))
         self.points = np.array(
@@ -124,27 +136,27 @@ class TetraMINI(Element):
 
     def function(self, rst):
         "Return the shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
+        r, s, t = np.transpose(rst)
         a = self.bubble_multiplier
         return np.array([1 - r - s - t, r, s, t, a * r * s * t * (1 - r - s - t)])
 
     def gradient(self, rst):
         "Return the gradient of shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
+        r, s, t = np.transpose(rst)
         a = self.bubble_multiplier
+        one, zero = np.ones_like(r, dtype=float), np.zeros_like(r, dtype=float)
         return np.array(
             [
-                [-1, -1, -1],
-                [1, 0, 0],
-                [0, 1, 0],
-                [0, 0, 1],
+                [-one, -one, -one],
+                [one, zero, zero],
+                [zero, one, zero],
+                [zero, zero, one],
                 [
                     a * (s * t * (1 - r - s - t) - r * s * t),
                     a * (r * t * (1 - r - s - t) - r * s * t),
                     a * (r * s * (1 - r - s - t) - r * s * t),
                 ],
-            ],
-            dtype=float,
+            ]
         )
 
 
@@ -205,6 +217,8 @@ class QuadraticTetra(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(10, 3))
         self.points = np.zeros(self.shape)
@@ -223,7 +237,7 @@ class QuadraticTetra(Element):
 
     def function(self, rst):
         "Return the shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
+        r, s, t = np.transpose(rst)
 
         t1 = 1 - r - s - t
         t2 = r
@@ -249,28 +263,29 @@ class QuadraticTetra(Element):
 
     def gradient(self, rst):
         "Return the gradient of shape functions at given coordinates (r, s, t)."
-        r, s, t = rst
+        r, s, t = np.transpose(rst)
 
         t1 = 1 - r - s - t
         t2 = r
         t3 = s
         t4 = t
+        zero = np.zeros_like(r, dtype=float)
 
         dhdt = np.array(
             [
-                [4 * t1 - 1, 0, 0, 0],
-                [0, 4 * t2 - 1, 0, 0],
-                [0, 0, 4 * t3 - 1, 0],
-                [0, 0, 0, 4 * t4 - 1],
-                [4 * t2, 4 * t1, 0, 0],
-                [0, 4 * t3, 4 * t2, 0],
-                [4 * t3, 0, 4 * t1, 0],
-                [4 * t4, 0, 0, 4 * t1],
-                [0, 4 * t4, 0, 4 * t2],
-                [0, 0, 4 * t4, 4 * t3],
+                [4 * t1 - 1, zero, zero, zero],
+                [zero, 4 * t2 - 1, zero, zero],
+                [zero, zero, 4 * t3 - 1, zero],
+                [zero, zero, zero, 4 * t4 - 1],
+                [4 * t2, 4 * t1, zero, zero],
+                [zero, 4 * t3, 4 * t2, zero],
+                [4 * t3, zero, 4 * t1, zero],
+                [4 * t4, zero, zero, 4 * t1],
+                [zero, 4 * t4, zero, 4 * t2],
+                [zero, zero, 4 * t4, 4 * t3],
             ]
         )
 
         dtdr = np.array([[-1, -1, -1], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=float)
 
-        return np.dot(dhdt, dtdr)
+        return np.einsum("ak...,kJ->aJ...", dhdt, dtdr)
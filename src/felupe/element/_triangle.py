@@ -57,6 +57,8 @@ class Triangle(Element):
        2014.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(3, 2))
         self.points = np.array([[0, 0], [1, 0], [0, 1]], dtype=float)
@@ -65,13 +67,14 @@ class Triangle(Element):
 
     def function(self, rs):
         "Return the shape functions at given coordinates (r, s)."
-        r, s = rs
+        r, s = np.transpose(rs)
         return np.array([1 - r - s, r, s])
 
     def gradient(self, rs):
         "Return the gradient of shape functions at given coordinates (r, s)."
-        r, s = rs
-        return np.array([[-1, -1], [1, 0], [0, 1]], dtype=float)
+        r, s = np.transpose(rs)
+        one, zero = np.ones_like(r, dtype=float), np.zeros_like(r, dtype=float)
+        return np.array([[-one, -one], [one, zero], [zero, one]])
 
 
 class TriangleMINI(Element):
@@ -109,6 +112,8 @@ class TriangleMINI(Element):
        Toolkit, 4th ed. Kitware, 2006. ISBN: 978-1-930934-19-1.
     """
 
+    batched = True
+
     def __init__(self, bubble_multiplier=1.0):
         super().__init__(shape=(4, 2))
         self.points = np.array([[0, 0], [1, 0], [0, 1], [1 / 3, 1 / 3]], dtype=float)
@@ -118,22 +123,22 @@ class TriangleMINI(Element):
 
     def function(self, rs):
         "Return the shape functions at given coordinates (r, s)."
-        r, s = rs
+        r, s = np.transpose(rs)
         a = self.bubble_multiplier
         return np.array([1 - r - s, r, s, a * r * s * (1 - r - s)])
 
     def gradient(self, rs):
         "Return the gradient of shape functions at given coordinates (r, s)."
-        r, s = rs
+        r, s = np.transpose(rs)
         a = self.bubble_multiplier
+        one, zero = np.ones_like(r, dtype=float), np.zeros_like(r, dtype=float)
         return np.array(
             [
-                [-1, -1],
-                [1, 0],
-                [0, 1],
+                [-one, -one],
+                [one, zero],
+                [zero, one],
                 [a * (s * (1 - r - s) - r * s), a * (r * (1 - r - s) - r * s)],
-            ],
-            dtype=float,
+            ]
         )
 
 
@@ -180,6 +185,8 @@ class QuadraticTriangle(Element):
        2014.
     """
 
+    batched = True
+
     def __init__(self):
         super().__init__(shape=(6, 2))
         self.points = np.zeros(self.shape)
@@ -193,7 +200,7 @@ class QuadraticTriangle(Element):
 
     def function(self, rs):
         "Return the shape functions at given coordinates (r, s)."
-        r, s = rs
+        r, s = np.transpose(rs)
         h = np.array(
             [1 - r - s, r, s, 4 * r * (1 - r - s), 4 * r * s, 4 * s * (1 - r - s)]
         )
@@ -205,13 +212,14 @@ class QuadraticTriangle(Element):
 
     def gradient(self, rs):
         "Return the gradient of shape functions at given coordinates (r, s)."
-        r, s = rs
+        r, s = np.transpose(rs)
 
         t1 = 1 - r - s
         t2 = r
         t3 = s
 
-        dhdr_a = np.array([[-1, -1], [1, 0], [0, 1]], dtype=float)
+        one, zero = np.ones_like(r, dtype=float), np.zeros_like(r, dtype=float)
+        dhdr_a = np.array([[-one, -one], [one, zero], [zero, one]])
         dhdr_b = np.array(
             [
                 [4 * (t1 - t2), -4 * t2],
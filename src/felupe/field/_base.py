@@ -20,12 +20,49 @@ from copy import deepcopy
 
 import numpy as np
 
-from ..math import identity
+from ..math import identity, inv
 from ..math import sym as symmetric
+from ..region._region import _shape_functions
 from ._container import FieldContainer
 from ._indices import Indices
 
 
+def _contract(values, cells, basis, out=None, blocksize=16384):
+    """Contract the point values of a field with the basis functions of shape
+    ``(a, ..., c)`` of the cells, evaluated in blocks of cells. The point values are
+    gathered for one block of cells at a time to a buffer of shape ``(i, a, c)``
+    instead of a copy of the point values of all cells."""
+
+    ncells, points_per_cell = cells.shape
+    shape = (*values.shape[1:], *basis.shape[1:-1], ncells)
+    values = values.reshape(len(values), -1).T
+
+    if out is None:
+        out = np.empty(shape, dtype=np.result_type(values, basis))
+
+    result = out
+    out = out.reshape(len(values), *basis.shape[1:-1], ncells)
+
+    cells = cells.T
+    buffer = np.empty(
+        (len(values), points_per_cell, min(blocksize, ncells)), dtype=values.dtype
+    )
+
+    for start in range(0, ncells, blocksize):
+        stop = min(start + blocksize, ncells)
+        block = buffer[..., : stop - start]
+
+        np.take(values, cells[:, start:stop], axis=1, out=block)
+        np.einsum(
+            "iac,a...c->i...c",
+            block,
+            basis[..., start:stop],
+            out=out[..., start:stop],
+        )
+
+    return result
+
+
 class Field:
     r"""A Field on points of a :class:`~felupe.Region` with dimension ``dim`` and
     initial point ``values``.
@@ -155,12 +192,7 @@ class Field:
         # gradient dudX_IJqc as partial derivative of field values at points "aI"
         # w.r.t. undeformed coordinates "J" evaluated at quadrature point "q"
         # for each cell "c"
-        g = np.einsum(
-            "ca...,aJqc->...Jqc",
-            self.values[self.region.mesh.cells],
-            self.region.dhdX,
-            out=out,
-        )
+        g = _contract(self.values, self.region.mesh.cells, self.region.dhdX, out=out)
 
         if sym:
             return symmetric(g)
@@ -192,12 +224,81 @@ class Field:
         # interpolated field values "aI"
         # evaluated at quadrature point "q"
         # for cell "c"
-        return np.einsum(
-            "ca...,aqc->...qc",
-            self.values[self.region.mesh.cells],
-            self.region.h,
-            out=None,
-        )
+        return _contract(self.values, self.region.mesh.cells, self.region.h, out=out)
+
+    def probe(self, points, grad=False, location=None):
+        r"""Interpolate the field values (or the gradient) at given points.
+
+        ..  math::
+
+            u_{i}(\boldsymbol{x}) = \hat{u}_{ai}\ h_{a}(\boldsymbol{r}(\boldsymbol{x}))
+
+        Arguments
+        ---------
+        points : ndarray
+            The coordinates of the points of shape ``(npoints, dim)``.
+        grad : bool, optional
+            Flag for the evaluation of the gradient w.r.t. the undeformed coordinates
+            instead of the field values (default is False).
+        location : tuple of ndarray or None, optional
+            The pre-evaluated cells and natural element coordinates of the points, see
+            :meth:`Region.locate() <felupe.Region.locate>`. If None, the points are
+            located in the region (default is None).
+
+        Returns
+        -------
+        ndarray of shape (i, p) or (i, J, p)
+            The interpolated field value components ``i`` (or the gradient w.r.t. the
+            undeformed coordinates ``J``) at the points ``p``. Values of points which
+            are located outside of the region are ``nan``.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import felupe as fem
+        >>>
+        >>> mesh = fem.Cube(n=5)
+        >>> region = fem.RegionHexahedron(mesh)
+        >>> field = fem.Field(region, dim=3, values=mesh.points**2)
+        >>>
+        >>> x = np.linspace([0, 0, 0], [1, 1, 1], num=3)
+        >>> field.probe(x)
+        array([[0.  , 0.25, 1.  ],
+               [0.  , 0.25, 1.  ],
+               [0.  , 0.25, 1.  ]])
+
+        See Also
+        --------
+        felupe.Region.locate : Locate the cells and the natural element coordinates of
+            given points.
+        """
+
+        if location is None:
+            location = self.region.locate(points)
+
+        cells, coords = location
+        found = cells >= 0
+
+        mesh = self.region.mesh
+        cells_found = mesh.cells[cells[found]]
+        values = self.values[cells_found]
+
+        h, dhdr = _shape_functions(self.region.element, coords[found])
+
+        if grad:
+            # partial derivative of the element shape functions w.r.t. the undeformed
+            # coordinates at the points
+            dXdr = np.einsum("naI,aJn->IJn", mesh.points[cells_found], dhdr)
+            dhdX = np.einsum("aIn,IJn->aJn", dhdr, inv(dXdr))
+            result = np.einsum("na...,aJn->...Jn", values, dhdX)
+
+        else:
+            result = np.einsum("na...,an->...n", values, h)
+
+        out = np.full((*result.shape[:-1], len(cells)), np.nan)
+        out[..., found] = result
+
+        return out
 
     def extract(self, grad=True, sym=False, add_identity=True, out=None):
         """Generalized extraction method which evaluates either the gradient or the
@@ -20,8 +20,6 @@ from copy import deepcopy
 
 import numpy as np
 
-from ..tools._plot import ViewField
-
 
 class FieldContainer:
     """A container for fields which holds a list or a tuple of :class:`Field`
@@ -143,6 +141,45 @@ class FieldContainer:
             for g, f, res in zip(grads, self.fields, out)
         )
 
+    def probe(self, points, grad=False):
+        """Interpolate the field values (or the gradients) of all fields at given
+        points. The points are located only once per region.
+
+        Arguments
+        ---------
+        points : ndarray
+            The coordinates of the points of shape ``(npoints, dim)``.
+        grad : bool or list of bool, optional
+            Flag(s) for the evaluation of the gradient(s) instead of the field values.
+            A boolean value is applied on all fields (default is False).
+
+        Returns
+        -------
+        tuple of ndarray
+            The interpolated field values (or the gradients) at the points.
+
+        See Also
+        --------
+        felupe.Field.probe : Interpolate the field values (or the gradient) at given
+            points.
+        """
+
+        if isinstance(grad, bool):
+            grad = [grad] * len(self.fields)
+
+        locations = {}
+        results = []
+
+        for g, field in zip(grad, self.fields):
+            region = field.region
+
+            if id(region) not in locations:
+                locations[id(region)] = region.locate(points)
+
+            results.append(field.probe(points, grad=g, location=locations[id(region)]))
+
+        return tuple(results)
+
     def values(self):
         "Return the field values."
         return tuple(f.values for f in self.fields)
@@ -184,6 +221,8 @@ class FieldContainer:
         felupe.topoints: Shift given values at quadrature-points to mesh-points.
         """
 
+        from ..tools._plot import ViewField
+
         return ViewField(
             self,
             point_data=point_data,
@@ -19,7 +19,7 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 import numpy as np
 
 from ..math import sym as symmetric
-from ._base import Field
+from ._base import Field, _contract
 
 
 class FieldPlaneStrain(Field):
@@ -72,12 +72,7 @@ class FieldPlaneStrain(Field):
         # interpolated field values "aI"
         # evaluated at quadrature point "q"
         # for cell "c"
-        return np.einsum(
-            "ca...,aqc->...qc",
-            self.values[self.region.mesh.cells],
-            self.region.h,
-            out=out,
-        )
+        return _contract(self.values, self.region.mesh.cells, self.region.h, out=out)
 
     def interpolate(self, out=None):
         # out-argument is not supported
@@ -113,12 +108,7 @@ class FieldPlaneStrain(Field):
         # gradient as partial derivative of field component "I" at point "a"
         # w.r.t. undeformed coordinate "J" evaluated at quadrature point "q"
         # for each cell "c"
-        g = np.einsum(
-            "ca...,aJqc->...Jqc",
-            self.values[self.region.mesh.cells],
-            self.region.dhdX,
-            out=out,
-        )
+        g = _contract(self.values, self.region.mesh.cells, self.region.dhdX, out=out)
 
         if sym:
             return symmetric(g, out=g)
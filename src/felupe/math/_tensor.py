@@ -16,12 +16,26 @@ You should have received a copy of the GNU General Public License
 along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
-try:
-    from einsumt import einsumt
-except ModuleNotFoundError:
-    from numpy import einsum as einsumt
+
+@lru_cache(maxsize=1)
+def _einsumt():
+    "Import the multi-threaded einsum on first use or fall back to NumPy's einsum."
+    try:
+        from einsumt import einsumt
+    except ModuleNotFoundError:
+        from numpy import einsum as einsumt
+
+    return einsumt
+
+
+def einsumt(*operands, **kwargs):
+    """Evaluate the Einstein summation convention on the operands, multi-threaded by
+    the optional dependency einsumt (if installed)."""
+    return _einsumt()(*operands, **kwargs)
 
 
 def identity(A=None, dim=None, shape=None):
@@ -5,19 +5,27 @@ from ._job import Job
 from ._multipoint import MultiPointConstraint, MultiPointContact
 from ._pointload import PointLoad
 from ._solidbody import SolidBody
+from ._solidbody_decomposed import SolidBodyDecomposed
 from ._solidbody_gravity import SolidBodyGravity
 from ._solidbody_incompressible import SolidBodyNearlyIncompressible
+from ._solidbody_inertia import SolidBodyInertia
 from ._solidbody_pressure import SolidBodyPressure
 from ._step import Step
+from ._step_arclength import ArcLengthStep
+from ._step_explicit import ExplicitStep
 
 __all__ = [
+    "ArcLengthStep",
     "CharacteristicCurve",
+    "ExplicitStep",
     "FormItem",
     "StateNearlyIncompressible",
     "Job",
     "PointLoad",
     "SolidBody",
+    "SolidBodyDecomposed",
     "SolidBodyGravity",
+    "SolidBodyInertia",
     "SolidBodyNearlyIncompressible",
     "SolidBodyPressure",
     "Step",
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
+
+from ..field import FieldAxisymmetric
+
+
+class HourglassControl:
+    r"""A stiffness-based hourglass control of quad and hexahedron cells with
+    reduced (one-point) integration.
+
+    Parameters
+    ----------
+    field : FieldContainer
+        A field container, where the first field is the displacement field on a region
+        with a quad or a hexahedron element.
+    elasticity : ndarray
+        The fourth-order elasticity tensor (the hessian of the strain energy density
+        function w.r.t. the deformation gradient) at the quadrature points of the
+        cells. The effective shear modulus of the hourglass control is taken from its
+        shear components.
+    kappa : float, optional
+        The dimensionless stiffness coefficient of the hourglass control (default is
+        1.0).
+
+    Notes
+    -----
+    The hourglass base vectors :math:`\boldsymbol{h}_\alpha` of the element are the
+    products of the natural coordinates :math:`\xi \eta` (quad) or :math:`\xi\eta`,
+    :math:`\eta\zeta`, :math:`\zeta\xi` and :math:`\xi\eta\zeta` (hexahedron) at the
+    points of the element. The hourglass shape vectors of Flanagan and Belytschko
+    [1]_ are orthogonal to all linear displacement fields of a cell, see Eq.
+    :eq:`hourglass-gamma`
+
+    ..  math::
+        :label: hourglass-gamma
+
+        \gamma_{a\alpha} = \frac{1}{n} \left(
+            h_{a\alpha} - b_{aj} \sum_b X_{bj}\ h_{b\alpha}
+        \right)
+
+    where :math:`n` is the number of points per cell, :math:`\boldsymbol{X}` are the
+    undeformed coordinates of the points and :math:`b_{aj}` is the uniform (volume-
+    averaged) gradient of the shape functions. Hence, the hourglass control does not
+    affect rigid body motions and homogeneous deformations. The hourglass stiffness
+    matrix of a cell is given in Eq. :eq:`hourglass-stiffness`
+
+    ..  math::
+        :label: hourglass-stiffness
+
+        K_{aibj} = \kappa\ 2 \mu\ V\ b_{ck} b_{ck}
+            \sum_\alpha \gamma_{a\alpha} \gamma_{b\alpha}\ \delta_{ij}
+
+    with the effective shear modulus :math:`\mu` of the material and the undeformed
+    volume :math:`V` of the cell. With :math:`\kappa=1`, the hourglass stiffness
+    approximates the (direction-averaged) stiffness of the hourglass modes of a fully
+    integrated cube without the volumetric part of the material behaviour. Hence, the
+    hourglass control does not lock for (nearly) incompressible materials. The
+    stiffness matrix is evaluated once for the undeformed configuration and the
+    hourglass forces are linear in the displacements.
+
+    References
+    ----------
+    ..  [1] D. P. Flanagan and T. Belytschko, "A uniform strain hexahedron and
+        quadrilateral with orthogonal hourglass control", International Journal for
+        Numerical Methods in Engineering, vol. 17, no. 5. Wiley, pp. 679–706, May 1981.
+        doi: 10.1002/nme.1620170504.
+    """
+
+    def __init__(self, field, elasticity, kappa=1.0):
+        region = field.region
+        element = region.element
+        r = element.points
+        dim = field[0].dim
+
+        if isinstance(field[0], FieldAxisymmetric):
+            raise NotImplementedError(
+                "Hourglass control is not implemented for axisymmetric fields."
+            )
+
+        if r.shape == (4, 2):
+            h = np.stack([r[:, 0] * r[:, 1]], axis=1)
+        elif r.shape == (8, 3):
+            h = np.stack(
+                [
+                    r[:, 0] * r[:, 1],
+                    r[:, 1] * r[:, 2],
+                    r[:, 2] * r[:, 0],
+                    r[:, 0] * r[:, 1] * r[:, 2],
+                ],
+                axis=1,
+            )
+        else:
+            raise NotImplementedError(
+                "Hourglass control is only implemented for quad and hexahedron cells."
+            )
+
+        cells = region.mesh.cells
+        ncells, npoints = cells.shape
+        X = region.mesh.points[cells]
+
+        # undeformed volumes and uniform gradients of the shape functions
+        V = region.dV.sum(axis=0)
+        b = np.einsum("ajqc,qc->caj", region.dhdX, region.dV) / V.reshape(-1, 1, 1)
+
+        # hourglass shape vectors "cam" of the modes "m"
+        gamma = (h - np.einsum("caj,cbj,bm->cam", b, X, h)) / npoints
+
+        # effective shear modulus of the cells
+        i, j = np.triu_indices(dim, k=1)
+        shear = (elasticity[i, j, i, j] + elasticity[j, i, j, i]) / 2
+        mu = np.broadcast_to(shear.mean(axis=(0, 1)), (ncells,))
+
+        coefficient = kappa * 2 * mu * V * (b**2).sum(axis=(1, 2))
+        stiffness = np.einsum("c,cam,cbm->cab", coefficient, gamma, gamma)
+
+        # assemble the stiffness matrix of the displacement field (first field)
+        dof = cells.reshape(ncells, npoints, 1) * dim + np.arange(dim)
+        shape = (ncells, npoints, dim, npoints)
+        rows = np.broadcast_to(dof.reshape(ncells, npoints, dim, 1), shape)
+        cols = np.broadcast_to(
+            dof.transpose(0, 2, 1).reshape(ncells, 1, dim, npoints), shape
+        )
+        values = np.broadcast_to(stiffness.reshape(ncells, npoints, 1, npoints), shape)
+
+        size = sum(field.fieldsizes)
+        self.stiffness = coo_matrix(
+            (values.ravel(), (rows.ravel(), cols.ravel())), shape=(size, size)
+        ).tocsr()
+        self.gamma = gamma
+
+    def vector(self, field):
+        "Return the assembled hourglass forces for the given field container."
+
+        u = np.zeros(self.stiffness.shape[1])
+        u[: field[0].values.size] = field[0].values.ravel()
+
+        return csr_matrix((self.stiffness @ u).reshape(-1, 1))
+
+    def matrix(self):
+        "Return the assembled hourglass stiffness matrix."
+
+        return self.stiffness
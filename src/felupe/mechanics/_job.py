@@ -16,11 +16,14 @@ You should have received a copy of the GNU General Public License
 along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 import os
+import tracemalloc
+from time import perf_counter
 
 from ..math import deformation_gradient as defgrad
 from ..math import displacement as disp
 from ..math import strain
 from ..tools._misc import logo, runs_on
+from ..tools._timer import Timer
 
 
 def displacement(field, substep=None):
@@ -81,6 +84,9 @@ class Job:
     fnorms : list of list of float
         List with norms of the objective function for each completed substep of each
         step. See also class:`~felupe.tools.NewtonResult`.
+    profiles : list of dict
+        A list with a profile for each completed substep of each step, see
+        :meth:`~felupe.Job.evaluate`. Only recorded if ``profile=True``.
     kwargs : dict
         Optional keyword-arguments for the ``callback`` function.
 
@@ -128,6 +134,7 @@ class Job:
         self.callback = callback
         self.timetrack = []
         self.fnorms = []
+        self.profiles = []
         self.kwargs = kwargs
 
     def _write(self, writer, time, substep, point_data, cell_data):
@@ -139,6 +146,40 @@ class Job:
             cell_data={key: value(**kwargs) for key, value in cell_data.items()},
         )
 
+    def _reset_profile(self, step, timer):
+        "Reset the timers of Newton's method and the items and the peak memory."
+
+        timer.reset()
+
+        for item in step.items:
+            if hasattr(item, "timer"):
+                item.timer.reset()
+
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+        return perf_counter()
+
+    def _profile(self, stepnumber, substepnumber, step, substep, timer, start):
+        "Return a dict with the profile of a completed substep."
+
+        items = []
+        for item in step.items:
+            profile = {"type": type(item).__name__}
+            if hasattr(item, "timer"):
+                profile["timer"] = item.timer.report()
+            items.append(profile)
+
+        return {
+            "step": stepnumber,
+            "substep": substepnumber,
+            "iterations": substep.iterations,
+            "time": perf_counter() - start,
+            "memory": tracemalloc.get_traced_memory()[1],
+            "newtonrhapson": timer.report(),
+            "items": items,
+        }
+
     def evaluate(
         self,
         filename=None,
@@ -149,6 +190,7 @@ class Job:
         cell_data_default=True,
         verbose=True,
         parallel=False,
+        profile=False,
         **kwargs,
     ):
         """Evaluate the steps.
@@ -186,11 +228,22 @@ class Job:
             Flag to use a threaded version of :func:`numpy.einsum` during assembly.
             Requires ``einsumt``. This may add additional overhead to small-sized
             problems. Default is False.
+        profile : bool, optional
+            Flag to record a profile for each completed substep in the list
+            ``job.profiles``. A profile is a dict with the keys ``"step"``,
+            ``"substep"``, ``"iterations"``, the runtime ``"time"`` in seconds, the
+            peak memory ``"memory"`` in bytes traced by :mod:`tracemalloc`, the
+            reported runtimes and counts of Newton's method ``"newtonrhapson"`` and a
+            list of ``"items"`` with the types and the reports of the timers of the
+            items, see :class:`~felupe.tools.Timer`. The memory tracing slows down the
+            evaluation. Default is False.
         **kwargs : dict
             Optional keyword arguments for :meth:`~felupe.Step.generate`. If
             ``parallel=True``, it is added as ``kwargs["parallel"] = True`` to the dict
             of additional keyword arguments. If ``x0`` is present in ``kwargs.keys()``,
-            it is used as the mesh for the XDMF time series writer.
+            it is used as the mesh for the XDMF time series writer. The iteration
+            method of :func:`~felupe.newtonrhapson` is selected by ``method``, e.g.
+            ``method="modified-newton"``, which re-uses the Jacobian across substeps.
 
         Returns
         -------
@@ -234,6 +287,9 @@ class Job:
 
         time = 0
 
+        if profile:
+            timer = kwargs["timer"] = Timer()
+
         if filename is not None:
             from meshio.xdmf import TimeSeriesWriter
 
@@ -270,52 +326,75 @@ class Job:
 
             TimeSeriesWriter = nullcontext
 
-        with TimeSeriesWriter(filename) as writer:
-            if filename is not None:
-                writer.write_points_cells(mesh.points, mesh.cells)
+        if profile:
+            tracing = tracemalloc.is_tracing()
+
+            if not tracing:
+                tracemalloc.start()
 
-            if verbose == 1:
-                total = sum([step.nsubsteps for step in self.steps])
-                progress_bar = tqdm(total=total, unit="substep")
+        try:
+            with TimeSeriesWriter(filename) as writer:
+                if filename is not None:
+                    writer.write_points_cells(mesh.points, mesh.cells)
 
-            for j, step in enumerate(self.steps):
-                newton_verbose = False
-                if verbose == 2:
-                    print(f"Begin Evaluation of Step {j + 1}.")
-                    newton_verbose = True
+                if verbose == 1:
+                    total = sum([step.nsubsteps for step in self.steps])
+                    progress_bar = tqdm(total=total, unit="substep")
 
-                substeps = step.generate(verbose=newton_verbose, **kwargs)
-                for i, substep in enumerate(substeps):
-                    self.fnorms.append(substep.fnorms)
+                for j, step in enumerate(self.steps):
+                    newton_verbose = False
                     if verbose == 2:
-                        _substep = f"Substep {i + 1}/{step.nsubsteps}"
-                        _step = f"Step {j + 1}/{self.nsteps}"
+                        print(f"Begin Evaluation of Step {j + 1}.")
+                        newton_verbose = True
+
+                    if profile:
+                        start = self._reset_profile(step, timer)
+
+                    substeps = step.generate(verbose=newton_verbose, **kwargs)
+                    for i, substep in enumerate(substeps):
+                        if profile:
+                            self.profiles.append(
+                                self._profile(j, i, step, substep, timer, start)
+                            )
+
+                        self.fnorms.append(substep.fnorms)
+                        if verbose == 2:
+                            _substep = f"Substep {i + 1}/{step.nsubsteps}"
+                            _step = f"Step {j + 1}/{self.nsteps}"
+
+                            print(f"{_substep} of {_step} successful.")
+
+                        self.callback(j, i, substep, **self.kwargs)
 
-                        print(f"{_substep} of {_step} successful.")
+                        # update x0 after each completed substep
+                        if "x0" in kwargs.keys():
+                            kwargs["x0"].link(substep.x)
 
-                    self.callback(j, i, substep, **self.kwargs)
+                        self.timetrack.append(time)
 
-                    # update x0 after each completed substep
-                    if "x0" in kwargs.keys():
-                        kwargs["x0"].link(substep.x)
+                        if filename is not None:
+                            self._write(
+                                writer=writer,
+                                time=time,
+                                substep=substep,
+                                point_data={**pdata, **point_data},
+                                cell_data={**cdata, **cell_data},
+                            )
 
-                    self.timetrack.append(time)
+                        time += 1
 
-                    if filename is not None:
-                        self._write(
-                            writer=writer,
-                            time=time,
-                            substep=substep,
-                            point_data={**pdata, **point_data},
-                            cell_data={**cdata, **cell_data},
-                        )
+                        if verbose == 1:
+                            progress_bar.update(1)
 
-                    time += 1
+                        if profile:
+                            start = self._reset_profile(step, timer)
 
-                    if verbose == 1:
-                        progress_bar.update(1)
+                if verbose == 1:
+                    progress_bar.close()
 
-            if verbose == 1:
-                progress_bar.close()
+        finally:
+            # stop tracing also if a substep raises an error
+            if profile and not tracing:
+                tracemalloc.stop()
 
         return self
@@ -19,6 +19,7 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 import numpy as np
 from scipy.sparse import eye, lil_matrix
 
+from ..tools._timer import Timer
 from ._helpers import Assemble, Results
 
 
@@ -35,6 +36,7 @@ class MultiPointConstraint:
         self.axes = np.arange(self.mesh.dim)[self.mask]
         self.multiplier = multiplier
 
+        self.timer = Timer()
         self.results = Results(stress=False, elasticity=False)
         self.assemble = Assemble(vector=self._vector, matrix=self._matrix)
 
@@ -57,39 +59,45 @@ class MultiPointConstraint:
     def _vector(self, field=None, parallel=False):
         "Calculate vector of residuals with RBE2 contributions."
 
-        if field is not None:
-            self.field = field
+        with self.timer("vector"):
+            if field is not None:
+                self.field = field
 
-        u = self.field.fields[0].values
-        N = self.multiplier * (-u[self.points] + u[self.centerpoint])
-        N[:, ~self.mask] = 0
+            u = self.field.fields[0].values
+            N = self.multiplier * (-u[self.points] + u[self.centerpoint])
+            N[:, ~self.mask] = 0
 
-        r = lil_matrix(u.shape)
-        r[self.points] = -N
-        r[self.centerpoint] = N.sum(axis=0)
+            r = lil_matrix(u.shape)
+            r[self.points] = -N
+            r[self.centerpoint] = N.sum(axis=0)
+
+            self.results.force = r.reshape(-1, 1).tocsr()
 
-        self.results.force = r.reshape(-1, 1).tocsr()
         return self.results.force
 
     def _matrix(self, field=None, parallel=False):
         "Calculate stiffness with RBE2 contributions."
 
-        if field is not None:
-            self.field = field
+        with self.timer("matrix"):
+            if field is not None:
+                self.field = field
+
+            indices = np.arange(self.mesh.ndof).reshape(self.mesh.points.shape)
+            td = [indices[self.points.reshape(-1, 1), ax].ravel() for ax in self.axes]
+            cd = [indices[self.centerpoint, ax].ravel() for ax in self.axes]
 
-        indices = np.arange(self.mesh.ndof).reshape(self.mesh.points.shape)
-        td = [indices[self.points.reshape(-1, 1), ax].ravel() for ax in self.axes]
-        cd = [indices[self.centerpoint, ax].ravel() for ax in self.axes]
+            L = lil_matrix((self.mesh.ndof, self.mesh.ndof))
 
-        L = lil_matrix((self.mesh.ndof, self.mesh.ndof))
+            for t, c in zip(td, cd):
+                L[t.reshape(-1, 1), t] = eye(len(t)) * self.multiplier
+                L[t.reshape(-1, 1), c] = -self.multiplier
+                L[c.reshape(-1, 1), t] = -self.multiplier
+                L[c.reshape(-1, 1), c] = (
+                    eye(len(c)) * self.multiplier * len(self.points)
+                )
 
-        for t, c in zip(td, cd):
-            L[t.reshape(-1, 1), t] = eye(len(t)) * self.multiplier
-            L[t.reshape(-1, 1), c] = -self.multiplier
-            L[c.reshape(-1, 1), t] = -self.multiplier
-            L[c.reshape(-1, 1), c] = eye(len(c)) * self.multiplier * len(self.points)
+            self.results.stiffness = L.tocsr()
 
-        self.results.stiffness = L.tocsr()
         return self.results.stiffness
 
 
@@ -106,6 +114,7 @@ class MultiPointContact:
         self.axes = np.arange(self.mesh.dim)[self.mask]
         self.multiplier = multiplier
 
+        self.timer = Timer()
         self.results = Results(stress=False, elasticity=False)
         self.assemble = Assemble(vector=self._vector, matrix=self._matrix)
 
@@ -153,57 +162,63 @@ class MultiPointContact:
     def _vector(self, field=None, parallel=False):
         "Calculate vector of residuals with RBE2 contributions."
 
-        if field is not None:
-            self.field = field
+        with self.timer("vector"):
+            if field is not None:
+                self.field = field
 
-        u = self.field.fields[0].values
+            u = self.field.fields[0].values
 
-        Xc = self.mesh.points[self.centerpoint]
-        Xt = self.mesh.points[self.points]
+            Xc = self.mesh.points[self.centerpoint]
+            Xt = self.mesh.points[self.points]
 
-        xc = u[self.centerpoint] + Xc
-        xt = u[self.points] + Xt
+            xc = u[self.centerpoint] + Xc
+            xt = u[self.points] + Xt
 
-        mask = np.sign(-Xt + Xc) == np.sign(-xt + xc)
-        mask[:, ~self.mask] = True
-        n = -xt + xc
-        n[mask] = 0
+            mask = np.sign(-Xt + Xc) == np.sign(-xt + xc)
+            mask[:, ~self.mask] = True
+            n = -xt + xc
+            n[mask] = 0
 
-        r = lil_matrix(u.shape)
-        r[self.points] = -self.multiplier * n
-        r[self.centerpoint] = self.multiplier * n.sum(axis=0)
+            r = lil_matrix(u.shape)
+            r[self.points] = -self.multiplier * n
+            r[self.centerpoint] = self.multiplier * n.sum(axis=0)
+
+            self.results.force = r.reshape(-1, 1).tocsr()
 
-        self.results.force = r.reshape(-1, 1).tocsr()
         return self.results.force
 
     def _matrix(self, field=None, parallel=False):
         "Calculate stiffness with RBE2 contributions."
 
-        if field is not None:
-            self.field = field
+        with self.timer("matrix"):
+            if field is not None:
+                self.field = field
+
+            u = self.field.fields[0].values
 
-        u = self.field.fields[0].values
+            Xc = self.mesh.points[self.centerpoint]
+            Xt = self.mesh.points[self.points]
 
-        Xc = self.mesh.points[self.centerpoint]
-        Xt = self.mesh.points[self.points]
+            xc = u[self.centerpoint] + Xc
+            xt = u[self.points] + Xt
 
-        xc = u[self.centerpoint] + Xc
-        xt = u[self.points] + Xt
+            mask = np.sign(-Xt + Xc) != np.sign(-xt + xc)
+            masks = [mask[:, ax] for ax in self.axes]
 
-        mask = np.sign(-Xt + Xc) != np.sign(-xt + xc)
-        masks = [mask[:, ax] for ax in self.axes]
+            indices = np.arange(self.mesh.ndof).reshape(self.mesh.points.shape)
+            td = [indices[self.points.reshape(-1, 1), ax].ravel() for ax in self.axes]
+            cd = [indices[self.centerpoint, ax].ravel() for ax in self.axes]
 
-        indices = np.arange(self.mesh.ndof).reshape(self.mesh.points.shape)
-        td = [indices[self.points.reshape(-1, 1), ax].ravel() for ax in self.axes]
-        cd = [indices[self.centerpoint, ax].ravel() for ax in self.axes]
+            L = lil_matrix((self.mesh.ndof, self.mesh.ndof))
 
-        L = lil_matrix((self.mesh.ndof, self.mesh.ndof))
+            for t, c, m in zip(td, cd, masks):
+                L[t[m].reshape(-1, 1), t[m]] = eye(len(t[m])) * self.multiplier
+                L[t[m].reshape(-1, 1), c] = -self.multiplier
+                L[c.reshape(-1, 1), t[m]] = -self.multiplier
+                L[c.reshape(-1, 1), c] = (
+                    eye(len(c)) * self.multiplier * len(self.points[m])
+                )
 
-        for t, c, m in zip(td, cd, masks):
-            L[t[m].reshape(-1, 1), t[m]] = eye(len(t[m])) * self.multiplier
-            L[t[m].reshape(-1, 1), c] = -self.multiplier
-            L[c.reshape(-1, 1), t[m]] = -self.multiplier
-            L[c.reshape(-1, 1), c] = eye(len(c)) * self.multiplier * len(self.points[m])
+            self.results.stiffness = L.tocsr()
 
-        self.results.stiffness = L.tocsr()
         return self.results.stiffness
@@ -25,7 +25,9 @@ from ..assembly import IntegralForm
 from ..constitution import AreaChange
 from ..math import det, dot, transpose
 from ..tools._plot import ViewSolid
+from ..tools._timer import Timer
 from ._helpers import Assemble, Evaluate, Results
+from ._hourglass import HourglassControl
 
 
 class Solid:
@@ -132,6 +134,20 @@ class SolidBody(Solid):
         A field container with one or more fields.
     statevars : ndarray or None, optional
         Array of initial internal state variables (default is None).
+    hourglass : float or None, optional
+        The dimensionless stiffness coefficient of a stiffness-based hourglass control
+        (Flanagan-Belytschko) for quad and hexahedron cells with reduced (one-point)
+        integration, e.g. on a :class:`~felupe.RegionReducedHexahedron`. The effective
+        shear modulus is taken from the hessian of the material at the initial state.
+        If None, no hourglass control is applied (default is None).
+
+    Attributes
+    ----------
+    timer : felupe.tools.Timer
+        A timer with the accumulated runtimes of the extraction of the kinematics
+        (``"extract"``), the evaluation of the gradient (``"gradient"``) and the hessian
+        (``"hessian"``) of the constitutive material formulation as well as the
+        integration (``"integrate"``) and assembly (``"assemble"``) of the weak forms.
 
     Notes
     -----
@@ -207,10 +223,12 @@ class SolidBody(Solid):
         methods for the assembly of sparse vectors/matrices.
     """
 
-    def __init__(self, umat, field, statevars=None):
+    def __init__(self, umat, field, statevars=None, hourglass=None):
         self.umat = umat
         self.field = field
 
+        self.timer = Timer()
+
         self.results = Results(stress=True, elasticity=True)
         self.results.kinematics = self._extract(self.field)
 
@@ -228,6 +246,13 @@ class SolidBody(Solid):
                 )
             )
 
+        self._hourglass = None
+        if hourglass is not None:
+            elasticity = self.umat.hessian(
+                [*self.results.kinematics, self.results.statevars]
+            )
+            self._hourglass = HourglassControl(field, elasticity[0], kappa=hourglass)
+
         self.assemble = Assemble(vector=self._vector, matrix=self._matrix)
 
         self.evaluate = Evaluate(
@@ -249,11 +274,21 @@ class SolidBody(Solid):
             self.field = field
 
         self.results.stress = self._gradient(field, args=args, kwargs=kwargs)
-        self.results.force = self._form(
+
+        form = self._form(
             fun=self.results.stress[slice(items)],
             v=self.field,
             dV=self.field.region.dV,
-        ).assemble(parallel=parallel)
+        )
+
+        with self.timer("integrate"):
+            self.results.force_values = form.integrate(parallel=parallel)
+
+        with self.timer("assemble"):
+            self.results.force = form.assemble(values=self.results.force_values)
+
+            if self._hourglass is not None:
+                self.results.force += self._hourglass.vector(self.field)
 
         return self.results.force
 
@@ -273,17 +308,24 @@ class SolidBody(Solid):
             dV=self.field.region.dV,
         )
 
-        self.results.stiffness_values = form.integrate(
-            parallel=parallel, out=self.results.stiffness_values
-        )
+        with self.timer("integrate"):
+            self.results.stiffness_values = form.integrate(
+                parallel=parallel, out=self.results.stiffness_values
+            )
 
-        self.results.stiffness = form.assemble(values=self.results.stiffness_values)
+        with self.timer("assemble"):
+            self.results.stiffness = form.assemble(values=self.results.stiffness_values)
+
+            if self._hourglass is not None:
+                self.results.stiffness += self._hourglass.matrix()
 
         return self.results.stiffness
 
     def _extract(self, field):
         self.field = field
-        self.results.kinematics = self.field.extract(out=self.results.kinematics)
+
+        with self.timer("extract"):
+            self.results.kinematics = self.field.extract(out=self.results.kinematics)
 
         return self.results.kinematics
 
@@ -298,9 +340,10 @@ class SolidBody(Solid):
         if "out" in inspect.signature(self.umat.gradient).parameters:
             kwargs["out"] = self.results.gradient
 
-        gradient = self.umat.gradient(
-            [*self.results.kinematics, self.results.statevars], *args, **kwargs
-        )
+        with self.timer("gradient"):
+            gradient = self.umat.gradient(
+                [*self.results.kinematics, self.results.statevars], *args, **kwargs
+            )
         self.results.gradient = gradient[0]
 
         self.results.stress, self.results._statevars = gradient[:-1], gradient[-1]
@@ -318,9 +361,10 @@ class SolidBody(Solid):
         if "out" in inspect.signature(self.umat.hessian).parameters:
             kwargs["out"] = self.results.hessian
 
-        self.results.elasticity = self.umat.hessian(
-            [*self.results.kinematics, self.results.statevars], *args, **kwargs
-        )
+        with self.timer("hessian"):
+            self.results.elasticity = self.umat.hessian(
+                [*self.results.kinematics, self.results.statevars], *args, **kwargs
+            )
         self.results.hessian = self.results.elasticity[0]
 
         return self.results.elasticity
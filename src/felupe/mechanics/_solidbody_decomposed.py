@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import multiprocessing
+import weakref
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ..field import FieldContainer
+from ..mesh import Mesh
+from ..mesh._partition import partition
+from ..region import Region
+from ..solve import SchurComplementSolver
+from ..tools._newton import solve as newton_solve
+from ..tools._timer import Timer
+from ._helpers import Assemble, Results
+from ._solidbody import SolidBody
+
+
+class _Subdomains:
+    "Solid bodies of subdomains which are evaluated in the current process."
+
+    def __init__(self, umat, fields):
+        self.bodies = [SolidBody(umat, field) for field in fields]
+        self.out = None
+
+    def __call__(self, command, values=None, parallel=False):
+        if command == "vector":
+            out = []
+            for body, body_values in zip(self.bodies, values):
+                for field, field_values in zip(body.field.fields, body_values):
+                    field.values[:] = field_values
+
+                vector = body.assemble.vector(field=body.field, parallel=parallel)
+                out.append(vector.toarray().ravel())
+
+        elif command == "matrix":
+            out = []
+            for body in self.bodies:
+                matrix = body.assemble.matrix(parallel=parallel).tocoo()
+                out.append((matrix.row, matrix.col, matrix.data))
+
+        elif command == "update_statevars":
+            out = [body.results.update_statevars() for body in self.bodies]
+
+        return out
+
+    def submit(self, *args, **kwargs):
+        self.out = self(*args, **kwargs)
+
+    def result(self):
+        return self.out
+
+    def close(self):
+        pass
+
+
+def _serve(connection, umat, fields):
+    "Evaluate the commands of a connection on the subdomains of a worker process."
+
+    subdomains = _Subdomains(umat, fields)
+
+    while True:
+        message = connection.recv()
+
+        if message is None:
+            break
+
+        args, kwargs = message
+        connection.send(subdomains(*args, **kwargs))
+
+    connection.close()
+
+
+class _Worker:
+    "Solid bodies of subdomains which are evaluated in a separate process."
+
+    def __init__(self, umat, fields, context=None):
+        ctx = multiprocessing.get_context(context)
+        self.connection, child = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_serve, args=(child, umat, fields), daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def submit(self, *args, **kwargs):
+        self.connection.send((args, kwargs))
+
+    def result(self):
+        while not self.connection.poll(1.0):
+            if not self.process.is_alive():
+                raise RuntimeError("The worker process of the subdomains has died.")
+
+        return self.connection.recv()
+
+    def close(self):
+        if self.process.is_alive():
+            self.connection.send(None)
+            self.process.join()
+
+        self.connection.close()
+
+
+def _close(workers):
+    "Close the workers of the subdomains."
+
+    for worker in workers:
+        worker.close()
+
+
+class _ResultsDecomposed(Results):
+    "A class with intermediate results of a decomposed SolidBody."
+
+    def __init__(self, workers):
+        super().__init__()
+        self._workers = workers
+
+    def update_statevars(self):
+        for worker in self._workers:
+            worker.submit("update_statevars")
+
+        for worker in self._workers:
+            worker.result()
+
+
+class SolidBodyDecomposed:
+    r"""A hyperelastic solid body, decomposed into subdomains, with methods for the
+    assembly of sparse vectors/matrices. The subdomains are assembled in separate
+    processes.
+
+    Parameters
+    ----------
+    umat : class
+        A class which provides methods for evaluating the gradient and the hessian of
+        the strain energy density function per unit undeformed volume, see
+        :class:`~felupe.SolidBody`.
+    field : FieldContainer
+        A field container with one or more fields. All fields must be defined on the
+        same region.
+    parts : int, optional
+        The number of subdomains (default is 2).
+    method : str, optional
+        The partitioning method of the cells, see :func:`~felupe.mesh.partition`
+        (default is ``"bisection"``).
+    processes : int or None, optional
+        The number of worker processes. The subdomains are distributed to the worker
+        processes. If None, the subdomains are evaluated in the current process
+        (default is None).
+    context : str or None, optional
+        The start method of the worker processes, one of ``"fork"``, ``"spawn"`` or
+        ``"forkserver"``. If None, the default start method is used (default is
+        None).
+
+    Attributes
+    ----------
+    labels : ndarray of int
+        The subdomain ids of the cells.
+    points : list of ndarray
+        The global point ids of the subdomains.
+    dofs : list of ndarray
+        The global degrees of freedom of the subdomains.
+    interface : ndarray of bool
+        A mask of the global degrees of freedom which are shared by several
+        subdomains.
+    timer : felupe.tools.Timer
+        A timer with the accumulated runtimes of the assembly of the vectors
+        (``"vector"``) and the matrices (``"matrix"``) of the subdomains.
+
+    Notes
+    -----
+    The cells of the mesh are partitioned into subdomains. For each subdomain, a mesh
+    with the points of its cells, a region and a field container are created. The
+    solid bodies of the subdomains are created in the worker processes. Hence, the
+    element arrays of the subdomains, like the results of the constitutive material
+    formulation and the integrated vectors and matrices, are only stored in the memory
+    of the worker processes. On assembly, the global field values of the subdomains
+    are sent to the workers and the local vectors and matrices of the subdomains are
+    gathered into the global system.
+
+    The linear equation system of Newton's method may be solved by the Schur
+    complement of the interface degrees of freedom with :meth:`solve`, see
+    :class:`~felupe.solve.SchurComplementSolver`. Only the interior blocks of the
+    subdomains are factorized.
+
+    ..  note::
+        The worker processes are closed if the solid body is deleted or by
+        :meth:`close`. The umat must be picklable for start methods other than
+        ``"fork"``.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Cube(n=6)
+    >>> region = fem.RegionHexahedron(mesh)
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>> boundaries, loadcase = fem.dof.uniaxial(field, clamped=True)
+    >>>
+    >>> umat = fem.NeoHooke(mu=1, bulk=2)
+    >>> solid = fem.SolidBodyDecomposed(umat, field, parts=4, processes=2)
+    >>>
+    >>> table = fem.math.linsteps([0, 1], num=5)
+    >>> step = fem.Step(
+    >>>     items=[solid],
+    >>>     ramp={boundaries["move"]: table},
+    >>>     boundaries=boundaries,
+    >>> )
+    >>>
+    >>> job = fem.Job(steps=[step]).evaluate(solve=solid.solve)
+    >>> solid.close()
+
+    See Also
+    --------
+    felupe.SolidBody : A SolidBody with methods for the assembly of sparse
+        vectors/matrices.
+    felupe.mesh.partition : Partition the cells of a mesh into subdomains.
+    felupe.solve.SchurComplementSolver : A substructuring solver with the Schur
+        complement of the interface degrees of freedom.
+    """
+
+    def __init__(
+        self, umat, field, parts=2, method="bisection", processes=None, context=None
+    ):
+        self.umat = umat
+        self.field = field
+        self.timer = Timer()
+
+        region = field.region
+        mesh = region.mesh
+
+        if any(f.region is not region for f in field.fields):
+            raise NotImplementedError("All fields must be defined on the same region.")
+
+        self.labels = partition(mesh, parts=parts, method=method)
+
+        # the global offsets of the fields
+        offsets = np.concatenate([[0], np.cumsum(field.fieldsizes)[:-1]])
+
+        self.points = []
+        self.dofs = []
+        fields = []
+
+        for label in range(parts):
+            cells = mesh.cells[self.labels == label]
+            points, local = np.unique(cells, return_inverse=True)
+            submesh = Mesh(
+                mesh.points[points], local.reshape(cells.shape), mesh.cell_type
+            )
+            subregion = Region(
+                submesh,
+                region.element,
+                region.quadrature,
+                grad=region.evaluate_gradient,
+            )
+            fields.append(
+                FieldContainer(
+                    [
+                        type(f)(subregion, dim=f.dim, values=f.values[points])
+                        for f in field.fields
+                    ]
+                )
+            )
+
+            self.points.append(points)
+            self.dofs.append(
+                np.concatenate(
+                    [
+                        offset + f.indices.dof[points].ravel()
+                        for offset, f in zip(offsets, field.fields)
+                    ]
+                )
+            )
+
+        # degrees of freedom which are shared by several subdomains
+        ndof = np.sum(field.fieldsizes)
+        subdomains_per_dof = np.bincount(np.concatenate(self.dofs), minlength=ndof)
+        self.interface = subdomains_per_dof > 1
+
+        # the subdomain ids of the workers
+        blocks = np.array_split(np.arange(parts), 1 if processes is None else processes)
+        blocks = [block for block in blocks if len(block) > 0]
+
+        if processes is None:
+            self._workers = [_Subdomains(umat, fields)]
+        else:
+            self._workers = [
+                _Worker(umat, [fields[k] for k in block], context=context)
+                for block in blocks
+            ]
+
+        # the subdomain ids in the order of the gathered results of the workers
+        self._blocks = blocks
+        self._order = np.concatenate(blocks)
+
+        self._finalize = weakref.finalize(self, _close, self._workers)
+
+        self.results = _ResultsDecomposed(self._workers)
+        self.assemble = Assemble(vector=self._vector, matrix=self._matrix)
+
+    def _gather(self, command, values=None, **kwargs):
+        """Submit a command with optional values of the subdomains to all workers and
+        gather the results of the subdomains."""
+
+        for worker, block in zip(self._workers, self._blocks):
+            if values is not None:
+                kwargs["values"] = [values[label] for label in block]
+
+            worker.submit(command, **kwargs)
+
+        return [out for worker in self._workers for out in worker.result()]
+
+    def _vector(self, field=None, parallel=False):
+        if field is not None:
+            self.field = field
+
+        values = [[f.values[p] for f in self.field.fields] for p in self.points]
+
+        with self.timer("vector"):
+            vectors = self._gather("vector", values=values, parallel=parallel)
+
+        ndof = np.sum(self.field.fieldsizes)
+        dofs = [self.dofs[label] for label in self._order]
+        vector = np.bincount(
+            np.concatenate(dofs), weights=np.concatenate(vectors), minlength=ndof
+        )
+
+        self.results.force = csr_matrix(vector.reshape(-1, 1))
+
+        return self.results.force
+
+    def _matrix(self, field=None, parallel=False):
+        if field is not None:
+            self._vector(field=field, parallel=parallel)
+
+        with self.timer("matrix"):
+            matrices = self._gather("matrix", parallel=parallel)
+
+        ndof = np.sum(self.field.fieldsizes)
+        dofs = [self.dofs[label] for label in self._order]
+
+        rows = np.concatenate([d[row] for d, (row, col, data) in zip(dofs, matrices)])
+        cols = np.concatenate([d[col] for d, (row, col, data) in zip(dofs, matrices)])
+        data = np.concatenate([data for row, col, data in matrices])
+
+        self.results.stiffness = csr_matrix((data, (rows, cols)), shape=(ndof, ndof))
+
+        return self.results.stiffness
+
+    def dof_labels(self):
+        """Return the subdomain ids of the global degrees of freedom, where the
+        degrees of freedom on the interface of the subdomains are marked by ``-1``."""
+
+        labels = np.zeros(len(self.interface), dtype=int)
+
+        for label, dofs in enumerate(self.dofs):
+            labels[dofs] = label
+
+        labels[self.interface] = -1
+
+        return labels
+
+    def solve(self, A, b, x, dof1, dof0, ext0=None, timer=None, **kwargs):
+        """Solve the partitioned linear equation system of Newton's method by the
+        Schur complement of the interface degrees of freedom of the subdomains. This
+        method is compatible with the ``solve``-argument of
+        :func:`~felupe.newtonrhapson`, :meth:`Step.generate() <felupe.Step.generate>`
+        and :meth:`Job.evaluate() <felupe.Job.evaluate>`.
+
+        Parameters
+        ----------
+        A : scipy.sparse.csr_matrix
+            The system matrix.
+        b : ndarray
+            The system vector.
+        x : FieldContainer
+            The field container.
+        dof1 : ndarray
+            The active degrees of freedom.
+        dof0 : ndarray
+            The prescribed degrees of freedom.
+        ext0 : ndarray or None, optional
+            The external values of the prescribed degrees of freedom (default is None).
+        timer : felupe.tools.Timer or None, optional
+            A timer of Newton's method (default is None).
+        **kwargs : dict, optional
+            Optional keyword arguments for :class:`~felupe.solve.SchurComplementSolver`.
+
+        Returns
+        -------
+        ndarray
+            The solution of the linear equation system.
+        """
+
+        solver = SchurComplementSolver(self.dof_labels()[dof1], **kwargs)
+
+        return newton_solve(A, b, x, dof1, dof0, ext0=ext0, solver=solver, timer=timer)
+
+    def close(self):
+        "Close the worker processes of the subdomains."
+
+        self._finalize()
@@ -25,7 +25,9 @@ from ..assembly import IntegralForm
 from ..constitution import AreaChange
 from ..field import FieldAxisymmetric
 from ..math import ddot, det, dot, dya, transpose
+from ..tools._timer import Timer
 from ._helpers import Assemble, Evaluate, Results, StateNearlyIncompressible
+from ._hourglass import HourglassControl
 from ._solidbody import Solid
 
 
@@ -56,6 +58,22 @@ class SolidBodyNearlyIncompressible(Solid):
         A valid initial state for a (nearly) incompressible solid (default is None).
     statevars : ndarray or None, optional
         Array of initial internal state variables (default is None).
+    hourglass : float or None, optional
+        The dimensionless stiffness coefficient of a stiffness-based hourglass control
+        (Flanagan-Belytschko) for quad and hexahedron cells with reduced (one-point)
+        integration, e.g. on a :class:`~felupe.RegionReducedHexahedron`. The effective
+        shear modulus is taken from the hessian of the distortional part of the
+        material at the initial state. If None, no hourglass control is applied
+        (default is None).
+
+    Attributes
+    ----------
+    timer : felupe.tools.Timer
+        A timer with the accumulated runtimes of the extraction of the kinematics and
+        the update of the internal fields (``"extract"``), the evaluation of the
+        gradient (``"gradient"``) and the hessian (``"hessian"``) of the constitutive
+        material formulation as well as the integration (``"integrate"``) and assembly
+        (``"assemble"``) of the weak forms.
 
     Notes
     -----
@@ -313,7 +331,7 @@ class SolidBodyNearlyIncompressible(Solid):
         for (nearly) incompressible solid bodies.
     """
 
-    def __init__(self, umat, field, bulk, state=None, statevars=None):
+    def __init__(self, umat, field, bulk, state=None, statevars=None, hourglass=None):
         self.umat = umat
         self.field = field
         self.bulk = bulk
@@ -321,6 +339,8 @@ class SolidBodyNearlyIncompressible(Solid):
         self._area_change = AreaChange()
         self._form = IntegralForm
 
+        self.timer = Timer()
+
         # volume of undeformed configuration
         if isinstance(self.field[0], FieldAxisymmetric):
             R = self.field[0].radius
@@ -353,6 +373,14 @@ class SolidBodyNearlyIncompressible(Solid):
             self.results.state = state
 
         self.results.kinematics = self._extract(self.field)
+
+        self._hourglass = None
+        if hourglass is not None:
+            elasticity = self.umat.hessian(
+                [self.results.kinematics[0], self.results.statevars]
+            )
+            self._hourglass = HourglassControl(field, elasticity[0], kappa=hourglass)
+
         self.assemble = Assemble(vector=self._vector, matrix=self._matrix)
 
         self.evaluate = Evaluate(
@@ -376,22 +404,29 @@ class SolidBodyNearlyIncompressible(Solid):
             dV=self.field.region.dV,
         )
 
-        h = self.results.state.integrate_shape_function_gradient(
-            parallel=parallel, out=self.results._force_values
-        )
-        v = self.results.state.volume()
-        p = self.results.state.p
+        with self.timer("integrate"):
+            h = self.results.state.integrate_shape_function_gradient(
+                parallel=parallel, out=self.results._force_values
+            )
+            v = self.results.state.volume()
+            p = self.results.state.p
 
-        constraint = np.multiply(h, self.bulk * (v / self.V - 1) - p, out=h)
+            constraint = np.multiply(h, self.bulk * (v / self.V - 1) - p, out=h)
 
-        self.results.force_values = form.integrate(
-            parallel=parallel, out=self.results.force_values
-        )
-        np.add(
-            self.results.force_values[0], constraint, out=self.results.force_values[0]
-        )
+            self.results.force_values = form.integrate(
+                parallel=parallel, out=self.results.force_values
+            )
+            np.add(
+                self.results.force_values[0],
+                constraint,
+                out=self.results.force_values[0],
+            )
 
-        self.results.force = form.assemble(values=self.results.force_values)
+        with self.timer("assemble"):
+            self.results.force = form.assemble(values=self.results.force_values)
+
+            if self._hourglass is not None:
+                self.results.force += self._hourglass.vector(self.field)
 
         return self.results.force
 
@@ -410,45 +445,51 @@ class SolidBodyNearlyIncompressible(Solid):
             dV=self.field.region.dV,
         )
 
-        h = self.results.state.integrate_shape_function_gradient(
-            parallel=parallel, out=self.results._force_values
-        )
-        H = dya(h, h, out=self.results._stiffness_values)
-        bulk_H = np.multiply(H, self.bulk, out=H)
-        constraint = np.divide(bulk_H, self.V, out=bulk_H)
+        with self.timer("integrate"):
+            h = self.results.state.integrate_shape_function_gradient(
+                parallel=parallel, out=self.results._force_values
+            )
+            H = dya(h, h, out=self.results._stiffness_values)
+            bulk_H = np.multiply(H, self.bulk, out=H)
+            constraint = np.divide(bulk_H, self.V, out=bulk_H)
 
-        self.results.stiffness_values = form.integrate(
-            parallel=parallel, out=self.results.stiffness_values
-        )
-        np.add(
-            self.results.stiffness_values[0],
-            constraint,
-            out=self.results.stiffness_values[0],
-        )
+            self.results.stiffness_values = form.integrate(
+                parallel=parallel, out=self.results.stiffness_values
+            )
+            np.add(
+                self.results.stiffness_values[0],
+                constraint,
+                out=self.results.stiffness_values[0],
+            )
 
-        self.results.stiffness = form.assemble(values=self.results.stiffness_values)
+        with self.timer("assemble"):
+            self.results.stiffness = form.assemble(values=self.results.stiffness_values)
+
+            if self._hourglass is not None:
+                self.results.stiffness += self._hourglass.matrix()
 
         return self.results.stiffness
 
     def _extract(self, field, parallel=False):
-        u = field[0].values
-        u0 = self.results.state.u
-        h = self.results.state.integrate_shape_function_gradient(
-            parallel=parallel, out=self.results._force_values
-        )
-        v = self.results.state.volume()
+        with self.timer("extract"):
+            u = field[0].values
+            u0 = self.results.state.u
+            h = self.results.state.integrate_shape_function_gradient(
+                parallel=parallel, out=self.results._force_values
+            )
+            v = self.results.state.volume()
 
-        du = (u - u0)[field.region.mesh.cells].transpose([1, 2, 0])
+            du = (u - u0)[field.region.mesh.cells].transpose([1, 2, 0])
 
-        self.field = field
-        self.results.kinematics = self.results.state.F = self.field.extract(
-            out=self.results.kinematics
-        )
+            self.field = field
+            self.results.kinematics = self.results.state.F = self.field.extract(
+                out=self.results.kinematics
+            )
 
-        # update state variables
-        self.results.state.J[:] = (ddot(du, h, mode=(2, 2)) + v) / self.V
-        self.results.state.p[:] = self.bulk * (self.results.state.J - 1)
-        self.results.state.u[:] = u
+            # update state variables
+            self.results.state.J[:] = (ddot(du, h, mode=(2, 2)) + v) / self.V
+            self.results.state.p[:] = self.bulk * (self.results.state.J - 1)
+            self.results.state.u[:] = u
 
         return self.results.kinematics
 
@@ -468,12 +509,15 @@ class SolidBodyNearlyIncompressible(Solid):
         if "out" in inspect.signature(self.umat.gradient).parameters:
             kwargs["out"] = self.results.gradient
 
-        [self.results.gradient, self.results._statevars] = self.umat.gradient(
-            [F, statevars], *args, **kwargs
-        )
-        self.results.stress = [
-            np.add(self.results.gradient, p * dJdF([F])[0], out=self.results.gradient)
-        ]
+        with self.timer("gradient"):
+            [self.results.gradient, self.results._statevars] = self.umat.gradient(
+                [F, statevars], *args, **kwargs
+            )
+            self.results.stress = [
+                np.add(
+                    self.results.gradient, p * dJdF([F])[0], out=self.results.gradient
+                )
+            ]
 
         return self.results.stress
 
@@ -492,10 +536,13 @@ class SolidBodyNearlyIncompressible(Solid):
         if "out" in inspect.signature(self.umat.hessian).parameters:
             kwargs["out"] = self.results.hessian
 
-        self.results.hessian = self.umat.hessian([F, statevars], *args, **kwargs)[0]
-        self.results.elasticity = [
-            np.add(self.results.hessian, p * d2JdF2([F])[0], out=self.results.hessian)
-        ]
+        with self.timer("hessian"):
+            self.results.hessian = self.umat.hessian([F, statevars], *args, **kwargs)[0]
+            self.results.elasticity = [
+                np.add(
+                    self.results.hessian, p * d2JdF2([F])[0], out=self.results.hessian
+                )
+            ]
 
         return self.results.elasticity
 
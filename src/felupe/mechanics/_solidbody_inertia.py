@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+
+from ..assembly import IntegralForm
+from ._helpers import Assemble, Results
+from ._step_explicit import lumped_mass
+
+
+def _coefficients(method, beta, gamma, alpha, rho):
+    "Return the coefficients (alpha_m, alpha_f, beta, gamma) of the time integration."
+
+    if method == "newmark":
+        return 0.0, 0.0, beta, gamma
+
+    elif method == "hht":
+        if not -1 / 3 <= alpha <= 0:
+            raise ValueError("The HHT-parameter alpha must be in the range [-1/3, 0].")
+
+        return 0.0, -alpha, (1 - alpha) ** 2 / 4, 1 / 2 - alpha
+
+    elif method == "generalized-alpha":
+        if not 0 <= rho <= 1:
+            raise ValueError("The spectral radius rho must be in the range [0, 1].")
+
+        alpha_m = (2 * rho - 1) / (rho + 1)
+        alpha_f = rho / (rho + 1)
+        gamma = 1 / 2 - alpha_m + alpha_f
+
+        return alpha_m, alpha_f, (1 - alpha_m + alpha_f) ** 2 / 4, gamma
+
+    else:
+        raise ValueError(
+            'Method must be one of "newmark", "hht" or "generalized-alpha".'
+        )
+
+
+class ResultsInertia(Results):
+    "A class with the results of a SolidBodyInertia."
+
+    def __init__(self, inertia):
+        super().__init__(stress=False, elasticity=False)
+        self._inertia = inertia
+
+    def update_statevars(self):
+        "Update the displacements, velocities and accelerations of a converged time."
+        self._inertia._update_state()
+
+
+class SolidBodyInertia:
+    r"""The inertia of a solid body for an implicit time integration by the Newmark,
+    the HHT-:math:`\alpha` or the generalized-:math:`\alpha` method.
+
+    Parameters
+    ----------
+    field : FieldContainer
+        A field container, where the first field is the displacement field.
+    density : float
+        The density :math:`\rho` of the solid body.
+    method : str, optional
+        The time integration method, one of ``"newmark"``, ``"hht"`` or
+        ``"generalized-alpha"`` (default is ``"newmark"``).
+    beta : float, optional
+        The parameter :math:`\beta` of the Newmark method (default is 0.25).
+    gamma : float, optional
+        The parameter :math:`\gamma` of the Newmark method (default is 0.5).
+    alpha : float, optional
+        The parameter :math:`\alpha \in [-1/3, 0]` of the HHT-:math:`\alpha` method
+        (default is -0.05).
+    rho : float, optional
+        The spectral radius :math:`\rho_\infty \in [0, 1]` at infinite frequencies of
+        the generalized-:math:`\alpha` method (default is 0.8).
+    lumped : bool, optional
+        A flag to use a lumped (HRZ, i.e. the diagonal of the consistent mass matrix of
+        each cell, scaled to the mass of the cell) instead of the consistent mass matrix
+        (default is False). The lumped mass is positive also for quadratic elements.
+    time : float, optional
+        The initial time (default is 0.0).
+    velocity : ndarray or None, optional
+        The initial velocities of the degrees of freedom of the first field (default is
+        None). If None, the initial velocities are zero.
+    acceleration : ndarray or None, optional
+        The initial accelerations of the degrees of freedom of the first field (default
+        is None). If None, the initial accelerations are zero.
+
+    Attributes
+    ----------
+    mass : scipy.sparse.csr_matrix
+        The mass matrix of the displacement field. It is assembled only once.
+    results : ResultsInertia
+        The results with the ``time``, the ``displacement``, the ``velocity`` and the
+        ``acceleration`` of the degrees of freedom of the first field at the last
+        converged time.
+
+    Notes
+    -----
+    The inertia item is added to the items of a :class:`~felupe.Step` and its time
+    is ramped, i.e. the time integration is driven by the substeps of the step. After
+    each converged substep, the displacements, velocities and accelerations are updated
+    by the Newmark equations, see Eq. :eq:`newmark`.
+
+    ..  math::
+        :label: newmark
+
+        \boldsymbol{a}_{n+1} &= \frac{
+            \boldsymbol{u}_{n+1} - \boldsymbol{u}_n - \Delta t\ \boldsymbol{v}_n
+        }{\beta\ \Delta t^2} - \left( \frac{1}{2 \beta} - 1 \right) \boldsymbol{a}_n
+
+        \boldsymbol{v}_{n+1} &= \boldsymbol{v}_n + \Delta t \left(
+            (1 - \gamma)\ \boldsymbol{a}_n + \gamma\ \boldsymbol{a}_{n+1}
+        \right)
+
+    The equation of motion of the generalized-:math:`\alpha` method with the (summed)
+    assembled vectors of all other items :math:`\boldsymbol{r}` (internal minus external
+    forces) is given in Eq. :eq:`generalized-alpha`. The HHT-:math:`\alpha` method is
+    obtained by :math:`\alpha_m = 0` and :math:`\alpha_f = -\alpha` and the Newmark
+    method by :math:`\alpha_m = \alpha_f = 0`.
+
+    ..  math::
+        :label: generalized-alpha
+
+        \boldsymbol{M} \left(
+            (1 - \alpha_m)\ \boldsymbol{a}_{n+1} + \alpha_m\ \boldsymbol{a}_n
+        \right) + (1 - \alpha_f)\ \boldsymbol{r}_{n+1} + \alpha_f\ \boldsymbol{r}_n
+        = \boldsymbol{0}
+
+    The equation is divided by :math:`(1 - \alpha_f)`. Hence, the vectors and matrices
+    of all other items are not modified and the inertia item assembles the vector and
+    the matrix given in Eq. :eq:`inertia-vector-matrix`.
+
+    ..  math::
+        :label: inertia-vector-matrix
+
+        \boldsymbol{f}_I &= \frac{1}{1 - \alpha_f} \left( \boldsymbol{M} \left(
+            (1 - \alpha_m)\ \boldsymbol{a}_{n+1} + \alpha_m\ \boldsymbol{a}_n
+        \right) + \alpha_f\ \boldsymbol{r}_n \right)
+
+        \boldsymbol{K}_I &= \frac{1 - \alpha_m}{(1 - \alpha_f)\ \beta\ \Delta t^2}\
+            \boldsymbol{M}
+
+    The vectors of all other items at the last converged time are obtained by the
+    equation of motion :math:`\boldsymbol{r}_n = -\boldsymbol{f}_{I,n}`. The mass
+    matrix is assembled once and only its scaling changes with the time increment.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>> import numpy as np
+    >>>
+    >>> mesh = fem.Cube(b=(10, 1, 1), n=(11, 3, 3))
+    >>> region = fem.RegionHexahedron(mesh)
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>> boundaries = {
+    ...     "fixed": fem.Boundary(field[0], fx=0),
+    ...     "move": fem.Boundary(field[0], fx=10, skip=(1, 1, 0)),
+    ... }
+    >>>
+    >>> solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=5), field)
+    >>> inertia = fem.SolidBodyInertia(field, density=1.0, method="generalized-alpha")
+    >>>
+    >>> time = np.linspace(0, 20, 41)
+    >>> step = fem.Step(
+    ...     items=[solid, inertia],
+    ...     ramp={inertia: time[1:], boundaries["move"]: np.minimum(time[1:], 1)},
+    ...     boundaries=boundaries,
+    ... )
+    >>> job = fem.CharacteristicCurve(
+    ...     steps=[step], boundary=boundaries["move"], items=[solid]
+    ... ).evaluate()
+
+    See Also
+    --------
+    felupe.ExplicitStep : A step with an explicit time integration by the central
+        difference method, based on a lumped mass matrix.
+    felupe.SolidBodyGravity : A gravity (body) force on a solid body.
+    """
+
+    def __init__(
+        self,
+        field,
+        density,
+        method="newmark",
+        beta=0.25,
+        gamma=0.5,
+        alpha=-0.05,
+        rho=0.8,
+        lumped=False,
+        time=0.0,
+        velocity=None,
+        acceleration=None,
+    ):
+        self.field = field
+        self.density = density
+        self.method = method
+        self.alpha_m, self.alpha_f, self.beta, self.gamma = _coefficients(
+            method, beta, gamma, alpha, rho
+        )
+
+        self.results = ResultsInertia(self)
+        self.assemble = Assemble(vector=self._vector, matrix=self._matrix)
+
+        # assemble the mass matrix of the displacement field only once
+        size = np.sum(self.field.fieldsizes)
+
+        if lumped:
+            m = lumped_mass(self.field, self.density)
+            self.mass = diags(np.pad(m, (0, size - len(m)))).tocsr()
+        else:
+            f = self.field.copy()
+            f.fields = f.fields[0:1]
+            dim = f[0].dim
+
+            self.mass = IntegralForm(
+                fun=[self.density * np.eye(dim).reshape(dim, dim, 1, 1)],
+                v=f,
+                u=f,
+                dV=self.field.region.dV,
+                grad_v=[False],
+                grad_u=[False],
+            ).assemble()
+            self.mass.resize(size, size)
+            self.mass = self.mass.tocsr()
+
+        u = self._displacement(self.field)
+        self.results.time = self.time = time
+        self.results.displacement = u
+        self.results.velocity = np.zeros_like(u)
+        self.results.acceleration = np.zeros_like(u)
+
+        if velocity is not None:
+            self.results.velocity[: np.size(velocity)] = np.ravel(velocity)
+
+        if acceleration is not None:
+            self.results.acceleration[: np.size(acceleration)] = np.ravel(acceleration)
+
+        # the (summed) vectors of all other items at the last converged time
+        self.results.other_force = -self.mass @ self.results.acceleration
+
+        self._acceleration = self.results.acceleration.copy()
+        self._inertia_force = -self.results.other_force
+
+    def update(self, time):
+        "Update the time of the next substep."
+
+        self.time = time
+
+    def _displacement(self, field):
+        "Return the displacements of the first field, padded to the global size."
+
+        size = np.sum(field.fieldsizes)
+        u = np.zeros(size)
+        u[: field[0].values.size] = field[0].values.ravel()
+
+        return u
+
+    def _timestep(self):
+        dt = self.time - self.results.time
+
+        if dt <= 0:
+            raise ValueError(
+                "The time increment must be positive. Ramp the time of the inertia."
+            )
+
+        return dt
+
+    def _vector(self, field=None, parallel=False):
+        if field is not None:
+            self.field = field
+
+        dt = self._timestep()
+        u = self._displacement(self.field)
+
+        un = self.results.displacement
+        vn = self.results.velocity
+        an = self.results.acceleration
+
+        # the accelerations of the Newmark method
+        self._acceleration = (u - un - dt * vn) / (self.beta * dt**2) - (
+            1 / (2 * self.beta) - 1
+        ) * an
+
+        am = (1 - self.alpha_m) * self._acceleration + self.alpha_m * an
+
+        self._inertia_force = (
+            self.mass @ am + self.alpha_f * self.results.other_force
+        ) / (1 - self.alpha_f)
+
+        self.results.force = csr_matrix(self._inertia_force.reshape(-1, 1))
+
+        return self.results.force
+
+    def _matrix(self, field=None, parallel=False):
+        if field is not None:
+            self.field = field
+
+        dt = self._timestep()
+        factor = (1 - self.alpha_m) / ((1 - self.alpha_f) * self.beta * dt**2)
+
+        self.results.stiffness = self.mass * factor
+
+        return self.results.stiffness
+
+    def _update_state(self):
+        "Update the displacements, velocities and accelerations of a converged time."
+
+        if self.time == self.results.time:
+            return
+
+        dt = self._timestep()
+        an = self.results.acceleration
+        a = self._acceleration
+
+        self.results.velocity = self.results.velocity + dt * (
+            (1 - self.gamma) * an + self.gamma * a
+        )
+        self.results.acceleration = a
+        self.results.displacement = self._displacement(self.field)
+        self.results.other_force = -self._inertia_force
+        self.results.time = self.time
@@ -19,6 +19,7 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 import numpy as np
 
 from ..dof import apply, partition
+from ..solve import FactorizedSolver
 from ..tools import newtonrhapson
 
 
@@ -36,6 +37,15 @@ class Step:
     boundaries : dict of Boundary, optional
         A dict with :class:`~felupe.Boundary` conditions (default is None).
 
+    Notes
+    -----
+    The iteration method of :func:`~felupe.newtonrhapson` is selected by the keyword
+    argument ``method`` of :meth:`~felupe.Step.generate`, which is also available in
+    :meth:`~felupe.Job.evaluate`. For all methods except ``"newton"``, the Jacobian and
+    its factorization are re-used across the substeps as long as the active degrees of
+    freedom don't change. The Jacobian is only re-evaluated on slow convergence or after
+    a given number of iterations, see :func:`~felupe.newtonrhapson`.
+
     Examples
     --------
     >>> import felupe as fem
@@ -74,10 +84,25 @@ class Step:
         self.boundaries = boundaries
 
     def generate(self, **kwargs):
-        "Yield all generated substeps."
+        """Yield all generated substeps.
+
+        Parameters
+        ----------
+        **kwargs : dict, optional
+            Optional keyword arguments for :func:`~felupe.newtonrhapson`, e.g.
+            ``method="modified-newton"``.
+        """
 
         substeps = np.arange(self.nsubsteps)
 
+        # re-use the Jacobian and its factorization across the substeps
+        reuse = kwargs.get("method", "newton") != "newton"
+        jac0 = None
+        dof1_old = None
+
+        if reuse and "solver" not in kwargs.keys():
+            kwargs["solver"] = FactorizedSolver()
+
         if "x0" not in kwargs.keys():
             field = self.items[0].field
         else:
@@ -96,6 +121,13 @@ class Step:
             dof0, dof1 = partition(field, self.boundaries)
             ext0 = apply(field, self.boundaries, dof0)
 
+            if reuse:
+                # a changed partition invalidates the Jacobian of the previous substep
+                if dof1_old is None or not np.array_equal(dof1, dof1_old):
+                    jac0 = None
+
+                kwargs["jac0"] = jac0
+
             # run newton-rhapson iterations
             res = newtonrhapson(
                 items=self.items,
@@ -105,6 +137,9 @@ class Step:
                 **kwargs,
             )
 
+            jac0 = res.jac
+            dof1_old = dof1
+
             if not res.success:
                 stop = True
                 break
@@ -0,0 +1,428 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+
+from ..dof import Boundary, apply, partition
+from ..solve import FactorizedSolver
+from ..tools._newton import NewtonResult, check, fun_items, jac_items
+from ..tools._timer import Timer
+
+
+class ArcLengthStep:
+    r"""A step with a numeric continuation of the equilibrium path by the arc-length
+    method, where the ramped loads are scaled by a load-proportionality factor. The
+    load-proportionality factor is an additional unknown, i.e. limit points (snap-
+    through) and turning points (snap-back) of the equilibrium path are passed.
+
+    Parameters
+    ----------
+    items : list of SolidBody, SolidBodyNearlyIncompressible, SolidBodyPressure, SolidBodyGravity, PointLoad, MultiPointConstraint or MultiPointContact
+        A list of items with methods for the assembly of sparse vectors/matrices. The
+        field of the first item is used as the global field container.
+    ramp : dict
+        A dict with ``item``-keys which holds the reference values of the loads, e.g.
+        the values of a :class:`~felupe.PointLoad` or the pressure of a
+        :class:`~felupe.SolidBodyPressure`. The loads are scaled by the load-
+        proportionality factor :math:`\lambda`.
+    boundaries : dict of Boundary, optional
+        A dict with :class:`~felupe.Boundary` conditions (default is None). The values
+        of the boundary conditions are not scaled by the load-proportionality factor.
+    arclength : float, optional
+        The initial arc-length of the increments (default is 0.1).
+    nsubsteps : int, optional
+        The maximum number of (converged) increments (default is 100).
+    arclength_min : float or None, optional
+        The minimum arc-length. The step is stopped if the arc-length of a failed
+        increment is reduced below this value. If None, ``arclength / 1024`` is used
+        (default is None).
+    arclength_max : float or None, optional
+        The maximum arc-length. If None, ``arclength`` is used (default is None).
+    iterations : int, optional
+        The desired number of iterations per increment for the adaption of the arc-
+        length (default is 4).
+    psi : float, optional
+        The scaling factor :math:`\psi` of the load-proportionality factor in the arc-
+        length equation. A value of zero leads to the cylindrical and a value of one to
+        the spherical arc-length method (default is 0.0).
+    lpf : float, optional
+        The initial load-proportionality factor (default is 0.0).
+    lpfmax : float or None, optional
+        The step is finished after the first increment with a load-proportionality
+        factor greater or equal than this value. If None, all ``nsubsteps`` increments
+        are evaluated (default is None).
+    direction : int, optional
+        The sign of the load-proportionality factor of the first increment (default is
+        1).
+
+    Attributes
+    ----------
+    lpf : float
+        The load-proportionality factor of the last converged increment.
+
+    Notes
+    -----
+    The equilibrium equations are split into the assembled vectors of the items
+    without a ramp :math:`\boldsymbol{r}` and the assembled vectors of the ramped load
+    items at their reference values :math:`\boldsymbol{g}`, see Eq.
+    :eq:`arclength-equilibrium`, where the loads are linear in :math:`\lambda`.
+
+    ..  math::
+        :label: arclength-equilibrium
+
+        \boldsymbol{f}(\boldsymbol{u}, \lambda) = \boldsymbol{r}(\boldsymbol{u})
+            + \lambda\ \boldsymbol{g}(\boldsymbol{u}) = \boldsymbol{0}
+
+    The system of equilibrium equations is completed by the arc-length equation of
+    Crisfield [1]_ for the increments :math:`\Delta \boldsymbol{u}` and
+    :math:`\Delta \lambda` of the active degrees of freedom, see Eq.
+    :eq:`arclength-constraint`.
+
+    ..  math::
+        :label: arclength-constraint
+
+        \Delta \boldsymbol{u} \cdot \Delta \boldsymbol{u}
+            + \psi^2\ \Delta \lambda^2\ \boldsymbol{g} \cdot \boldsymbol{g}
+            = \Delta l^2
+
+    For each iteration, the linearized equilibrium equations are solved for two right-
+    hand sides with one factorization of the (partitioned) Jacobian, see Eq.
+    :eq:`arclength-solve`.
+
+    ..  math::
+        :label: arclength-solve
+
+        \boldsymbol{K}\ \left[ \delta \boldsymbol{u}_f,\ \delta \boldsymbol{u}_g \right]
+            = - \left[ \boldsymbol{f},\ \boldsymbol{g} \right]
+
+    The iterative increment of the load-proportionality factor :math:`\delta \lambda`
+    is a root of the quadratic arc-length equation with the updated increments
+    :math:`\Delta \boldsymbol{u} + \delta \boldsymbol{u}_f + \delta \lambda\ \delta
+    \boldsymbol{u}_g`. The root with the smallest angle between the old and the new
+    increments is chosen. The direction of the predictor of an increment is given by
+    the sign of the projection of the tangent on the previous increment. If the
+    quadratic equation has no real roots or the iterations do not converge, the
+    increment is restarted with the half arc-length. After a converged increment, the
+    arc-length is adapted by the ratio of the desired number of iterations and the
+    number of iterations :math:`n`, see Eq. :eq:`arclength-adaption`.
+
+    ..  math::
+        :label: arclength-adaption
+
+        \Delta l_{n+1} = \Delta l_n \sqrt{\frac{n_{desired}}{n}}
+
+    The iteration method is selected by the keyword argument ``method`` of
+    :meth:`~felupe.ArcLengthStep.generate`, which is also available in
+    :meth:`~felupe.Job.evaluate`. For ``method="modified-newton"``, the Jacobian and its
+    factorization of the beginning of an increment are re-used for all iterations of
+    the increment. The results are returned as :class:`~felupe.tools.NewtonResult` for
+    each converged increment, where the load-proportionality factor is stored as
+    ``lpf``. Hence, an arc-length step may be used in a :class:`~felupe.Job` or a
+    :class:`~felupe.CharacteristicCurve`.
+
+    References
+    ----------
+    ..  [1] M. A. Crisfield, "A fast incremental/iterative solution procedure that
+        handles 'snap-through'", Computers & Structures, vol. 13, no. 1-3. Elsevier,
+        pp. 55–62, Jun. 1981. doi: 10.1016/0045-7949(81)90108-5.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Cube(n=2)
+    >>> region = fem.RegionHexahedron(mesh)
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>> boundaries = fem.dof.symmetry(field[0])
+    >>>
+    >>> umat = fem.Hyperelastic(fem.yeoh, C10=0.5, C20=-0.25, C30=0.025)
+    >>> solid = fem.SolidBody(umat & fem.Volumetric(bulk=5), field)
+    >>>
+    >>> right = mesh.points[:, 0] == 1
+    >>> load = fem.PointLoad(field, right)
+    >>>
+    >>> step = fem.ArcLengthStep(
+    ...     items=[solid, load],
+    ...     ramp={load: [0.01, 0, 0]},
+    ...     boundaries=boundaries,
+    ...     arclength=0.05,
+    ...     nsubsteps=40,
+    ... )
+    >>>
+    >>> lpf = []
+    >>> job = fem.Job(
+    ...     steps=[step], callback=lambda j, i, substep: lpf.append(substep.lpf)
+    ... ).evaluate()
+
+    See Also
+    --------
+    felupe.Step : A Step with multiple substeps, subsequently depending on the solution
+        of the previous substep.
+    felupe.Job : A job with a list of steps and a method to evaluate them.
+    """
+
+    def __init__(
+        self,
+        items,
+        ramp,
+        boundaries=None,
+        arclength=0.1,
+        nsubsteps=100,
+        arclength_min=None,
+        arclength_max=None,
+        iterations=4,
+        psi=0.0,
+        lpf=0.0,
+        lpfmax=None,
+        direction=1,
+    ):
+        self.items = items
+        self.ramp = dict(ramp)
+
+        if len(self.ramp) == 0:
+            raise ValueError("At least one load item must be ramped.")
+
+        if any([isinstance(item, Boundary) for item in self.ramp.keys()]):
+            raise ValueError(
+                "Boundaries can't be ramped by the load-proportionality factor."
+            )
+
+        if boundaries is None:
+            boundaries = {}
+
+        if arclength_min is None:
+            arclength_min = arclength / 1024
+
+        if arclength_max is None:
+            arclength_max = arclength
+
+        self.boundaries = boundaries
+        self.arclength = arclength
+        self.nsubsteps = nsubsteps
+        self.arclength_min = arclength_min
+        self.arclength_max = arclength_max
+        self.iterations = iterations
+        self.psi = psi
+        self.lpf = lpf
+        self.lpfmax = lpfmax
+        self.direction = direction
+
+    def _update(self, lpf):
+        "Update the ramped load items with the scaled reference values."
+
+        for item, value in self.ramp.items():
+            item.update(lpf * np.asarray(value))
+
+    def generate(self, **kwargs):
+        """Yield the results of all converged increments.
+
+        Parameters
+        ----------
+        **kwargs : dict, optional
+            Optional keyword arguments. The keyword ``x0`` is used as the global field
+            container, the keyword ``timer`` as a :class:`~felupe.tools.Timer` and the
+            keyword ``parallel`` of the dict ``kwargs``. The keywords ``method``
+            (``"newton"`` or ``"modified-newton"``), ``maxiter``, ``tol`` and
+            ``solver`` are used as in :func:`~felupe.newtonrhapson`. All other keyword
+            arguments are ignored.
+        """
+
+        method = kwargs.get("method", "newton")
+        methods = ["newton", "modified-newton"]
+
+        if method not in methods:
+            raise ValueError(f"Method must be one of {methods}, got '{method}'.")
+
+        reuse = method != "newton"
+        maxiter = kwargs.get("maxiter", 16)
+        tol = kwargs.get("tol", np.sqrt(np.finfo(float).eps))
+        solver = kwargs.get("solver", FactorizedSolver())
+        parallel = kwargs.get("kwargs", {}).get("parallel", False)
+
+        if "x0" not in kwargs.keys():
+            field = self.items[0].field
+        else:
+            field = kwargs["x0"]
+
+        timer = kwargs.get("timer")
+        if timer is None:
+            timer = Timer()
+
+        loads = [item for item in self.items if item in self.ramp.keys()]
+        others = [item for item in self.items if item not in self.ramp.keys()]
+
+        def set_values(u):
+            "Set the values of the global field container (in-place)."
+
+            for f, values in zip(field.fields, np.split(u, field.offsets)):
+                f.values[:] = values.reshape(f.values.shape)
+
+        def evaluate(u, lpf, matrix=True):
+            "Assemble the equilibrium equations and the Jacobian."
+
+            set_values(u)
+
+            with timer("fun"):
+                r = fun_items(others, field, parallel=parallel)
+                g = fun_items(loads, field, parallel=parallel)
+
+            jac = None
+            if matrix:
+                with timer("jac"):
+                    K = jac_items(others, field, parallel=parallel)
+                    K += lpf * jac_items(loads, field, parallel=parallel)
+
+                with timer("partition"):
+                    jac = K, K[dof1, :][:, dof1]
+
+                if hasattr(solver, "reset"):
+                    solver.reset()
+
+            return r + lpf * g, g, jac
+
+        def linsolve(jac, b):
+            "Solve the partitioned system for one or more right-hand sides."
+
+            with timer("solve"):
+                return solver(jac[1], b)
+
+        dof0, dof1 = partition(field, self.boundaries)
+        u = np.concatenate([f.values.ravel() for f in field.fields])
+        u[dof0] = apply(field, self.boundaries, dof0)
+
+        lpf = self.lpf
+        arclength = self.arclength
+        du_old, dlpf_old = None, self.direction
+        substep = 0
+
+        while substep < self.nsubsteps:
+            # the loads are linear in the load-proportionality factor
+            self._update(1)
+
+            u_n, lpf_n = u.copy(), lpf
+            f, g, jac = evaluate(u, lpf)
+
+            # predictor
+            t = linsolve(jac, -g[dof1])
+            gg = self.psi**2 * (g[dof1] @ g[dof1])
+            dlpf = arclength / np.sqrt(t @ t + gg)
+
+            if du_old is None:
+                sign = np.sign(dlpf_old)
+            else:
+                sign = np.sign(t @ du_old + gg * dlpf_old)
+
+            dlpf *= sign if sign != 0 else np.sign(dlpf_old)
+            du = dlpf * t
+
+            success = False
+            xnorms, fnorms = [], []
+
+            for iteration in range(maxiter):
+                u = u_n.copy()
+                u[dof1] += du
+                lpf = lpf_n + dlpf
+
+                f, g, jac_new = evaluate(u, lpf, matrix=not reuse)
+
+                with timer("check"):
+                    xnorm, fnorm, success = check(
+                        dx=du,
+                        x=field,
+                        f=f,
+                        xtol=np.inf,
+                        ftol=tol,
+                        dof1=dof1,
+                        dof0=dof0,
+                        items=self.items,
+                    )
+
+                xnorms.append(xnorm)
+                fnorms.append(fnorm)
+
+                if success or np.any(np.isnan([xnorm, fnorm])):
+                    break
+
+                if not reuse:
+                    jac = jac_new
+
+                # corrector with the quadratic arc-length equation
+                ddu = linsolve(jac, -np.stack([f[dof1], g[dof1]], axis=1))
+                du_f, du_g = ddu[:, 0], ddu[:, 1]
+
+                gg = self.psi**2 * (g[dof1] @ g[dof1])
+                du_f = du + du_f
+
+                a = du_g @ du_g + gg
+                b = 2 * (du_g @ du_f + gg * dlpf)
+                c = du_f @ du_f + gg * dlpf**2 - arclength**2
+                discriminant = b**2 - 4 * a * c
+
+                if discriminant < 0:
+                    break
+
+                roots = (-b + np.array([1, -1]) * np.sqrt(discriminant)) / (2 * a)
+                cosines = [
+                    du @ (du_f + root * du_g) + gg * dlpf * (dlpf + root)
+                    for root in roots
+                ]
+                root = roots[np.argmax(cosines)]
+
+                du = du_f + root * du_g
+                dlpf = dlpf + root
+
+            if not success:
+                # restart the increment with a reduced arc-length
+                u, lpf = u_n, lpf_n
+                set_values(u)
+                arclength /= 2
+
+                if arclength < self.arclength_min:
+                    break
+
+                continue
+
+            # adapt the arc-length by the number of iterations
+            du_old, dlpf_old = du, dlpf
+            arclength = np.clip(
+                arclength * np.sqrt(self.iterations / (1 + iteration)),
+                self.arclength_min,
+                self.arclength_max,
+            )
+
+            # evaluate the load items at the converged load-proportionality factor
+            self.lpf = lpf
+            self._update(lpf)
+            fun_items(loads, field, parallel=parallel)
+            substep += 1
+
+            res = NewtonResult(
+                x=field,
+                fun=f,
+                jac=jac[0],
+                success=True,
+                iterations=1 + iteration,
+                xnorms=xnorms,
+                fnorms=fnorms,
+            )
+            res.lpf = lpf
+
+            yield res
+
+            if self.lpfmax is not None and lpf >= self.lpfmax:
+                break
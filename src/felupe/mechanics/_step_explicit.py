@@ -0,0 +1,421 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+
+from ..dof import apply, partition
+from ..tools._newton import NewtonResult, fun_items
+from ..tools._timer import Timer
+
+
+def lumped_mass(field, density):
+    r"""Return the lumped (diagonal) mass of the degrees of freedom of the first field
+    of a field container.
+
+    Parameters
+    ----------
+    field : FieldContainer
+        A field container, where the first field is the displacement field.
+    density : float
+        The density of the material.
+
+    Returns
+    -------
+    ndarray
+        The lumped mass of the degrees of freedom of the first field.
+
+    Notes
+    -----
+    The diagonal of the consistent mass matrix of each cell is scaled to the total mass
+    of the cell by the HRZ-lumping of Hinton, Rock and Zienkiewicz [1]_, see Eq.
+    :eq:`lumped-mass`.
+
+    ..  math::
+        :label: lumped-mass
+
+        m_a = \frac{\int_V \rho\ h_a\ h_a\ dV}{\sum_b \int_V \rho\ h_b\ h_b\ dV}
+            \int_V \rho\ dV
+
+    Contrary to the row-sums of the consistent mass matrix, the lumped mass is
+    positive for all points of the cells, also for quadratic elements. For linear
+    elements with affine cells, both lumpings are identical. The mass of points
+    without cells is zero.
+
+    References
+    ----------
+    ..  [1] E. Hinton, T. Rock and O. C. Zienkiewicz, "A note on mass lumping and
+        related processes in the finite element method", Earthquake Engineering &
+        Structural Dynamics, vol. 4, no. 3. Wiley, pp. 245–249, Jan. 1976. doi:
+        10.1002/eqe.4290040305.
+
+    """
+
+    region = field.region
+    cells = region.mesh.cells
+    dim = field[0].dim
+
+    diagonal = np.einsum("aqc,aqc,qc->ca", region.h, region.h, region.dV)
+    total = region.dV.sum(axis=0).reshape(-1, 1)
+    values = density * total * diagonal / diagonal.sum(axis=1, keepdims=True)
+
+    mass = np.bincount(
+        cells.ravel(), weights=values.ravel(), minlength=region.mesh.npoints
+    )
+
+    return np.repeat(mass, dim)
+
+
+def _interpolate(time, times, values):
+    "Linear interpolation of the (array-valued) ramp values at a given time."
+
+    values = np.asarray(values, dtype=float)
+    k = np.clip(np.searchsorted(times, time), 1, len(times) - 1)
+
+    if len(times) == 1:
+        return values[0]
+
+    ratio = np.clip((time - times[k - 1]) / (times[k] - times[k - 1]), 0, 1)
+
+    return values[k - 1] + ratio * (values[k] - values[k - 1])
+
+
+class ExplicitStep:
+    r"""A step with an explicit time integration by the central difference method,
+    based on a lumped mass matrix. Only the vectors of the items are assembled, i.e.
+    neither a stiffness matrix is assembled nor an equation system is solved.
+
+    Parameters
+    ----------
+    items : list of SolidBody, SolidBodyNearlyIncompressible, SolidBodyPressure, SolidBodyGravity or PointLoad
+        A list of items with methods for the assembly of sparse vectors. The field of
+        the first item is used as the global field container.
+    density : float
+        The density of the material.
+    time : array_like
+        The (increasing) times at which the results are returned, e.g. written to a
+        result file by a :class:`~felupe.Job`. The step starts at ``time[0]``.
+    ramp : dict, optional
+        A dict with :class:`~felupe.Boundary` or ``item``-keys which holds the array of
+        values at the given times (default is None). The values are linearly
+        interpolated in time for each time increment.
+    boundaries : dict of Boundary, optional
+        A dict with :class:`~felupe.Boundary` conditions (default is None).
+    dt : float or None, optional
+        The time increment. If None, the stable time increment is estimated at each of
+        the given times, see :meth:`~felupe.ExplicitStep.stable_time_step` (default is
+        None).
+    safety : float, optional
+        A safety factor for the estimated stable time increment (default is 0.8).
+    damping : float, optional
+        A mass-proportional damping coefficient (default is 0.0).
+    velocity : ndarray or None, optional
+        The initial velocities of the degrees of freedom of the first field. If None,
+        the initial velocities are zero (default is None).
+
+    Attributes
+    ----------
+    mass : ndarray
+        The lumped mass of the degrees of freedom of the first field. It is evaluated
+        only once, on the first evaluation of the step.
+    velocity : ndarray
+        The velocities of the degrees of freedom of the first field at the last
+        returned time.
+    increments : int
+        The total number of time increments of the last evaluation.
+
+    Notes
+    -----
+    The accelerations are obtained by the lumped mass and the sum of the assembled
+    vectors :math:`\boldsymbol{r}` (internal minus external forces) of the items, see
+    Eq. :eq:`explicit-acceleration`.
+
+    ..  math::
+        :label: explicit-acceleration
+
+        \boldsymbol{a}_n = -\boldsymbol{M}^{-1} \boldsymbol{r}(\boldsymbol{u}_n)
+            - c\ \boldsymbol{v}_{n-1/2}
+
+    The displacements and velocities are updated by the central difference method (in
+    its velocity-Verlet form), see Eq. :eq:`explicit-central-difference`.
+
+    ..  math::
+        :label: explicit-central-difference
+
+        \boldsymbol{v}_{n+1/2} &= \boldsymbol{v}_n + \frac{\Delta t}{2}\ \boldsymbol{a}_n
+
+        \boldsymbol{u}_{n+1} &= \boldsymbol{u}_n + \Delta t\ \boldsymbol{v}_{n+1/2}
+
+        \boldsymbol{v}_{n+1} &= \boldsymbol{v}_{n+1/2} + \frac{\Delta t}{2}\
+            \boldsymbol{a}_{n+1}
+
+    The central difference method is only conditionally stable. The time increment is
+    limited by the highest eigenfrequency of the cells, which is estimated by the
+    dilatational wave speed :math:`c_d` and the uniform gradients of the shape functions
+    :math:`b_{ai}` of the cells with :math:`n` points per cell, see Eq.
+    :eq:`explicit-time-step`.
+
+    ..  math::
+        :label: explicit-time-step
+
+        \Delta t \le \frac{2}{\omega_{max}}, \qquad
+        \omega_{max}^2 \le n\ c_d^2\ b_{ai} b_{ai}
+
+    The state variables of the items are updated after each time increment. The
+    results are returned at the given times as :class:`~felupe.tools.NewtonResult`,
+    where the number of time increments is stored as ``iterations``. Hence, an explicit
+    step may be used in a :class:`~felupe.Job` or a
+    :class:`~felupe.CharacteristicCurve`.
+
+    The diagonal of the consistent mass matrix of each cell is scaled to the mass of
+    the cell (HRZ-lumping), i.e. the lumped mass is also positive for quadratic
+    elements. If no time increment is given, the stable time increment is re-estimated
+    at the beginning of each interval between two of the given times, i.e. for the
+    current (deformed) state of the items.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>> import numpy as np
+    >>>
+    >>> mesh = fem.Cube(b=(10, 1, 1), n=(21, 3, 3))
+    >>> region = fem.RegionReducedHexahedron(mesh)
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>> boundaries = {
+    ...     "fixed": fem.Boundary(field[0], fx=0),
+    ...     "move": fem.Boundary(field[0], fx=10, skip=(0, 1, 1)),
+    ... }
+    >>>
+    >>> umat = fem.NeoHooke(mu=1, bulk=5)
+    >>> solid = fem.SolidBody(umat, field, hourglass=1.0)
+    >>>
+    >>> time = np.linspace(0, 20, 11)
+    >>> step = fem.ExplicitStep(
+    ...     items=[solid],
+    ...     density=1.0,
+    ...     time=time,
+    ...     ramp={boundaries["move"]: time / 10},
+    ...     boundaries=boundaries,
+    ... )
+    >>> job = fem.CharacteristicCurve(steps=[step], boundary=boundaries["move"])
+    >>> job.evaluate()
+
+    See Also
+    --------
+    felupe.Step : A Step with multiple substeps, subsequently depending on the solution
+        of the previous substep.
+    felupe.Job : A job with a list of steps and a method to evaluate them.
+    """
+
+    def __init__(
+        self,
+        items,
+        density,
+        time,
+        ramp=None,
+        boundaries=None,
+        dt=None,
+        safety=0.8,
+        damping=0.0,
+        velocity=None,
+    ):
+        self.items = items
+        self.density = density
+        self.time = np.asarray(time, dtype=float).ravel()
+        self.nsubsteps = len(self.time)
+
+        if ramp is None:
+            ramp = {}
+
+        if boundaries is None:
+            boundaries = {}
+
+        self.ramp = dict(ramp)
+        self.boundaries = boundaries
+        self.dt = dt
+        self.safety = safety
+        self.damping = damping
+        self.velocity = velocity
+        self.mass = None
+        self.increments = 0
+
+    def stable_time_step(self):
+        r"""Return the estimated stable time increment of the central difference
+        method, multiplied by the safety factor.
+
+        Returns
+        -------
+        float
+            The estimated stable time increment.
+
+        Notes
+        -----
+        The dilatational (P-wave) modulus of the cells is taken from the normal
+        components of the hessian of the materials of all solid bodies at their current
+        state. For a :class:`~felupe.SolidBodyNearlyIncompressible`, the bulk modulus
+        is added.
+        """
+
+        omega = []
+
+        for item in self.items:
+            if not hasattr(item, "umat") or not hasattr(item.results, "kinematics"):
+                continue
+
+            region = item.field.region
+            dim = item.field[0].dim
+            npoints = region.mesh.cells.shape[1]
+
+            # dilatational (P-wave) modulus of the cells
+            hessian = item.umat.hessian(
+                [*item.results.kinematics, item.results.statevars]
+            )[0]
+            i = np.arange(dim)
+            modulus = hessian[i, i, i, i].max(axis=0).mean(axis=0)
+            modulus = modulus + getattr(item, "bulk", 0.0)
+
+            # uniform gradients of the shape functions of the cells
+            V = region.dV.sum(axis=0)
+            b = np.einsum("ajqc,qc->caj", region.dhdX, region.dV) / V.reshape(-1, 1, 1)
+
+            wave_speed_squared = modulus / self.density
+            omega.append(
+                np.sqrt(npoints * wave_speed_squared * (b**2).sum(axis=(1, 2)))
+            )
+
+        if len(omega) == 0:
+            raise ValueError(
+                "The stable time increment can't be estimated. Provide `dt`."
+            )
+
+        return self.safety * 2 / np.concatenate(omega).max()
+
+    def _update(self, time):
+        "Update the ramped items and boundaries at a given time."
+
+        for item, values in self.ramp.items():
+            item.update(_interpolate(time, self.time, values))
+
+    def generate(self, **kwargs):
+        """Yield the results at the given times.
+
+        Parameters
+        ----------
+        **kwargs : dict, optional
+            Optional keyword arguments. The keyword ``x0`` is used as the global field
+            container, the keyword ``timer`` as a :class:`~felupe.tools.Timer` and the
+            keyword ``parallel`` of the dict ``kwargs``. All other keyword arguments,
+            e.g. of :func:`~felupe.newtonrhapson`, are ignored.
+        """
+
+        if "x0" not in kwargs.keys():
+            field = self.items[0].field
+        else:
+            field = kwargs["x0"]
+
+        if len(field.fields) > 1:
+            raise NotImplementedError(
+                "Explicit time integration is only implemented for displacement fields."
+            )
+
+        parallel = kwargs.get("kwargs", {}).get("parallel", False)
+
+        timer = kwargs.get("timer")
+        if timer is None:
+            timer = Timer()
+
+        if self.mass is None:
+            with timer("mass"):
+                self.mass = lumped_mass(field, self.density)
+
+        inverse_mass = np.divide(
+            1, self.mass, out=np.zeros_like(self.mass), where=self.mass > 0
+        )
+        shape = field[0].values.shape
+
+        u = field[0].values.ravel().copy()
+        v = np.zeros_like(u)
+        if self.velocity is not None:
+            v[:] = np.ravel(self.velocity)
+
+        def evaluate(u, v):
+            "Assemble the vectors and return the accelerations."
+
+            field[0].values[:] = u.reshape(shape)
+
+            with timer("fun"):
+                r = fun_items(self.items, field, parallel=parallel)
+
+            [item.results.update_statevars() for item in self.items]
+
+            a = -inverse_mass * r - self.damping * v
+            a[dof0] = 0
+
+            return r, a
+
+        # initial state
+        time = self.time[0]
+        self._update(time)
+
+        dof0, dof1 = partition(field, self.boundaries)
+        u[dof0] = apply(field, self.boundaries, dof0)
+        r, a = evaluate(u, v)
+
+        self.increments = 0
+
+        for t in self.time:
+            increments = 0
+
+            # re-estimate the stable time increment for the current state
+            dt = self.dt
+            if dt is None:
+                with timer("time-step"):
+                    dt = self.stable_time_step()
+
+            while t - time > 1e-12 * max(abs(t), dt):
+                h = min(dt, t - time)
+                u0 = u[dof0]
+
+                with timer("update"):
+                    v += h / 2 * a
+                    u += h * v
+
+                time += h
+                self._update(time)
+
+                u[dof0] = apply(field, self.boundaries, dof0)
+                v[dof0] = (u[dof0] - u0) / h
+
+                r, a = evaluate(u, v)
+                v += h / 2 * a
+
+                increments += 1
+
+            self.increments += increments
+            self.velocity = v.copy()
+
+            fnorm = np.linalg.norm(r[dof1]) / (
+                np.finfo(float).eps + np.linalg.norm(r[dof0])
+            )
+
+            yield NewtonResult(
+                x=field,
+                fun=r,
+                success=True,
+                iterations=increments,
+                fnorms=[fnorm],
+            )
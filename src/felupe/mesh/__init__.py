@@ -24,11 +24,15 @@ from ._line_rectangle_cube import cube_hexa as _cube_hexa
 from ._line_rectangle_cube import line_line as _line_line
 from ._line_rectangle_cube import rectangle_quad as _rectangle_quad
 from ._mesh import Mesh
+from ._partition import partition
 from ._read import read
+from ._renumber import renumber
+from ._search import SpatialIndex
 from ._tools import concatenate, expand, fill_between, flip, merge_duplicate_cells
 from ._tools import merge_duplicate_points
 from ._tools import merge_duplicate_points as sweep
 from ._tools import mirror, revolve, rotate, runouts, stack, translate, triangulate
+from ._topology import Topology
 
 __all__ = [
     "_cube_hexa",
@@ -53,7 +57,11 @@ __all__ = [
     "RectangleArbitraryOrderQuad",
     "Triangle",
     "Mesh",
+    "partition",
     "read",
+    "renumber",
+    "SpatialIndex",
+    "Topology",
     "concatenate",
     "expand",
     "flip",
@@ -21,8 +21,7 @@ from copy import deepcopy
 import numpy as np
 
 from ._mesh import Mesh
-from ._tools import merge_duplicate_points as sweep
-from ._tools import stack
+from ._tools import _merge_duplicate_points, stack
 
 
 class MeshContainer:
@@ -38,13 +37,19 @@ class MeshContainer:
     decimals : float or None, optional
         Precision decimals for merging duplicated mesh points. Only relevant if
         merge=True. Default is None.
+    tol : float or None, optional
+        If provided, mesh points with a distance less or equal to the tolerance are
+        merged. Only relevant if merge=True. Default is None.
 
     Notes
     -----
     All meshes are modified to refer to the same points array. By default, the points
     arrays from the given list of meshes is concatenated and the cells arrays are
-    modified accordingly. Optionally, the points array may be merged on duplicated
-    points.
+    modified accordingly. Meshes which already share a points array, e.g. the cell
+    blocks of a mesh file, refer to the same block of points in the container. The
+    blocks of points are concatenated only once on demand, i.e. when the points or the
+    meshes of the container are accessed. Optionally, the points array may be merged on
+    duplicated points.
 
     Examples
     --------
@@ -86,30 +91,87 @@ class MeshContainer:
 
     """
 
-    def __init__(self, meshes, merge=False, decimals=None):
+    def __init__(self, meshes, merge=False, decimals=None, tol=None):
         # obtain the dimension from the first mesh
         self.dim = meshes[0].dim
 
-        # init points and list of meshes
-        self.points = np.zeros((0, self.dim))
-        self.meshes = []
+        # init points, the blocks of points with their offsets and the list of meshes
+        self._points = np.zeros((0, self.dim))
+        self._blocks = []
+        self._offsets = []
+        self._npoints = 0
+        self._meshes = []
+        self._modified = False
 
         # append all meshes
         [self.append(mesh) for mesh in meshes]
 
         if merge:
-            self.merge_duplicate_points(decimals=decimals)
+            self.merge_duplicate_points(decimals=decimals, tol=tol)
+
+    @property
+    def points(self):
+        "The points array which is shared by all meshes."
+        self._concatenate()
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._concatenate()
+        self._points = points
+        self._blocks = [points]
+        self._offsets = [0]
+        self._npoints = len(points)
+        self._modified = False
+
+    @property
+    def meshes(self):
+        "The list of meshes."
+        self._concatenate()
+        return self._meshes
+
+    @meshes.setter
+    def meshes(self, meshes):
+        self._concatenate()
+        self._meshes = meshes
+        self._blocks = [self._points]
+        self._offsets = [0]
+        self._modified = False
+
+    def _concatenate(self):
+        "Concatenate the blocks of points and update the points of the meshes."
+
+        if self._modified:
+            if len(self._blocks) != 1 or self._blocks[0] is not self._points:
+                self._points = np.concatenate([self._points[:0], *self._blocks])
+
+            self._blocks = [self._points]
+            self._offsets = [0]
+
+            for mesh in self._meshes:
+                mesh.update(points=self._points)
+
+            self._modified = False
 
     def append(self, mesh):
         "Append a :class:`~felupe.Mesh` to the list of meshes."
 
-        # number of points
-        points = np.vstack([self.points, mesh.points])
-        self.meshes.append(Mesh(points, mesh.cells + len(self.points), mesh.cell_type))
+        # re-use the offset of an already appended points array
+        offset = None
 
-        # ensure identical points-arrays
-        for i, m in enumerate(self.meshes):
-            self.meshes[i].points = self.points = points
+        for block, block_offset in zip(self._blocks, self._offsets):
+            if mesh.points is block:
+                offset = block_offset
+
+        if offset is None:
+            offset = self._npoints
+            self._blocks.append(mesh.points)
+            self._offsets.append(offset)
+            self._npoints += len(mesh.points)
+
+        # the points of the new mesh are updated on demand
+        self._meshes.append(Mesh(self._points[:0], mesh.cells + offset, mesh.cell_type))
+        self._modified = True
 
     def pop(self, index):
         "Pop an item of the list of meshes."
@@ -120,17 +182,27 @@ class MeshContainer:
         "Return a list of tuples with cell-types and cell-connectivities."
         return [(mesh.cell_type, mesh.cells) for mesh in self.meshes]
 
-    def merge_duplicate_points(self, decimals=None):
-        "Merge duplicate points and update the meshes."
-
-        # sweep points
-        for i, mesh in enumerate(self.meshes):
-            self.meshes[i] = sweep(mesh, decimals=decimals)
+    def merge_duplicate_points(self, decimals=None, tol=None, boundary=False):
+        """Merge duplicate points and update the meshes. The duplicate points are
+        searched only once for the shared points array of all meshes."""
+
+        points, cells = _merge_duplicate_points(
+            self.points,
+            [mesh.cells for mesh in self.meshes],
+            [mesh.cell_type for mesh in self.meshes],
+            decimals=decimals,
+            tol=tol,
+            boundary=boundary,
+        )
 
         # ensure identical points-arrays
-        points = self.meshes[0].points
-        for i, m in enumerate(self.meshes):
-            self.meshes[i].points = self.points = points
+        self._points = points
+        self._blocks = [points]
+        self._offsets = [0]
+        self._npoints = len(points)
+
+        for mesh, c in zip(self._meshes, cells):
+            mesh.update(points=points, cells=c)
 
     def stack(self, idx=None):
         """Stack cell-blocks with same cell-types into a single mesh.
@@ -19,6 +19,7 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 import numpy as np
 
 from ._helpers import mesh_or_data
+from ._topology import unique_rows
 
 
 @mesh_or_data
@@ -177,7 +178,7 @@ def collect_edges(points, cells, cell_type):
     edges = np.sort(np.dstack(edges_to_stack).reshape(-1, 2), axis=1)
 
     # obtain unique edges and inverse mapping
-    edges_unique, inverse = np.unique(edges, False, True, False, 0)
+    edges_unique, inverse = unique_rows(edges, return_inverse=True)
 
     # calculate midpoints on edges as mean
     points_edges = np.mean(points[edges_unique.T], axis=0)
@@ -254,7 +255,7 @@ def collect_faces(points, cells, cell_type):
     faces = np.sort(np.dstack(faces_to_stack).reshape(-1, len(faces_to_stack)), axis=1)
 
     # obtain unique edges and inverse mapping
-    faces_unique, inverse = np.unique(faces, False, True, False, 0)
+    faces_unique, inverse = unique_rows(faces, return_inverse=True)
 
     # calculate midpoints on edges as mean
     points_faces = np.mean(points[faces_unique.T], axis=0)
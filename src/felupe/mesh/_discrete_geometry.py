@@ -19,6 +19,10 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 from copy import deepcopy
 
 import numpy as np
+from scipy.sparse import csr_matrix
+
+from ._search import SpatialIndex
+from ._topology import Topology
 
 
 class DiscreteGeometry:
@@ -56,6 +60,19 @@ class DiscreteGeometry:
         Array with points not connected to cells.
     cells_per_point : array
         Array which counts connected cells per point. Used for averaging results.
+    incidence_matrix : scipy.sparse.csr_matrix
+        Sparse incidence matrix which sums values at the points of the cells to the
+        mesh-points (cached).
+    averaging_matrix : scipy.sparse.csr_matrix
+        Sparse matrix which averages values at the points of the cells at the
+        mesh-points (cached).
+    topology : Topology
+        The lazily evaluated topology of the mesh with the point-to-cell adjacency,
+        the edges, faces and facets as well as the neighbours of the cells (cached).
+    spatial_index : SpatialIndex
+        The spatial search index of the cells (cached).
+    structured : tuple of int or None
+        The number of points per axis of a structured grid, or None.
 
     See Also
     --------
@@ -70,6 +87,14 @@ class DiscreteGeometry:
 
         self.update()
 
+    def __getstate__(self):
+        "Exclude the cache from (deep-) copies and pickles."
+
+        state = self.__dict__.copy()
+        state.pop("_cache", None)
+
+        return state
+
     def copy(self, points=None, cells=None, cell_type=None):
         """Return a deepcopy."""
 
@@ -126,30 +151,175 @@ class DiscreteGeometry:
         if cell_type is not None:
             self.cell_type = cell_type
 
+        # clear the cache of arrays which depend on the cells
+        self._cache = {}
+
         # obtain dimensions
         self.npoints, self.dim = self.points.shape
         self.ndof = self.points.size
         self.ncells = self.cells.shape[0]
 
+        if callable(callback):
+            callback(self)
+
+    def _cached(self, name, evaluate):
+        """Return a cached item which depends on the cells, the cell type and the
+        number of points. The cache is cleared on :meth:`update` or if the cells-array
+        is replaced."""
+
+        cache = self.__dict__.setdefault("_cache", {})
+        key = (len(self.points), self.cell_type)
+
+        if cache.get("cells") is not self.cells or cache.get("key") != key:
+            cache.clear()
+            cache.update(cells=self.cells, key=key)
+
+        if name not in cache:
+            cache[name] = evaluate()
+
+        return cache[name]
+
+    def _cells_per_point(self):
+        "Return the number of cells per point and the points with and without cells."
+
+        npoints = len(self.points)
+
         # get number of cells per point
-        points_in_cell, self.cells_per_point = np.unique(self.cells, return_counts=True)
+        cells_per_point = np.bincount(
+            self.cells.ravel().astype(int), minlength=npoints
+        )[:npoints]
 
         # check if there are points without cells
-        if self.npoints != len(self.cells_per_point):
-            self.point_has_cell = np.isin(np.arange(self.npoints), points_in_cell)
+        point_has_cell = cells_per_point > 0
+
+        if np.any(~point_has_cell):
             # update "cells_per_point" ... cells per point
-            cells_per_point = -np.ones(self.npoints, dtype=int)
-            cells_per_point[points_in_cell] = self.cells_per_point
-            self.cells_per_point = cells_per_point
+            cells_per_point[~point_has_cell] = -1
 
-            self.points_without_cells = np.arange(self.npoints)[~self.point_has_cell]
-            self.points_with_cells = np.arange(self.npoints)[self.point_has_cell]
+            points_without_cells = np.arange(npoints)[~point_has_cell]
+            points_with_cells = np.arange(npoints)[point_has_cell]
         else:
-            self.points_without_cells = np.array([], dtype=int)
-            self.points_with_cells = np.arange(self.npoints)
+            points_without_cells = np.array([], dtype=int)
+            points_with_cells = np.arange(npoints)
 
-        if callable(callback):
-            callback(self)
+        return cells_per_point, point_has_cell, points_with_cells, points_without_cells
+
+    def _set_cells_per_point(self, index, value):
+        """Replace an item of the (cached) number of cells per point and the points with
+        and without cells. The cache is cleared on :meth:`update`."""
+
+        items = list(self._cached("cells_per_point", self._cells_per_point))
+        items[index] = value
+        self._cache["cells_per_point"] = tuple(items)
+
+    @property
+    def cells_per_point(self):
+        "Return the (cached) number of cells per point (-1 for points without cells)."
+        return self._cached("cells_per_point", self._cells_per_point)[0]
+
+    @cells_per_point.setter
+    def cells_per_point(self, value):
+        self._set_cells_per_point(0, value)
+
+    @property
+    def point_has_cell(self):
+        "Return a (cached) mask of the points with cells."
+        return self._cached("cells_per_point", self._cells_per_point)[1]
+
+    @point_has_cell.setter
+    def point_has_cell(self, value):
+        self._set_cells_per_point(1, value)
+
+    @property
+    def points_with_cells(self):
+        "Return the (cached) ids of the points with cells."
+        return self._cached("cells_per_point", self._cells_per_point)[2]
+
+    @points_with_cells.setter
+    def points_with_cells(self, value):
+        self._set_cells_per_point(2, value)
+
+    @property
+    def points_without_cells(self):
+        "Return the (cached) ids of the points without cells."
+        return self._cached("cells_per_point", self._cells_per_point)[3]
+
+    @points_without_cells.setter
+    def points_without_cells(self, value):
+        self._set_cells_per_point(3, value)
+
+    @property
+    def incidence_matrix(self):
+        """Return the (cached) sparse incidence matrix of shape ``(npoints, ncells *
+        points_per_cell)``. The product with an array of values at the points of the
+        cells (in cell-major order) sums the values at the mesh-points.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import felupe as fem
+        >>>
+        >>> mesh = fem.Rectangle(n=3)
+        >>> mesh.incidence_matrix @ np.ones(mesh.cells.size)
+        array([1., 2., 1., 2., 4., 2., 1., 2., 1.])
+        """
+
+        def evaluate():
+            cells = self.cells.ravel()
+            return csr_matrix(
+                (np.ones(len(cells)), (cells, np.arange(len(cells)))),
+                shape=(len(self.points), len(cells)),
+            )
+
+        return self._cached("incidence_matrix", evaluate)
+
+    @property
+    def averaging_matrix(self):
+        """Return the (cached) sparse averaging matrix of shape ``(npoints, ncells *
+        points_per_cell)``. The product with an array of values at the points of the
+        cells (in cell-major order) averages the values at the mesh-points. Rows of
+        points without cells are empty.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import felupe as fem
+        >>>
+        >>> mesh = fem.Rectangle(n=3)
+        >>> values = np.arange(mesh.ncells).repeat(mesh.cells.shape[1])
+        >>> mesh.averaging_matrix @ values
+        array([0. , 0.5, 1. , 1. , 1.5, 2. , 2. , 2.5, 3. ])
+        """
+
+        def evaluate():
+            incidence = self.incidence_matrix
+            count = np.asarray(incidence.sum(axis=1)).ravel()
+            scale = np.divide(1, count, out=np.zeros_like(count), where=count > 0)
+            return csr_matrix(incidence.multiply(scale.reshape(-1, 1)))
+
+        return self._cached("averaging_matrix", evaluate)
+
+    @property
+    def topology(self):
+        """Return the (cached) lazily evaluated topology of the mesh.
+
+        Examples
+        --------
+        >>> import felupe as fem
+        >>>
+        >>> mesh = fem.Rectangle(n=3)
+        >>> mesh.topology.point_cells[4].indices
+        array([0, 1, 2, 3], dtype=int32)
+
+        See Also
+        --------
+        felupe.mesh.Topology : The lazily evaluated and cached topology of a mesh.
+        """
+
+        return self._cached(
+            "topology",
+            lambda: Topology(self.cells, self.cell_type, len(self.points)),
+        )
 
     @property
     def x(self):
@@ -165,3 +335,57 @@ class DiscreteGeometry:
     def z(self):
         "Return the third column (z-component) of the points array."
         return self.points[:, 2]
+
+    @property
+    def spatial_index(self):
+        """Return the (cached) spatial search index of the cells.
+
+        Examples
+        --------
+        >>> import felupe as fem
+        >>>
+        >>> mesh = fem.Rectangle(n=3)
+        >>> mesh.spatial_index.nearest([[0.3, 0.8]])
+        array([[2]])
+
+        See Also
+        --------
+        felupe.mesh.SpatialIndex : A spatial search index of the cells of a mesh.
+        """
+
+        return self._cached(
+            "spatial_index", lambda: SpatialIndex(self.points, self.cells)
+        )
+
+    @property
+    def structured(self):
+        """Return the number of points per axis ``(nx, ny, nz)`` of a structured grid
+        or None if the mesh is not a structured grid. The points of a structured grid
+        are numbered by ``i + nx * j + nx * ny * k`` for the grid indices ``(i, j, k)``
+        and the cells are ordered in the same way. The flag is reset if the cells are
+        replaced, e.g. by :meth:`update`, or if the number of points is changed.
+
+        Examples
+        --------
+        >>> import felupe as fem
+        >>>
+        >>> mesh = fem.Rectangle(n=(3, 4))
+        >>> mesh.structured
+        (3, 4)
+
+        >>> mesh.triangulate().structured is None
+        True
+        """
+
+        structured = self.__dict__.get("_structured")
+
+        if structured is not None and structured[0] is self.cells:
+            if len(self.points) == np.prod(structured[1]):
+                return structured[1]
+
+    @structured.setter
+    def structured(self, shape):
+        self._structured = None
+
+        if shape is not None:
+            self._structured = (self.cells, tuple(int(n) for n in shape))
@@ -105,6 +105,7 @@ class Line(Mesh):
         points, cells, cell_type = line_line(a, b, n)
 
         super().__init__(points, cells, cell_type)
+        self.structured = (n,)
 
 
 class Rectangle(Mesh):
@@ -159,6 +160,7 @@ class Rectangle(Mesh):
         points, cells, cell_type = rectangle_quad(a, b, n)
 
         super().__init__(points, cells, cell_type)
+        self.structured = np.broadcast_to(n, 2)
 
 
 class Cube(Mesh):
@@ -214,6 +216,7 @@ class Cube(Mesh):
         points, cells, cell_type = cube_hexa(a, b, n)
 
         super().__init__(points, cells, cell_type)
+        self.structured = np.broadcast_to(n, 3)
 
 
 class Grid(Mesh):
@@ -281,6 +284,9 @@ class Grid(Mesh):
             .T
         )
 
+        if indexing == "ij":
+            self.structured = shape
+
 
 class RectangleArbitraryOrderQuad(Rectangle):
     """A rectangular 2d-mesh with an arbitrarr-order Lagrange quad between ``a`` and
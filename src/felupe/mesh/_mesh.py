@@ -20,7 +20,6 @@ from functools import wraps
 
 import numpy as np
 
-from ..tools._plot import ViewMesh
 from ._convert import (
     add_midpoints_edges,
     add_midpoints_faces,
@@ -32,6 +31,7 @@ from ._convert import (
 )
 from ._discrete_geometry import DiscreteGeometry
 from ._dual import dual
+from ._renumber import _permutations
 from ._tools import (
     expand,
     fill_between,
@@ -233,6 +233,8 @@ class Mesh(DiscreteGeometry):
         felupe.ViewMesh : Visualization methods for :class:`~felupe.Mesh`.
         """
 
+        from ..tools._plot import ViewMesh
+
         return ViewMesh(
             self,
             point_data=point_data,
@@ -355,7 +357,8 @@ class Mesh(DiscreteGeometry):
         array([990], dtype=int64)
 
         """
-        return np.argwhere(np.isin(self.cells, point_ids).any(axis=1))[:, 0]
+        point_cells = self.topology.point_cells[np.ravel(point_ids)]
+        return np.unique(point_cells.indices).astype(np.int64)
 
     def get_cell_ids_neighbours(self, cell_ids):
         """Return cell ids which share points with given cell ids.
@@ -758,13 +761,20 @@ class Mesh(DiscreteGeometry):
         """
         return as_mesh(revolve(self, n=n, phi=phi, axis=axis, expand_dim=expand_dim))
 
-    def merge_duplicate_points(self, decimals=None):
+    def merge_duplicate_points(self, decimals=None, tol=None, boundary=False):
         """Merge duplicate points and update cells of a Mesh.
 
         Parameters
         ----------
         decimals : int or None, optional
             Number of decimals for point coordinate comparison (default is None).
+        tol : float or None, optional
+            If provided, points with a distance less or equal to the tolerance are
+            merged (default is None). If None, points with equal (rounded) coordinates
+            are merged.
+        boundary : bool, optional
+            A flag to search for duplicates only at the points of the cells with facets
+            on the boundary (default is False).
 
         Returns
         -------
@@ -844,7 +854,9 @@ class Mesh(DiscreteGeometry):
         felupe.MeshContainer : A container which operates on a list of meshes with
             identical dimensions.
         """
-        return as_mesh(merge_duplicate_points(self, decimals=decimals))
+        return as_mesh(
+            merge_duplicate_points(self, decimals=decimals, tol=tol, boundary=boundary)
+        )
 
     @wraps(merge_duplicate_cells)
     def merge_duplicate_cells(self):
@@ -939,6 +951,81 @@ class Mesh(DiscreteGeometry):
         """
         return as_mesh(merge_duplicate_cells(self))
 
+    def renumber(self, method="rcm", sort_cells=True, return_permutations=False):
+        """Renumber the points and sort the cells of a Mesh to reduce the bandwidth of
+        the assembled sparse matrices and to improve the memory locality of the
+        point-data.
+
+        Parameters
+        ----------
+        method : str, optional
+            The renumbering method, one of ``"rcm"`` for the reverse Cuthill-McKee
+            ordering of the point-connectivity graph, ``"hilbert"`` or ``"morton"`` for
+            the ordering of the point coordinates along a Hilbert or a Morton (Z-order)
+            space-filling curve (default is ``"rcm"``).
+        sort_cells : bool, optional
+            A flag to sort the cells by their renumbered points (default is True).
+        return_permutations : bool, optional
+            A flag to return the permutations of the points and the cells (default is
+            False).
+
+        Returns
+        -------
+        Mesh
+            The renumbered mesh.
+        points_order : ndarray of int
+            The old point ids in the new order, i.e. ``new.points`` is equal to
+            ``mesh.points[points_order]``. Only returned if ``return_permutations`` is
+            True.
+        cells_order : ndarray of int
+            The old cell ids in the new order. Only returned if ``return_permutations``
+            is True.
+
+        Notes
+        -----
+        ..  warning::
+            This function re-sorts points and cells. Point- and cell-masks of the
+            original mesh must be permuted, e.g. ``mask[points_order]``. Boundary
+            conditions which select points by their coordinates are not affected.
+
+        Point-data of the renumbered mesh is mapped back to the original point ids by
+        ``values[np.argsort(points_order)]``.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import felupe as fem
+        >>>
+        >>> mesh = fem.Cube(n=6)
+        >>> new, points_order, cells_order = mesh.renumber(
+        >>>     method="rcm", return_permutations=True
+        >>> )
+        >>> np.allclose(new.points, mesh.points[points_order])
+        True
+
+        See Also
+        --------
+        felupe.mesh.renumber : Renumber the points and sort the cells of a Mesh.
+        """
+
+        points_order, cells_order = _permutations(
+            self.points, self.cells, method=method, sort_cells=sort_cells
+        )
+
+        inverse = np.empty(self.npoints, dtype=int)
+        inverse[points_order] = np.arange(self.npoints)
+
+        mesh = Mesh(
+            points=self.points[points_order],
+            cells=inverse[self.cells[cells_order]],
+            cell_type=self.cell_type,
+        )
+
+        if return_permutations:
+            return mesh, points_order, cells_order
+
+        return mesh
+
     def fill_between(self, other_mesh, n=11):
         """Fill a 2d-Quad Mesh between two 1d-Line Meshes, embedded in 2d-space, or a
         3d-Hexahedron Mesh between two 2d-Quad Meshes, embedded in 3d-space, by expansion.
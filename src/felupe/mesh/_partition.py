@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+
+from ._renumber import _permutations
+
+
+def _bisection(centroids, cells, parts, labels, offset=0):
+    """Recursive coordinate bisection of the cells along the axis with the largest
+    extent of the centroids. The number of cells of the halves is proportional to the
+    number of parts of the halves."""
+
+    if parts == 1:
+        labels[cells] = offset
+        return labels
+
+    left = parts // 2
+    points = centroids[cells]
+    axis = np.argmax(np.ptp(points, axis=0))
+    order = cells[np.argsort(points[:, axis], kind="stable")]
+    split = int(round(len(cells) * left / parts))
+
+    _bisection(centroids, order[:split], left, labels, offset)
+    _bisection(centroids, order[split:], parts - left, labels, offset + left)
+
+    return labels
+
+
+def partition(mesh, parts=2, method="bisection"):
+    """Partition the cells of a mesh into a given number of subdomains with (almost)
+    equal numbers of cells.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        The mesh to be partitioned.
+    parts : int, optional
+        The number of subdomains (default is 2).
+    method : str, optional
+        The partitioning method, one of ``"bisection"`` for the recursive coordinate
+        bisection of the cell centroids, ``"rcm"`` for contiguous blocks of cells
+        ordered by the reverse Cuthill-McKee ordering of the point-connectivity graph,
+        ``"hilbert"`` or ``"morton"`` for contiguous blocks of cells ordered along a
+        Hilbert or a Morton (Z-order) space-filling curve (default is
+        ``"bisection"``).
+
+    Returns
+    -------
+    ndarray of int
+        The subdomain ids of the cells.
+
+    Notes
+    -----
+    The recursive coordinate bisection splits the cells at the median of the cell
+    centroids along the axis with the largest extent, until the given number of
+    subdomains is reached. The other methods split the ordered cells, see
+    :func:`~felupe.mesh.renumber`, into contiguous blocks. All methods return
+    subdomains with (almost) equal numbers of cells.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Rectangle(n=5)
+    >>> fem.mesh.partition(mesh, parts=4)
+    array([0, 0, 2, 2, 0, 0, 2, 2, 1, 1, 3, 3, 1, 1, 3, 3])
+
+    See Also
+    --------
+    felupe.mesh.renumber : Renumber the points and sort the cells of a Mesh.
+    felupe.SolidBodyDecomposed : A solid body, decomposed into subdomains, which are
+        assembled in separate processes.
+    """
+
+    points = np.asarray(mesh.points)
+    cells = np.asarray(mesh.cells)
+    ncells = len(cells)
+
+    if parts < 1 or parts > ncells:
+        raise ValueError("The number of parts must be between 1 and the cells.")
+
+    labels = np.zeros(ncells, dtype=int)
+
+    if method == "bisection":
+        centroids = points[cells].mean(axis=1)
+        return _bisection(centroids, np.arange(ncells), parts, labels)
+
+    cells_order = _permutations(points, cells, method=method, sort_cells=True)[1]
+
+    for label, block in enumerate(np.array_split(cells_order, parts)):
+        labels[block] = label
+
+    return labels
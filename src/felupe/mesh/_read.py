@@ -23,7 +23,13 @@ from ._mesh import Mesh
 
 
 def read(
-    filename, file_format=None, cellblock=None, dim=None, merge=False, decimals=None
+    filename,
+    file_format=None,
+    cellblock=None,
+    dim=None,
+    merge=False,
+    decimals=None,
+    tol=None,
 ):
     """Read a mesh from a file using :func:`meshio.read` and create a
     :class:`~felupe.MeshContainer`.
@@ -46,6 +52,9 @@ def read(
     decimals : float or None, optional
         Precision decimals for merging duplicated mesh points. Only relevant if
         merge=True. Default is None.
+    tol : float or None, optional
+        If provided, mesh points with a distance less or equal to the tolerance are
+        merged. Only relevant if merge=True. Default is None.
 
     Returns
     -------
@@ -100,4 +109,4 @@ def read(
     else:
         meshes = [Mesh(points, np.zeros((0, 0), dtype=int), None)]
 
-    return MeshContainer(meshes, merge=merge, decimals=decimals)
+    return MeshContainer(meshes, merge=merge, decimals=decimals, tol=tol)
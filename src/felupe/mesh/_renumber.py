@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ._helpers import mesh_or_data
+
+
+def _quantize(points, bits):
+    "Quantize the point coordinates to unsigned integers with a given number of bits."
+
+    lower = points.min(axis=0)
+    length = (points.max(axis=0) - lower).max()
+
+    if length == 0:
+        length = 1.0
+
+    scale = (2**bits - 1) / length
+    return ((points - lower) * scale).astype(np.uint64)
+
+
+def _interleave(X, bits):
+    "Interleave the bits of the columns of an unsigned integer array to a key."
+
+    npoints, dim = X.shape
+    key = np.zeros(npoints, dtype=np.uint64)
+    one = np.uint64(1)
+
+    for j in range(bits - 1, -1, -1):
+        for i in range(dim):
+            key = (key << one) | ((X[:, i] >> np.uint64(j)) & one)
+
+    return key
+
+
+def _morton(points, bits):
+    "Return the keys of the points on a Morton (Z-order) curve."
+
+    return _interleave(_quantize(points, bits), bits)
+
+
+def _hilbert(points, bits):
+    """Return the keys of the points on a Hilbert curve (J. Skilling, Programming the
+    Hilbert curve, AIP Conference Proceedings 707, 2004)."""
+
+    X = _quantize(points, bits)
+    dim = X.shape[1]
+    M = np.uint64(1 << (bits - 1))
+
+    # inverse undo
+    Q = M
+    while Q > 1:
+        P = Q - np.uint64(1)
+        for i in range(dim):
+            mask = (X[:, i] & Q) > 0
+            X[mask, 0] ^= P
+            t = (X[~mask, 0] ^ X[~mask, i]) & P
+            X[~mask, 0] ^= t
+            X[~mask, i] ^= t
+        Q >>= np.uint64(1)
+
+    # gray encode
+    for i in range(1, dim):
+        X[:, i] ^= X[:, i - 1]
+
+    t = np.zeros(len(X), dtype=np.uint64)
+    Q = M
+    while Q > 1:
+        mask = (X[:, dim - 1] & Q) > 0
+        t[mask] ^= Q - np.uint64(1)
+        Q >>= np.uint64(1)
+
+    X ^= t.reshape(-1, 1)
+
+    return _interleave(X, bits)
+
+
+def _permutations(points, cells, method="rcm", sort_cells=True):
+    """Return the permutations of the points and the cells of a mesh.
+
+    The permutations are arrays of old indices in the new order, i.e. the renumbered
+    points are given by ``points[points_order]`` and the renumbered cells by
+    ``inverse[cells[cells_order]]``, where ``inverse`` is the inverse permutation of
+    the points.
+    """
+
+    points = np.asarray(points)
+    cells = np.asarray(cells)
+    npoints, dim = points.shape
+
+    if method == "rcm":
+        from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+        # point-connectivity graph, points are connected if they share a cell
+        ncells, points_per_cell = cells.shape
+        incidence = csr_matrix(
+            (
+                np.ones(cells.size),
+                (cells.ravel(), np.repeat(np.arange(ncells), points_per_cell)),
+            ),
+            shape=(npoints, ncells),
+        )
+        graph = (incidence @ incidence.T).tocsr()
+        points_order = reverse_cuthill_mckee(graph, symmetric_mode=True)
+
+    elif method in ["hilbert", "morton"]:
+        # the keys of a 64-bit integer are split between the dimensions
+        bits = 64 // dim - 1
+        key = {"hilbert": _hilbert, "morton": _morton}[method](points, bits)
+        points_order = np.argsort(key, kind="stable")
+
+    else:
+        raise ValueError('Method must be one of "rcm", "hilbert" or "morton".')
+
+    points_order = np.asarray(points_order, dtype=int)
+
+    inverse = np.empty(npoints, dtype=int)
+    inverse[points_order] = np.arange(npoints)
+
+    cells_order = np.arange(len(cells))
+
+    if sort_cells and len(cells) > 0:
+        # sort the cells by their first and mean renumbered point
+        cells_new = inverse[cells]
+        cells_order = np.lexsort((cells_new.mean(axis=1), cells_new.min(axis=1)))
+
+    return points_order, cells_order
+
+
+@mesh_or_data
+def renumber(points, cells, cell_type, method="rcm", sort_cells=True):
+    """Renumber the points and sort the cells of a Mesh to reduce the bandwidth of the
+    assembled sparse matrices and to improve the memory locality of the point-data.
+
+    Parameters
+    ----------
+    points : list or ndarray
+        Original point coordinates.
+    cells : list or ndarray
+        Original point-connectivity of cells.
+    cell_type : str
+        A string in VTK-convention that specifies the cell type.
+    method : str, optional
+        The renumbering method, one of ``"rcm"`` for the reverse Cuthill-McKee
+        ordering of the point-connectivity graph, ``"hilbert"`` or ``"morton"`` for the
+        ordering of the point coordinates along a Hilbert or a Morton (Z-order)
+        space-filling curve (default is ``"rcm"``).
+    sort_cells : bool, optional
+        A flag to sort the cells by their renumbered points (default is True).
+
+    Returns
+    -------
+    points : ndarray
+        Modified point coordinates.
+    cells : ndarray
+        Modified point-connectivity of cells.
+    cell_type : str or None
+        A string in VTK-convention that specifies the cell type.
+
+    Notes
+    -----
+    ..  warning::
+        This function re-sorts points and cells. Use
+        :meth:`Mesh.renumber(return_permutations=True) <felupe.Mesh.renumber>` to
+        obtain the permutations.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Rectangle(n=6)
+    >>> mesh = fem.mesh.renumber(mesh, method="rcm")
+
+    See Also
+    --------
+    felupe.Mesh.renumber : Renumber the points and sort the cells of a Mesh.
+    """
+
+    points = np.asarray(points)
+    cells = np.asarray(cells)
+
+    points_order, cells_order = _permutations(
+        points, cells, method=method, sort_cells=sort_cells
+    )
+
+    inverse = np.empty(len(points), dtype=int)
+    inverse[points_order] = np.arange(len(points))
+
+    return points[points_order], inverse[cells[cells_order]], cell_type
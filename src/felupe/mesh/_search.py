@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+
+
+class SpatialIndex:
+    r"""A spatial search index of the cells of a mesh, based on a KD-tree of the cell
+    centroids.
+
+    Parameters
+    ----------
+    points : ndarray
+        Point coordinates.
+    cells : ndarray
+        Point-connectivity of cells.
+
+    Attributes
+    ----------
+    centroids : ndarray
+        The centroids of the cells.
+    radius : ndarray
+        The radius of the cells, i.e. the maximum distance of the points of a cell to
+        its centroid.
+    lower : ndarray
+        The lower corners of the bounding boxes of the cells.
+    upper : ndarray
+        The upper corners of the bounding boxes of the cells.
+    tree : scipy.spatial.cKDTree
+        The KD-tree of the centroids of the cells.
+
+    Notes
+    -----
+    The spatial index of a mesh is available as :attr:`Mesh.spatial_index
+    <felupe.Mesh.spatial_index>`. It is cached and re-created after the mesh is
+    updated by :meth:`Mesh.update <felupe.Mesh.update>`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Rectangle(n=3)
+    >>> points, cells = mesh.spatial_index.candidates([[0.3, 0.8]])
+    >>> cells
+    array([2])
+    """
+
+    def __init__(self, points, cells):
+        from scipy.spatial import cKDTree
+
+        cell_points = points[cells]
+
+        self.centroids = cell_points.mean(axis=1)
+        self.radius = np.linalg.norm(
+            cell_points - self.centroids.reshape(-1, 1, points.shape[1]), axis=2
+        ).max(axis=1)
+        self.lower = cell_points.min(axis=1)
+        self.upper = cell_points.max(axis=1)
+        self.tree = cKDTree(self.centroids)
+
+    def nearest(self, points, k=1):
+        """Return the ids of the ``k`` cells with the nearest centroids for each point
+        as array of shape ``(npoints, k)``."""
+
+        k = min(k, len(self.centroids))
+        cells = self.tree.query(np.asarray(points, dtype=float), k=k)[1]
+
+        return cells.reshape(len(points), k)
+
+    def candidates(self, points, tol=1e-8):
+        """Return the pairs of point- and cell-ids for all cells with a bounding box
+        which contains the given points.
+
+        Parameters
+        ----------
+        points : ndarray
+            The coordinates of the query points.
+        tol : float, optional
+            The relative tolerance of the bounding boxes (default is 1e-8).
+
+        Returns
+        -------
+        ndarray
+            The ids of the points.
+        ndarray
+            The ids of the cells.
+        """
+
+        points = np.asarray(points, dtype=float)
+
+        # cells with centroids within the largest radius
+        neighbours = self.tree.query_ball_point(points, r=self.radius.max() * (1 + tol))
+        lengths = np.array([len(n) for n in neighbours], dtype=int)
+
+        point_ids = np.repeat(np.arange(len(points)), lengths)
+        cell_ids = np.zeros(lengths.sum(), dtype=int)
+
+        if len(cell_ids) > 0:
+            cell_ids = np.concatenate(neighbours).astype(int)
+
+        # keep only the cells with bounding boxes which contain the points
+        eps = tol * self.radius[cell_ids].reshape(-1, 1)
+        mask = np.all(
+            (points[point_ids] >= self.lower[cell_ids] - eps)
+            & (points[point_ids] <= self.upper[cell_ids] + eps),
+            axis=1,
+        )
+
+        return point_ids[mask], cell_ids[mask]
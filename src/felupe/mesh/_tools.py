@@ -17,10 +17,11 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import numpy as np
-from scipy.interpolate import griddata
+from scipy.sparse import csr_matrix
 
 from ..math import rotation_matrix, transpose
 from ._helpers import mesh_or_data
+from ._topology import Topology
 
 
 @mesh_or_data
@@ -183,6 +184,8 @@ def fill_between(mesh, other_mesh, n=11):
 
     """
 
+    from scipy.interpolate import griddata
+
     if not hasattr(n, "__len__"):
         n = np.linspace(-1, 1, n)
 
@@ -365,8 +368,84 @@ def revolve(points, cells, cell_type, n=11, phi=180, axis=0, expand_dim=True):
     return points_new, cells_new, cell_type_new
 
 
+def _duplicate_points(points, tol=None):
+    """Return the labels of the points, where duplicate points share the label of the
+    first point of the duplicates. Points are duplicates if their coordinates are equal
+    or, if a tolerance is given, if their distance is less or equal to the tolerance
+    (or if they are connected by a chain of such points)."""
+
+    npoints = len(points)
+
+    if tol is None:
+        # sort the points lexicographically and compare neighbours
+        order = np.lexsort(points.T[::-1])
+        first = np.ones(npoints, dtype=bool)
+        first[1:] = np.any(points[order[1:]] != points[order[:-1]], axis=1)
+
+        # the sort is stable, the first point of sorted duplicates has the lowest id
+        labels = np.empty(npoints, dtype=int)
+        labels[order] = order[first][np.cumsum(first) - 1]
+
+    else:
+        from scipy.sparse.csgraph import connected_components
+        from scipy.spatial import cKDTree
+
+        # connected components of all pairs of points within the tolerance
+        pairs = cKDTree(points).query_pairs(r=tol, output_type="ndarray")
+        graph = csr_matrix(
+            (np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])),
+            shape=(npoints, npoints),
+        )
+        components = connected_components(graph, directed=False)[1]
+
+        # the first point of the components has the lowest id
+        index = np.unique(components, return_index=True)[1]
+        labels = index[components]
+
+    return labels
+
+
+def _merge_duplicate_points(
+    points, cells, cell_types, decimals=None, tol=None, boundary=False
+):
+    """Merge duplicate points of a list of cells-arrays with a shared points-array.
+    Returns the merged points and the list of updated cells-arrays."""
+
+    points = np.asarray(points)
+    cells = [np.asarray(c) for c in cells]
+
+    if decimals is not None:
+        points = np.round(points, decimals)
+
+    # candidate points for duplicates
+    candidates = np.arange(len(points))
+
+    if boundary:
+        candidates = []
+
+        for c, cell_type in zip(cells, cell_types):
+            topology = Topology(c, cell_type, len(points))
+            candidates.append(c[topology.facets_cells[topology.boundary, 0]].ravel())
+
+        candidates = np.unique(np.concatenate(candidates))
+
+    labels = np.arange(len(points))
+    labels[candidates] = candidates[_duplicate_points(points[candidates], tol=tol)]
+
+    # keep the first points of the duplicates, sorted lexicographically
+    keep = np.nonzero(labels == np.arange(len(points)))[0]
+    keep = keep[np.lexsort(points[keep].T[::-1])]
+
+    inverse = np.empty(len(points), dtype=int)
+    inverse[keep] = np.arange(len(keep))
+
+    return points[keep], [inverse[labels[c]] for c in cells]
+
+
 @mesh_or_data
-def merge_duplicate_points(points, cells, cell_type, decimals=None):
+def merge_duplicate_points(
+    points, cells, cell_type, decimals=None, tol=None, boundary=False
+):
     """Merge duplicate points and update cells of a Mesh.
 
     Parameters
@@ -379,6 +458,15 @@ def merge_duplicate_points(points, cells, cell_type, decimals=None):
         A string in VTK-convention that specifies the cell type.
     decimals : int or None, optional
         Number of decimals for point coordinate comparison (default is None).
+    tol : float or None, optional
+        If provided, points with a distance less or equal to the tolerance are merged
+        (default is None). The pairs of points within the tolerance are obtained by a
+        KD-tree. If None, points with equal (rounded) coordinates are merged.
+    boundary : bool, optional
+        A flag to search for duplicates only at the points of the cells with facets on
+        the boundary, see :attr:`Mesh.topology <felupe.Mesh.topology>`. Duplicate
+        points of stacked meshes are located on the boundaries of the meshes (default
+        is False).
 
     Returns
     -------
@@ -397,6 +485,9 @@ def merge_duplicate_points(points, cells, cell_type, decimals=None):
     ..  note::
         This function does not merge duplicate cells.
 
+    The duplicate points are merged to the first point of the duplicates. The cells are
+    updated by one lookup of the new point ids, i.e. ``cells_new = inverse[cells]``.
+
     Examples
     --------
     Two quad meshes to be merged overlap some points. Merge these duplicated
@@ -460,27 +551,11 @@ def merge_duplicate_points(points, cells, cell_type, decimals=None):
         dimensions.
     """
 
-    if decimals is None:
-        points_rounded = points
-    else:
-        points_rounded = np.round(points, decimals)
-
-    points_new, index, inverse, counts = np.unique(
-        points_rounded, True, True, True, axis=0
+    points, (cells,) = _merge_duplicate_points(
+        points, [cells], [cell_type], decimals=decimals, tol=tol, boundary=boundary
     )
 
-    original = np.arange(len(points))
-
-    mask = inverse != original
-    find = original[mask]
-    replace = inverse[mask]
-
-    cells_new = cells.copy()
-
-    for i, j in zip(find, replace):
-        cells_new[cells == i] = j
-
-    return points_new, cells_new, cell_type
+    return points, cells, cell_type
 
 
 @mesh_or_data
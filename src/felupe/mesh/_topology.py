@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from functools import cached_property
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+def unique_rows(array, return_index=False, return_inverse=False, return_counts=False):
+    """Find the unique rows of a two-dimensional array of non-negative integers. This
+    is equivalent to ``np.unique(array, axis=0)``, but the rows are hashed to
+    one-dimensional integer keys before sorting.
+
+    Parameters
+    ----------
+    array : ndarray of int
+        The two-dimensional input array.
+    return_index : bool, optional
+        If True, also return the indices of the first occurences of the unique rows.
+    return_inverse : bool, optional
+        If True, also return the indices of the unique rows to reconstruct the array.
+    return_counts : bool, optional
+        If True, also return the number of times each unique row appears.
+
+    Returns
+    -------
+    unique : ndarray
+        The sorted unique rows.
+    index : ndarray, optional
+        The indices of the first occurences of the unique rows.
+    inverse : ndarray, optional
+        The indices of the unique rows to reconstruct the array.
+    counts : ndarray, optional
+        The number of times each unique row appears.
+    """
+
+    array = np.asarray(array)
+
+    if array.size == 0:
+        return np.unique(array, return_index, return_inverse, return_counts, axis=0)
+
+    lower = int(array.min())
+    base = int(array.max()) - lower + 1
+
+    # lexicographic hash of the rows, the keys are compressed to their ranks before
+    # they would overflow
+    key = array[:, 0].astype(np.int64) - lower
+    for column in array[:, 1:].T:
+        if (int(key.max()) + 1) * base >= 2**63:
+            key = np.unique(key, return_inverse=True)[1].reshape(-1)
+        key = key * base + (column - lower)
+
+    keys, index, inverse, counts = np.unique(
+        key, return_index=True, return_inverse=True, return_counts=True
+    )
+
+    out = [array[index]]
+
+    if return_index:
+        out.append(index)
+
+    if return_inverse:
+        out.append(inverse.reshape(-1))
+
+    if return_counts:
+        out.append(counts)
+
+    if len(out) == 1:
+        return out[0]
+
+    return tuple(out)
+
+
+# local point ids of the edges and of the facets (the faces of volume cells and the
+# edges of area cells) of the corner points of the base cell-types
+edges = {
+    "line": [[0, 1]],
+    "triangle": [[0, 1], [1, 2], [2, 0]],
+    "tetra": [[0, 1], [1, 2], [2, 0], [3, 0], [3, 1], [3, 2]],
+    "quad": [[0, 1], [1, 2], [2, 3], [3, 0]],
+    "hexahedron": [
+        [0, 1],
+        [1, 2],
+        [2, 3],
+        [3, 0],
+        [4, 5],
+        [5, 6],
+        [6, 7],
+        [7, 4],
+        [0, 4],
+        [1, 5],
+        [2, 6],
+        [3, 7],
+    ],
+}
+
+facets = {
+    "line": [[0], [1]],
+    "triangle": edges["triangle"],
+    "tetra": [[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]],
+    "quad": edges["quad"],
+    "hexahedron": [
+        [0, 3, 7, 4],
+        [1, 2, 6, 5],
+        [1, 0, 4, 5],
+        [2, 3, 7, 6],
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+    ],
+}
+
+faces = {
+    "triangle": [[0, 1, 2]],
+    "tetra": facets["tetra"],
+    "quad": [[0, 1, 2, 3]],
+    "hexahedron": facets["hexahedron"],
+}
+
+
+def base_cell_type(cell_type):
+    "Return the cell type of the corner points of a (higher-order) cell type."
+
+    return {
+        "triangle6": "triangle",
+        "tetra10": "tetra",
+        "quad8": "quad",
+        "quad9": "quad",
+        "hexahedron20": "hexahedron",
+        "hexahedron27": "hexahedron",
+    }.get(cell_type, cell_type)
+
+
+class Topology:
+    r"""The lazily evaluated and cached topology of a mesh.
+
+    Parameters
+    ----------
+    cells : ndarray
+        Point-connectivity of cells.
+    cell_type : str or None
+        A string in VTK-convention that specifies the cell type.
+    npoints : int
+        Amount of points.
+
+    Attributes
+    ----------
+    point_cells : scipy.sparse.csr_matrix
+        The sparse point-to-cell adjacency of shape ``(npoints, ncells)``. The cell ids
+        of a point ``p`` are given by ``point_cells[p].indices``.
+    edges : ndarray
+        The unique edges (sorted corner point ids).
+    cells_edges : ndarray
+        The edge ids of the cells (inverse map).
+    faces : ndarray
+        The unique faces (sorted corner point ids). The face of an area cell is the cell
+        itself.
+    cells_faces : ndarray
+        The face ids of the cells (inverse map).
+    facets : ndarray
+        The unique facets (sorted corner point ids), i.e. the faces of volume cells and
+        the edges of area cells.
+    cells_facets : ndarray
+        The facet ids of the cells (inverse map).
+    facets_cells : ndarray
+        The ids of the (up to) two cells of the facets. A facet on the boundary has
+        only one cell and the second entry is ``-1``.
+    boundary : ndarray of bool
+        A mask of the facets on the boundary.
+    neighbours : ndarray
+        The ids of the neighbour cells of the cells, connected by the facets of the
+        cells. Entries of facets on the boundary are ``-1``.
+
+    Notes
+    -----
+    The topology of a mesh is available as :attr:`Mesh.topology
+    <felupe.Mesh.topology>`. It is cached and re-created after the mesh is updated
+    by :meth:`Mesh.update <felupe.Mesh.update>`. Only the corner points of
+    higher-order cells are considered for the edges, faces and facets.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Rectangle(n=3)
+    >>> mesh.topology.neighbours
+    array([[-1,  1,  2, -1],
+           [-1, -1,  3,  0],
+           [ 0,  3, -1, -1],
+           [ 1, -1, -1,  2]])
+
+    >>> mesh.topology.facets[mesh.topology.boundary]
+    array([[0, 1],
+           [0, 3],
+           [1, 2],
+           [2, 5],
+           [3, 6],
+           [5, 8],
+           [6, 7],
+           [7, 8]])
+    """
+
+    def __init__(self, cells, cell_type, npoints):
+        self.cells = cells
+        self.cell_type = cell_type
+        self.npoints = npoints
+
+    def _entities(self, table):
+        "Return the unique entities of the cells for a table of local point ids."
+
+        cell_type = base_cell_type(self.cell_type)
+
+        if cell_type not in table:
+            raise NotImplementedError(f"Cell type {self.cell_type} not supported.")
+
+        local = np.array(table[cell_type])
+        entities = np.sort(self.cells[:, local].reshape(-1, local.shape[1]), axis=1)
+
+        unique, inverse, counts = unique_rows(
+            entities, return_inverse=True, return_counts=True
+        )
+
+        return unique, inverse.reshape(len(self.cells), -1), counts
+
+    @cached_property
+    def point_cells(self):
+        ncells, points_per_cell = self.cells.shape
+        return csr_matrix(
+            (
+                np.ones(self.cells.size, dtype=np.int8),
+                (self.cells.ravel(), np.repeat(np.arange(ncells), points_per_cell)),
+            ),
+            shape=(self.npoints, ncells),
+        )
+
+    @cached_property
+    def _edges(self):
+        return self._entities(edges)
+
+    @property
+    def edges(self):
+        return self._edges[0]
+
+    @property
+    def cells_edges(self):
+        return self._edges[1]
+
+    @cached_property
+    def _faces(self):
+        return self._entities(faces)
+
+    @property
+    def faces(self):
+        return self._faces[0]
+
+    @property
+    def cells_faces(self):
+        return self._faces[1]
+
+    @cached_property
+    def _facets(self):
+        return self._entities(facets)
+
+    @property
+    def facets(self):
+        return self._facets[0]
+
+    @property
+    def cells_facets(self):
+        return self._facets[1]
+
+    @property
+    def boundary(self):
+        return self._facets[2] == 1
+
+    @cached_property
+    def facets_cells(self):
+        facets, cells_facets, counts = self._facets
+
+        # cell ids of the facets of the cells, sorted by the facet ids
+        inverse = cells_facets.ravel()
+        order = np.argsort(inverse, kind="stable")
+        cell_ids = np.repeat(np.arange(len(self.cells)), cells_facets.shape[1])[order]
+
+        start = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+        facets_cells = -np.ones((len(facets), 2), dtype=int)
+        facets_cells[:, 0] = cell_ids[start]
+
+        shared = counts > 1
+        facets_cells[shared, 1] = cell_ids[start[shared] + 1]
+
+        return facets_cells
+
+    @cached_property
+    def neighbours(self):
+        cells_facets = self.cells_facets
+        facets_cells = self.facets_cells[cells_facets]
+        cell_ids = np.arange(len(self.cells)).reshape(-1, 1)
+
+        return np.where(
+            facets_cells[..., 0] == cell_ids,
+            facets_cells[..., 1],
+            facets_cells[..., 0],
+        )
@@ -1,14 +1,16 @@
 from ._gausslegendre import GaussLegendre, GaussLegendreBoundary
 from ._scheme import Scheme
 from ._sphere import BazantOh
-from ._tetra import Tetrahedron
-from ._triangle import Triangle
+from ._tetra import Tetrahedron, TetrahedronBoundary
+from ._triangle import Triangle, TriangleBoundary
 
 __all__ = [
     "Scheme",
     "GaussLegendre",
     "GaussLegendreBoundary",
     "Tetrahedron",
+    "TetrahedronBoundary",
     "Triangle",
+    "TriangleBoundary",
     "BazantOh",
 ]
@@ -21,6 +21,7 @@ from types import SimpleNamespace
 import numpy as np
 
 from ._scheme import Scheme
+from ._triangle import Triangle
 
 
 class Tetrahedron(Scheme):
@@ -94,3 +95,37 @@ class Tetrahedron(Scheme):
             raise NotImplementedError("order must be either 1, 2, 3 or 5.")
 
         super().__init__(scheme.points, scheme.weights)
+
+
+class TetrahedronBoundary(Scheme):
+    r"""A triangle quadrature scheme located on the first face of a Tetrahedron, i.e.
+    the face between the first three points of the tetrahedron on the interval
+    :math:`[0, 1]`.
+
+    Parameters
+    ----------
+    order : int
+        The order of the triangle quadrature scheme on the face, see
+        :class:`~felupe.quadrature.Triangle`.
+
+    Notes
+    -----
+    This quadrature scheme is used in boundary regions of tetrahedrons, where the cells
+    are rotated in a way that the boundary faces are the first faces of the cells.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> quadrature = fem.quadrature.TetrahedronBoundary(order=1)
+    >>> quadrature.points
+    array([[0.33333333, 0.33333333, 0.        ]])
+    """
+
+    def __init__(self, order: int):
+        scheme = Triangle(order=order)
+
+        points = np.pad(scheme.points, ((0, 0), (0, 1)))
+        weights = scheme.weights
+
+        super().__init__(points, weights)
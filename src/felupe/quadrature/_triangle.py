@@ -91,3 +91,39 @@ class Triangle(Scheme):
             raise NotImplementedError("order must be 1, 2, 3 or 5.")
 
         super().__init__(scheme.points, scheme.weights)
+
+
+class TriangleBoundary(Scheme):
+    r"""A Gauss-Legendre quadrature scheme located on the first edge of a Triangle,
+    i.e. the edge between the first and the second point of the triangle on the interval
+    :math:`[0, 1]`.
+
+    Parameters
+    ----------
+    order : int
+        The number of sample points :math:`n` minus one of the Gauss-Legendre
+        quadrature rule on the edge. The quadrature rule integrates degree :math:`2n-1`
+        polynomials exactly.
+
+    Notes
+    -----
+    This quadrature scheme is used in boundary regions of triangles, where the cells
+    are rotated in a way that the boundary edges are the first edges of the cells.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> quadrature = fem.quadrature.TriangleBoundary(order=1)
+    >>> quadrature.points
+    array([[0.21132487, 0.        ],
+           [0.78867513, 0.        ]])
+    """
+
+    def __init__(self, order: int):
+        x, w = np.polynomial.legendre.leggauss(order + 1)
+
+        points = np.vstack([(1 + x) / 2, np.zeros_like(x)]).T
+        weights = w / 2
+
+        super().__init__(points, weights)
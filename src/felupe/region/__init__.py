@@ -15,11 +15,19 @@ from ._templates import (
     RegionQuadraticQuad,
     RegionQuadraticQuadBoundary,
     RegionQuadraticTetra,
+    RegionQuadraticTetraBoundary,
     RegionQuadraticTriangle,
+    RegionQuadraticTriangleBoundary,
+    RegionReducedHexahedron,
+    RegionReducedQuad,
     RegionTetra,
+    RegionTetraBoundary,
     RegionTetraMINI,
+    RegionTetraMINIBoundary,
     RegionTriangle,
+    RegionTriangleBoundary,
     RegionTriangleMINI,
+    RegionTriangleMINIBoundary,
     RegionTriQuadraticHexahedron,
     RegionTriQuadraticHexahedronBoundary,
 )
@@ -41,11 +49,19 @@ __all__ = [
     "RegionQuadraticQuad",
     "RegionQuadraticQuadBoundary",
     "RegionQuadraticTetra",
+    "RegionQuadraticTetraBoundary",
     "RegionQuadraticTriangle",
+    "RegionQuadraticTriangleBoundary",
+    "RegionReducedHexahedron",
+    "RegionReducedQuad",
     "RegionTetra",
+    "RegionTetraBoundary",
     "RegionTetraMINI",
+    "RegionTetraMINIBoundary",
     "RegionTriangle",
+    "RegionTriangleBoundary",
     "RegionTriangleMINI",
+    "RegionTriangleMINIBoundary",
     "RegionTriQuadraticHexahedron",
     "RegionTriQuadraticHexahedronBoundary",
 ]
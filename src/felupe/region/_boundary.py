@@ -18,8 +18,10 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
 
+from ..element import TetraMINI, TriangleMINI
 from ..math import cross
 from ..mesh import Mesh
+from ..mesh._topology import unique_rows
 from ._region import Region
 
 
@@ -242,6 +244,101 @@ def boundary_cells_hexahedron27(mesh):
     return cells, cells_faces
 
 
+def _boundary_cells_simplex(mesh, rotations, edges, face, face_edges):
+    """Convert the cells array of a simplex mesh (with optional midpoints on edges or
+    a bubble point) into a boundary cells array, where the cells are rotated by
+    orientation-preserving permutations of the corner points."""
+
+    ncorners = len(rotations[0])
+    points_per_cell = mesh.cells.shape[1]
+    midpoints = {frozenset(edge): ncorners + k for k, edge in enumerate(edges)}
+
+    permutations = []
+    for corners in rotations:
+        permutation = list(corners)
+
+        if points_per_cell == ncorners + len(edges):
+            # midpoints on edges of the rotated corner points
+            permutation += [
+                midpoints[frozenset((corners[i], corners[j]))] for i, j in edges
+            ]
+            points_per_face = face + [ncorners + k for k in face_edges]
+
+        else:
+            # (optional) bubble point
+            permutation += list(range(ncorners, points_per_cell))
+            points_per_face = face
+
+        permutations.append(permutation)
+
+    cells = mesh.cells[:, permutations]
+    cells_faces = cells[..., points_per_face]
+
+    return cells, cells_faces
+
+
+def boundary_cells_triangle(mesh):
+    """Convert the cells array of a triangle mesh (or a quadratic or a MINI triangle
+    mesh) into a boundary cells array."""
+
+    # rotated triangles with the n-th edge as first edge of one original triangle
+    rotations = [[0, 1, 2], [1, 2, 0], [2, 0, 1]]
+    edges = [[0, 1], [1, 2], [2, 0]]
+
+    return _boundary_cells_simplex(mesh, rotations, edges, face=[0, 1], face_edges=[0])
+
+
+def boundary_cells_tetra(mesh):
+    """Convert the cells array of a tetra mesh (or a quadratic or a MINI tetra mesh)
+    into a boundary cells array."""
+
+    # rotated tetrahedrons (even permutations) with the n-th face as first face of one
+    # original tetrahedron
+    rotations = [[0, 1, 2, 3], [1, 3, 2, 0], [0, 2, 3, 1], [0, 3, 1, 2]]
+    edges = [[0, 1], [1, 2], [2, 0], [0, 3], [1, 3], [2, 3]]
+
+    return _boundary_cells_simplex(
+        mesh, rotations, edges, face=[0, 1, 2], face_edges=[0, 1, 2]
+    )
+
+
+def _boundary_cells(mesh, element):
+    """Return the boundary cells, the cell-faces and the indices and counts of the
+    unique cell-faces of a mesh."""
+
+    if mesh.cell_type == "quad":
+        cells, cells_faces = boundary_cells_quad(mesh)
+    elif mesh.cell_type == "quad8":
+        cells, cells_faces = boundary_cells_quad8(mesh)
+    elif mesh.cell_type == "quad9":
+        cells, cells_faces = boundary_cells_quad9(mesh)
+    elif mesh.cell_type == "hexahedron":
+        cells, cells_faces = boundary_cells_hexahedron(mesh)
+    elif mesh.cell_type == "hexahedron20":
+        cells, cells_faces = boundary_cells_hexahedron20(mesh)
+    elif mesh.cell_type == "hexahedron27":
+        cells, cells_faces = boundary_cells_hexahedron27(mesh)
+    elif mesh.cell_type in ["triangle", "triangle6"] or isinstance(
+        element, TriangleMINI
+    ):
+        cells, cells_faces = boundary_cells_triangle(mesh)
+    elif mesh.cell_type in ["tetra", "tetra10"] or isinstance(element, TetraMINI):
+        cells, cells_faces = boundary_cells_tetra(mesh)
+    else:
+        raise NotImplementedError("Cell type not supported.")
+
+    cells_faces = cells_faces.reshape(-1, cells_faces.shape[-1])
+    cells = cells.reshape(-1, cells.shape[-1])
+
+    # sort faces, get indices of unique faces and counts
+    cells_faces_sorted = np.sort(cells_faces, axis=1)
+    cells_faces_unique, index, counts = unique_rows(
+        cells_faces_sorted, return_index=True, return_counts=True
+    )
+
+    return cells, cells_faces, index, counts
+
+
 class RegionBoundary(Region):
     r"""
     A numeric boundary-region as a combination of a mesh, an element and a
@@ -381,31 +478,12 @@ class RegionBoundary(Region):
         self.mask = mask
         self.ensure_3d = ensure_3d
 
-        if mesh.cell_type == "quad":
-            cells, cells_faces = boundary_cells_quad(mesh)
-        elif mesh.cell_type == "quad8":
-            cells, cells_faces = boundary_cells_quad8(mesh)
-        elif mesh.cell_type == "quad9":
-            cells, cells_faces = boundary_cells_quad9(mesh)
-        elif mesh.cell_type == "hexahedron":
-            cells, cells_faces = boundary_cells_hexahedron(mesh)
-        elif mesh.cell_type == "hexahedron20":
-            cells, cells_faces = boundary_cells_hexahedron20(mesh)
-        elif mesh.cell_type == "hexahedron27":
-            cells, cells_faces = boundary_cells_hexahedron27(mesh)
-        else:
-            raise NotImplementedError("Cell type not supported.")
-
-        cells_faces = cells_faces.reshape(-1, cells_faces.shape[-1])
-        cells = cells.reshape(-1, cells.shape[-1])
+        # the boundary cells and the unique faces are cached on the mesh
+        cells, cells_faces, index, counts = mesh._cached(
+            "boundary_cells", lambda: _boundary_cells(mesh, element)
+        )
 
         if self.only_surface:
-            # sort faces, get indices of unique faces and counts
-            cells_faces_sorted = np.sort(cells_faces, axis=1)
-            cells_faces_unique, index, counts = np.unique(
-                cells_faces_sorted, True, False, True, 0
-            )
-
             self._index = index
             self._mask = counts == 1
         else:
@@ -416,9 +494,10 @@ class RegionBoundary(Region):
 
         # merge with point-mask
         if mask is not None:
-            point_selection = np.arange(len(mesh.points))[mask]
+            point_mask = np.zeros(len(mesh.points), dtype=bool)
+            point_mask[np.arange(len(mesh.points))[mask]] = True
             self._selection = self._selection[
-                np.all(np.isin(cells_faces[self._selection], point_selection), axis=1)
+                np.all(point_mask[cells_faces[self._selection]], axis=1)
             ]
 
         # get cell-faces and cells on boundary (unique cell-faces with one count)
@@ -439,19 +518,13 @@ class RegionBoundary(Region):
     def _init_faces(self):
         "Initialize (norm of) face normals of cells."
 
-        if (
-            self.mesh.cell_type == "quad"
-            or self.mesh.cell_type == "quad8"
-            or self.mesh.cell_type == "quad9"
-        ):
-            dA_1 = self.dXdr[:, 0][::-1]
+        if self.element.dim == 2:
+            # quad, triangle
+            dA_1 = self.dXdr[:, 0][::-1].copy()
             dA_1[0] = -dA_1[0]
 
-        elif (
-            self.mesh.cell_type == "hexahedron"
-            or self.mesh.cell_type == "hexahedron20"
-            or self.mesh.cell_type == "hexahedron27"
-        ):
+        elif self.element.dim == 3:
+            # hexahedron, tetra
             dA_1 = cross(self.dXdr[:, 0], self.dXdr[:, 1])
 
         dA = -dA_1 * self.quadrature.weights.reshape(-1, 1)
@@ -475,5 +548,11 @@ class RegionBoundary(Region):
             "hexahedron": "quad",
             "quad8": "line3",
             "quad9": "line3",
-        }[self.mesh.cell_type]
+            "hexahedron20": "quad8",
+            "hexahedron27": "quad9",
+            "triangle": "line",
+            "triangle6": "line3",
+            "tetra": "triangle",
+            "tetra10": "triangle6",
+        }.get(self.mesh.cell_type)
         return Mesh(self.mesh.points, self.mesh.cells_faces, face_type)
@@ -24,6 +24,223 @@ import numpy as np
 from ..math import det, inv
 
 
+def _shape_functions(element, points):
+    """Return the element shape functions ``h_aq`` and their partial derivatives
+    ``dhdr_aJq`` w.r.t. the natural element coordinates, evaluated at the points
+    ``r_qJ``. Elements which are not batched are evaluated point by point."""
+
+    if getattr(element, "batched", False):
+        return element.function(points), element.gradient(points)
+
+    h = np.array([element.function(q) for q in points]).T
+    dhdr = np.array([element.gradient(q) for q in points]).transpose(1, 2, 0)
+
+    return h, dhdr
+
+
+def _geometric_gradient(points, dhdr):
+    """Return the geometric gradient ``dXdr_IJqc`` for the cell-points ``X_caI`` and
+    the partial derivatives of the element shape functions ``dhdr_aJq``."""
+
+    ncells, npoints, dim = points.shape
+    _, dim_r, nquadraturepoints = dhdr.shape
+
+    dXdr = points.transpose(2, 0, 1).reshape(dim * ncells, npoints) @ dhdr.reshape(
+        npoints, dim_r * nquadraturepoints
+    )
+
+    return np.ascontiguousarray(
+        dXdr.reshape(dim, ncells, dim_r, nquadraturepoints).transpose(0, 2, 3, 1)
+    )
+
+
+def _shape_gradient(dhdr, drdX):
+    """Return the partial derivatives of the element shape functions ``dhdX_aJqc`` for
+    the partial derivatives ``dhdr_aIq`` and the cell-wise constant inverse of the
+    geometric gradient ``drdX_IJc``."""
+
+    npoints, dim_r, nquadraturepoints = dhdr.shape
+    _, dim, ncells = drdX.shape
+
+    dhdX = dhdr.transpose(0, 2, 1).reshape(
+        npoints * nquadraturepoints, dim_r
+    ) @ drdX.reshape(dim_r, dim * ncells)
+
+    return np.ascontiguousarray(
+        dhdX.reshape(npoints, nquadraturepoints, dim, ncells).transpose(0, 2, 1, 3)
+    )
+
+
+def _is_constant(array, rtol=1e-10):
+    "Check if an array of shape ``(..., q, c)`` is constant over the axis ``q``."
+
+    if array.size == 0:
+        return True
+
+    scale = np.abs(array).max()
+    return bool(np.abs(array - array[..., :1, :]).max() <= rtol * scale)
+
+
+def _geometry(points, dhdr, weights):
+    """Return a dict with the (compressed) geometric gradient ``dXdr``, its inverse
+    ``drdX``, the differential volumes ``dV`` and the partial derivatives of the element
+    shape functions w.r.t. the undeformed coordinates ``dhdX`` of the cell-points
+    ``X_caI``. The geometric gradients of affine cells are evaluated once per cell
+    without the axis of the quadrature points. The same applies to ``dhdX`` if the
+    partial derivatives of the element shape functions ``dhdr_aJq`` are constant."""
+
+    # the partial derivatives of linear simplices are constant
+    constant = np.allclose(dhdr, dhdr[..., :1])
+
+    # geometric gradient, evaluated once per cell for affine cells
+    if constant:
+        dXdr = _geometric_gradient(points, dhdr[..., :1])[:, :, 0]
+        affine = True
+    else:
+        dXdr = _geometric_gradient(points, dhdr)
+        affine = _is_constant(dXdr)
+        if affine:
+            dXdr = np.ascontiguousarray(dXdr[:, :, 0])
+
+    # determinant and inverse of dXdr
+    J = det(dXdr)
+    drdX = inv(dXdr, determinant=J)
+
+    # numeric **differential volume element**
+    if affine:
+        dV = J * weights.reshape(-1, 1)
+    else:
+        dV = np.multiply(J, weights.reshape(-1, 1), out=J)
+
+    # Partial derivative of element shape function w.r.t. undeformed coordinates
+    if affine and constant:
+        dhdX = _shape_gradient(dhdr[..., :1], drdX)[:, :, 0]
+    elif affine:
+        dhdX = _shape_gradient(dhdr, drdX)
+    else:
+        dhdX = np.einsum("aIq,IJqc->aJqc", dhdr, drdX)
+
+    return dict(
+        affine=affine,
+        constant=constant,
+        uniform=False,
+        dXdr=dXdr,
+        drdX=drdX,
+        dV=dV,
+        dhdX=dhdX,
+    )
+
+
+def _is_uniform(mesh, rtol=1e-10):
+    """Check if a mesh is a structured grid with identical cells, i.e. if the spacing
+    vectors between the points along each axis of the grid are constant."""
+
+    shape = mesh.structured
+
+    if shape is None or mesh.ncells == 0:
+        return False
+
+    points = mesh.points.reshape(*shape[::-1], mesh.dim)
+
+    for axis in range(len(shape)):
+        spacing = np.diff(points, axis=axis).reshape(-1, mesh.dim)
+
+        # the tolerance is relative to the spacing (independent of a translation)
+        scale = np.abs(spacing).max(initial=0)
+
+        if np.abs(spacing - spacing[:1]).max(initial=0) > rtol * scale:
+            return False
+
+    return True
+
+
+def _uniform_geometry(mesh, dhdr, weights):
+    """Return the geometry of the first cell of a structured grid with identical cells,
+    broadcasted to all cells (read-only views)."""
+
+    geometry = _geometry(mesh.points[mesh.cells[:1]], dhdr, weights)
+
+    for key in ["dXdr", "drdX", "dV", "dhdX"]:
+        array = geometry[key]
+        geometry[key] = np.broadcast_to(array, (*array.shape[:-1], mesh.ncells))
+
+    geometry["uniform"] = True
+
+    return geometry
+
+
+def _broadcast(array, nquadraturepoints, ndim=4):
+    "Broadcast a cell-wise constant array to the quadrature points of the cells."
+
+    if array.ndim == ndim:
+        return array
+
+    shape = (*array.shape[:-1], nquadraturepoints, array.shape[-1])
+    return np.broadcast_to(np.expand_dims(array, -2), shape)
+
+
+def _is_simplex(element):
+    "Check if the reference domain of an element is a simplex (triangle or tetra)."
+    return any([name in str(element.cell_type) for name in ["triangle", "tetra"]])
+
+
+def _inverse_mapping(element, cell_points, points, tol=1e-8, maxiter=20):
+    """Return the natural element coordinates of points by the inverse isoparametric
+    mapping of the points of the cells (one cell per point) and a mask of the points
+    which are located inside their cells."""
+
+    npoints, dim = points.shape
+
+    if element.dim != dim:
+        raise ValueError(
+            "The dimension of the points must match the dimension of the element."
+        )
+
+    # the reference domain of the element
+    simplex = _is_simplex(element)
+    r = np.zeros((npoints, dim))
+
+    if simplex:
+        r += 1 / (dim + 1)
+
+    converged = np.zeros(npoints, dtype=bool)
+    unit = np.eye(dim).reshape(1, dim, dim)
+
+    # Newton iterations on the points which are not converged
+    active = np.arange(npoints)
+
+    for _ in range(maxiter):
+        X = cell_points[active]
+        h, dhdr = _shape_functions(element, r[active])
+
+        residual = points[active] - np.einsum("naI,an->nI", X, h)
+        dxdr = np.einsum("naI,aJn->nIJ", X, dhdr)
+
+        # replace degenerated cells by the unit matrix
+        singular = np.abs(np.linalg.det(dxdr)) <= np.finfo(float).tiny
+        dxdr[singular] = unit
+
+        dr = np.linalg.solve(dxdr, residual.reshape(-1, dim, 1))[..., 0]
+        r[active] += dr
+
+        # stop on convergence, on degenerated cells or if the points are far outside
+        done = np.all(np.abs(dr) <= tol, axis=1)
+        converged[active[done & ~singular]] = True
+
+        done |= singular | np.any(np.abs(r[active]) > 10, axis=1)
+        active = active[~done]
+
+        if len(active) == 0:
+            break
+
+    if simplex:
+        inside = np.all(r >= -tol, axis=1) & (r.sum(axis=1) <= 1 + tol)
+    else:
+        inside = np.all(np.abs(r) <= 1 + tol, axis=1)
+
+    return r, inside & converged
+
+
 class Region:
     r"""
     A numeric region as a combination of a mesh, an element and a numeric integration
@@ -74,6 +291,14 @@ class Region:
         Partial derivative of element shape functions ``dhdX_aJqc`` of shape function
         ``a`` w.r.t. undeformed coordinate ``J`` evaluated at quadrature point ``q`` for
         every cell ``c``.
+    affine : bool
+        A flag which indicates that the geometric gradients of all cells are constant
+        within the cells, e.g. for linear simplices or parallelograms. Only available
+        if the gradient is evaluated.
+    uniform : bool
+        A flag which indicates that all cells are identical, e.g. for structured grids
+        with a uniform spacing per axis, see :attr:`Mesh.structured
+        <felupe.Mesh.structured>`. Only available if the gradient is evaluated.
 
     Notes
     -----
@@ -92,6 +317,13 @@ class Region:
 
        dV &= \det\left(\frac{\partial X_I}{\partial r_J}\right) w
 
+    For affine cells, the geometric gradient and its inverse are evaluated only once per
+    cell. The arrays of the shape functions and their partial derivatives, as well as
+    the geometric gradients of affine cells, are read-only views which are broadcasted
+    to the quadrature points of the cells (and to the cells) without copies. The
+    geometry of structured grids with identical cells is evaluated only for the first
+    cell and broadcasted to all cells.
+
     Examples
     --------
     >>> import felupe as fem
@@ -194,6 +426,15 @@ class Region:
         >>> new_points = mesh.rotate(angle_deg=-90, axis=2).points
         >>> mesh.update(points=new_points, callback=region.reload)
 
+        If only the points of the mesh are changed, the element shape functions and
+        their partial derivatives w.r.t. the natural element coordinates are re-used.
+        The geometry is re-evaluated only for the cells with moved points, as long as
+        these are less than half of all cells.
+
+        >>> points = mesh.points.copy()
+        >>> points[0] += 0.01
+        >>> mesh.update(points=points, callback=region.reload)
+
         See Also
         --------
         felupe.Mesh.update : Update the mesh with given points and cells arrays inplace.
@@ -211,35 +452,57 @@ class Region:
         if quadrature is not None:
             region.quadrature = quadrature
 
-        if mesh is not None or element is not None or quadrature is not None:
-            # element shape function
-            region.element.h = np.array(
-                [region.element.function(q) for q in region.quadrature.points]
-            ).T
-            region.h = np.tile(np.expand_dims(region.element.h, -1), region.mesh.ncells)
-
-            # partial derivative of element shape function
-            region.element.dhdr = np.array(
-                [region.element.gradient(q) for q in region.quadrature.points]
-            ).transpose(1, 2, 0)
-            region.dhdr = np.tile(
-                np.expand_dims(region.element.dhdr, -1), region.mesh.ncells
+        reference = element is not None or quadrature is not None
+
+        if reference or not hasattr(region, "_reference"):
+            # element shape function and its partial derivative
+            region.element.h, region.element.dhdr = _shape_functions(
+                region.element, region.quadrature.points
             )
 
-            if region.evaluate_gradient:
-                # geometric gradient
-                region.dXdr = np.einsum(
-                    "caI,aJqc->IJqc", region.mesh.points[region.mesh.cells], region.dhdr
-                )
+            # the arrays of the reference element are re-used if only the mesh changes
+            region._reference = (region.element.h, region.element.dhdr)
 
-                # determinant and inverse of dXdr
-                J = det(region.dXdr)
-                region.drdX = inv(region.dXdr, determinant=J)
+        if mesh is not None or reference:
+            h, dhdr = region._reference
+            ncells = region.mesh.ncells
 
-                # numeric **differential volume element**
-                region.dV = np.multiply(
-                    J, region.quadrature.weights.reshape(-1, 1), out=J
-                )
+            region.h = np.broadcast_to(np.expand_dims(h, -1), (*h.shape, ncells))
+            region.dhdr = np.broadcast_to(
+                np.expand_dims(dhdr, -1), (*dhdr.shape, ncells)
+            )
+
+            if region.evaluate_gradient:
+                cells = None
+
+                if not reference:
+                    cells = region._moved_cells()
+
+                if cells is None or not region._update_geometry(cells):
+                    if _is_uniform(region.mesh):
+                        region._geometry = _uniform_geometry(
+                            region.mesh, dhdr, region.quadrature.weights
+                        )
+                    else:
+                        region._geometry = _geometry(
+                            region.mesh.points[region.mesh.cells],
+                            dhdr,
+                            region.quadrature.weights,
+                        )
+
+                # keep a copy of the points to detect moved points on reload
+                region._points = region.mesh.points.copy()
+                region._cells = region.mesh.cells
+
+                nquadraturepoints = dhdr.shape[-1]
+                geometry = region._geometry
+
+                region.affine = geometry["affine"]
+                region.uniform = geometry["uniform"]
+                region.dXdr = _broadcast(geometry["dXdr"], nquadraturepoints)
+                region.drdX = _broadcast(geometry["drdX"], nquadraturepoints)
+                region.dV = geometry["dV"]
+                region.dhdX = _broadcast(geometry["dhdX"], nquadraturepoints)
 
                 # check for negative **differential volume elements**
                 if np.any(region.dV < 0):
@@ -253,9 +516,157 @@ class Region:
                     )
                     warnings.warn(message_negative_volumes)
 
-                # Partial derivative of element shape function
-                # w.r.t. undeformed coordinates
-                region.dhdX = np.einsum("aIqc,IJqc->aJqc", region.dhdr, region.drdX)
+    def _moved_cells(self):
+        """Return the ids of the cells with moved points, compared to the points of the
+        last reload, or None if the cells of the mesh have changed."""
+
+        mesh = self.mesh
+
+        if (
+            not hasattr(self, "_points")
+            or self._cells is not mesh.cells
+            or self._points.shape != mesh.points.shape
+        ):
+            return None
+
+        moved = np.any(self._points != mesh.points, axis=1)
+
+        if not np.any(moved):
+            return np.zeros(0, dtype=int)
+
+        return np.unique(mesh.topology.point_cells[moved].indices)
+
+    def _update_geometry(self, cells):
+        """Re-evaluate the geometry only for a subset of cells inplace. Returns False if
+        the geometry has to be re-evaluated for all cells."""
+
+        # the geometry of uniform grids is broadcasted from one cell
+        if len(cells) > self.mesh.ncells // 2 or self._geometry["uniform"]:
+            return False
+
+        if len(cells) == 0:
+            return True
+
+        geometry = self._geometry
+        dhdr = self._reference[1]
+        nquadraturepoints = dhdr.shape[-1]
+
+        update = _geometry(
+            self.mesh.points[self.mesh.cells[cells]], dhdr, self.quadrature.weights
+        )
+
+        # the cells of an affine region must remain affine
+        if geometry["affine"] and not update["affine"]:
+            return False
+
+        for key in ["dXdr", "drdX", "dhdX"]:
+            ndim = geometry[key].ndim
+            geometry[key][..., cells] = _broadcast(update[key], nquadraturepoints, ndim)
+
+        geometry["dV"][:, cells] = update["dV"]
+
+        return True
+
+    def locate(self, points, tol=1e-8, maxiter=20, nearest=8):
+        r"""Locate the cells and the natural element coordinates of given points.
+
+        Parameters
+        ----------
+        points : ndarray
+            The coordinates of the points of shape ``(npoints, dim)``.
+        tol : float, optional
+            The tolerance of the natural element coordinates, used for the inverse
+            mapping and for the decision if a point is located inside a cell (default
+            is 1e-8).
+        maxiter : int, optional
+            The maximum number of Newton iterations of the inverse mapping (default is
+            20).
+        nearest : int, optional
+            The number of cells with the nearest centroids which are checked first
+            (default is 8).
+
+        Returns
+        -------
+        ndarray
+            The cell ids of the points of shape ``(npoints,)``. Points outside of the
+            region are marked by ``-1``.
+        ndarray
+            The natural element coordinates of the points of shape ``(npoints, dim)``.
+            The coordinates of points outside of the region are ``nan``.
+
+        Notes
+        -----
+        Candidate cells are searched by the spatial index of the mesh, see
+        :attr:`Mesh.spatial_index <felupe.Mesh.spatial_index>`. First, the cells with
+        the nearest centroids are checked. For the remaining points, all cells with
+        bounding boxes which contain the points are checked. The natural element
+        coordinates :math:`\boldsymbol{r}` of a point :math:`\boldsymbol{x}` are
+        obtained by the inverse isoparametric mapping, solved by Newton's method for
+        all points at once.
+
+        ..  math::
+
+            \boldsymbol{x} - \hat{\boldsymbol{X}}_a\ h_a(\boldsymbol{r}) =
+                \boldsymbol{0}
+
+        Examples
+        --------
+        >>> import felupe as fem
+        >>>
+        >>> mesh = fem.Rectangle(n=3)
+        >>> region = fem.RegionQuad(mesh)
+        >>> cells, r = region.locate([[0.3, 0.8], [2.0, 0.0]])
+        >>> cells
+        array([ 2, -1])
+
+        >>> r
+        array([[0.2, 0.2],
+               [nan, nan]])
+
+        See Also
+        --------
+        felupe.Field.probe : Interpolate the field values at given points.
+        """
+
+        points = np.asarray(points, dtype=float)
+        mesh = self.mesh
+        index = mesh.spatial_index
+
+        cells = -np.ones(len(points), dtype=int)
+        coords = np.full((len(points), self.element.dim), np.nan)
+
+        # check the cells with the nearest centroids
+        remaining = np.arange(len(points))
+
+        for nearest in index.nearest(points, k=nearest).T:
+            nearest = nearest[remaining]
+            r, inside = _inverse_mapping(
+                self.element,
+                mesh.points[mesh.cells[nearest]],
+                points[remaining],
+                tol,
+                maxiter,
+            )
+            cells[remaining[inside]] = nearest[inside]
+            coords[remaining[inside]] = r[inside]
+            remaining = remaining[~inside]
+
+        # check all cells with bounding boxes which contain the remaining points
+        point_ids, cell_ids = index.candidates(points[remaining])
+
+        if len(cell_ids) > 0:
+            point_ids = remaining[point_ids]
+            r, inside = _inverse_mapping(
+                self.element,
+                mesh.points[mesh.cells[cell_ids]],
+                points[point_ids],
+                tol,
+                maxiter,
+            )
+            cells[point_ids[inside]] = cell_ids[inside]
+            coords[point_ids[inside]] = r[inside]
+
+        return cells, coords
 
     def __repr__(self):
         header = "<felupe Region object>"
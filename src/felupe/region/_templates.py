@@ -36,7 +36,9 @@ from ..element import (
 from ..mesh import Mesh
 from ..quadrature import GaussLegendre, GaussLegendreBoundary
 from ..quadrature import Tetrahedron as TetraQuadrature
+from ..quadrature import TetrahedronBoundary as TetraQuadratureBoundary
 from ..quadrature import Triangle as TriangleQuadrature
+from ..quadrature import TriangleBoundary as TriangleQuadratureBoundary
 from ._boundary import RegionBoundary
 from ._region import Region
 
@@ -86,6 +88,36 @@ class RegionQuad(Region):
         super().__init__(mesh, element, quadrature, grad=grad)
 
 
+class RegionReducedQuad(Region):
+    r"""A region with a quad element and a reduced (one-point) quadrature rule.
+
+    Notes
+    -----
+    The reduced integration evaluates the constitutive material formulation only once
+    per cell. The stiffness matrix of a solid body is rank-deficient with one
+    hourglass mode per cell and direction. Hence, it must be used along with the
+    hourglass control of a :class:`~felupe.SolidBody` or a
+    :class:`~felupe.SolidBodyNearlyIncompressible`.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Rectangle(n=6)
+    >>> region = fem.RegionReducedQuad(mesh)
+    >>> field = fem.FieldContainer([fem.FieldPlaneStrain(region, dim=2)])
+    >>> solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=2), field, hourglass=1.0)
+    """
+
+    def __init__(self, mesh, quadrature=GaussLegendre(order=0, dim=2), grad=True):
+        element = Quad()
+
+        if len(mesh.cells.T) > 4:
+            mesh = Mesh(mesh.points, mesh.cells[:, :4], "quad")
+
+        super().__init__(mesh, element, quadrature, grad=grad)
+
+
 class RegionQuadraticQuad(Region):
     r"""A region with a (serendipity) quadratic quad element.
 
@@ -328,6 +360,38 @@ class RegionHexahedron(Region):
         super().__init__(mesh, element, quadrature, grad=grad)
 
 
+class RegionReducedHexahedron(Region):
+    r"""A region with a hexahedron element and a reduced (one-point) quadrature rule.
+
+    Notes
+    -----
+    The reduced integration evaluates the constitutive material formulation only once
+    per cell instead of eight times. The stiffness matrix of a solid body is
+    rank-deficient with four hourglass modes per cell and direction. Hence, it must be
+    used along with the hourglass control of a :class:`~felupe.SolidBody` or a
+    :class:`~felupe.SolidBodyNearlyIncompressible`.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Cube(n=6)
+    >>> region = fem.RegionReducedHexahedron(mesh)
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>> solid = fem.SolidBodyNearlyIncompressible(
+    ...     fem.NeoHooke(mu=1), field, bulk=5000, hourglass=1.0
+    ... )
+    """
+
+    def __init__(self, mesh, quadrature=GaussLegendre(order=0, dim=3), grad=True):
+        element = Hexahedron()
+
+        if len(mesh.cells.T) > 8:
+            mesh = Mesh(mesh.points, mesh.cells[:, :8], "hexahedron")
+
+        super().__init__(mesh, element, quadrature, grad=grad)
+
+
 class RegionHexahedronBoundary(RegionBoundary):
     """A boundary region with a hexahedron element.
 
@@ -568,6 +632,47 @@ class RegionTriangle(Region):
         super().__init__(m, element, quadrature, grad=grad)
 
 
+class RegionTriangleBoundary(RegionBoundary):
+    """A boundary region with a triangle element.
+
+    Examples
+    --------
+    Plot the element with its point-ids and the applied quadrature rule.
+
+    .. pyvista-plot::
+       :include-source: True
+
+       >>> import felupe as fem
+       >>>
+       >>> mesh = fem.Rectangle(n=3).triangulate()
+       >>> region = fem.RegionTriangleBoundary(mesh)
+       >>> region
+       <felupe Region object>
+         Element formulation: Triangle
+         Quadrature rule: TriangleBoundary
+         Gradient evaluated: True
+
+       >>> region.plot().show()
+    """
+
+    def __init__(
+        self,
+        mesh,
+        quadrature=TriangleQuadratureBoundary(order=1),
+        grad=True,
+        only_surface=True,
+        mask=None,
+    ):
+        element = Triangle()
+
+        if len(mesh.cells.T) > 3:
+            mesh = Mesh(mesh.points, mesh.cells[:, :3], "triangle")
+
+        super().__init__(
+            mesh, element, quadrature, grad=grad, only_surface=only_surface, mask=mask
+        )
+
+
 class RegionTetra(Region):
     """A region with a tetra element.
 
@@ -602,6 +707,47 @@ class RegionTetra(Region):
         super().__init__(m, element, quadrature, grad=grad)
 
 
+class RegionTetraBoundary(RegionBoundary):
+    """A boundary region with a tetra element.
+
+    Examples
+    --------
+    Plot the element with its point-ids and the applied quadrature rule.
+
+    .. pyvista-plot::
+       :include-source: True
+
+       >>> import felupe as fem
+       >>>
+       >>> mesh = fem.Cube(n=3).triangulate()
+       >>> region = fem.RegionTetraBoundary(mesh)
+       >>> region
+       <felupe Region object>
+         Element formulation: Tetra
+         Quadrature rule: TetrahedronBoundary
+         Gradient evaluated: True
+
+       >>> region.plot().show()
+    """
+
+    def __init__(
+        self,
+        mesh,
+        quadrature=TetraQuadratureBoundary(order=2),
+        grad=True,
+        only_surface=True,
+        mask=None,
+    ):
+        element = Tetra()
+
+        if len(mesh.cells.T) > 4:
+            mesh = Mesh(mesh.points, mesh.cells[:, :4], "tetra")
+
+        super().__init__(
+            mesh, element, quadrature, grad=grad, only_surface=only_surface, mask=mask
+        )
+
+
 class RegionTriangleMINI(Region):
     """A region with a triangle-MINI element.
 
@@ -636,6 +782,45 @@ class RegionTriangleMINI(Region):
         super().__init__(mesh, element, quadrature, grad=grad)
 
 
+class RegionTriangleMINIBoundary(RegionBoundary):
+    """A boundary region with a triangle-MINI element.
+
+    Examples
+    --------
+    Plot the element with its point-ids and the applied quadrature rule.
+
+    .. pyvista-plot::
+       :include-source: True
+
+       >>> import felupe as fem
+       >>>
+       >>> mesh = fem.Rectangle(n=3).triangulate().add_midpoints_faces()
+       >>> region = fem.RegionTriangleMINIBoundary(mesh)
+       >>> region
+       <felupe Region object>
+         Element formulation: TriangleMINI
+         Quadrature rule: TriangleBoundary
+         Gradient evaluated: True
+
+       >>> region.plot().show()
+    """
+
+    def __init__(
+        self,
+        mesh,
+        quadrature=TriangleQuadratureBoundary(order=1),
+        grad=True,
+        only_surface=True,
+        mask=None,
+        bubble_multiplier=0.1,
+    ):
+        element = TriangleMINI(bubble_multiplier=bubble_multiplier)
+
+        super().__init__(
+            mesh, element, quadrature, grad=grad, only_surface=only_surface, mask=mask
+        )
+
+
 class RegionTetraMINI(Region):
     """A region with a tetra-MINI element.
 
@@ -670,6 +855,45 @@ class RegionTetraMINI(Region):
         super().__init__(mesh, element, quadrature, grad=grad)
 
 
+class RegionTetraMINIBoundary(RegionBoundary):
+    """A boundary region with a tetra-MINI element.
+
+    Examples
+    --------
+    Plot the element with its point-ids and the applied quadrature rule.
+
+    .. pyvista-plot::
+       :include-source: True
+
+       >>> import felupe as fem
+       >>>
+       >>> mesh = fem.Cube(n=3).triangulate().add_midpoints_volumes()
+       >>> region = fem.RegionTetraMINIBoundary(mesh)
+       >>> region
+       <felupe Region object>
+         Element formulation: TetraMINI
+         Quadrature rule: TetrahedronBoundary
+         Gradient evaluated: True
+
+       >>> region.plot().show()
+    """
+
+    def __init__(
+        self,
+        mesh,
+        quadrature=TetraQuadratureBoundary(order=2),
+        grad=True,
+        only_surface=True,
+        mask=None,
+        bubble_multiplier=0.1,
+    ):
+        element = TetraMINI(bubble_multiplier=bubble_multiplier)
+
+        super().__init__(
+            mesh, element, quadrature, grad=grad, only_surface=only_surface, mask=mask
+        )
+
+
 class RegionQuadraticTriangle(Region):
     """A region with a quadratic triangle element.
 
@@ -698,6 +922,44 @@ class RegionQuadraticTriangle(Region):
         super().__init__(mesh, element, quadrature, grad=grad)
 
 
+class RegionQuadraticTriangleBoundary(RegionBoundary):
+    """A boundary region with a quadratic triangle element.
+
+    Examples
+    --------
+    Plot the element with its point-ids and the applied quadrature rule.
+
+    .. pyvista-plot::
+       :include-source: True
+
+       >>> import felupe as fem
+       >>>
+       >>> mesh = fem.Rectangle(n=3).triangulate().add_midpoints_edges()
+       >>> region = fem.RegionQuadraticTriangleBoundary(mesh)
+       >>> region
+       <felupe Region object>
+         Element formulation: QuadraticTriangle
+         Quadrature rule: TriangleBoundary
+         Gradient evaluated: True
+
+       >>> region.plot().show()
+    """
+
+    def __init__(
+        self,
+        mesh,
+        quadrature=TriangleQuadratureBoundary(order=2),
+        grad=True,
+        only_surface=True,
+        mask=None,
+    ):
+        element = QuadraticTriangle()
+
+        super().__init__(
+            mesh, element, quadrature, grad=grad, only_surface=only_surface, mask=mask
+        )
+
+
 class RegionQuadraticTetra(Region):
     """A region with a quadratic tetra element.
 
@@ -724,3 +986,41 @@ class RegionQuadraticTetra(Region):
     def __init__(self, mesh, quadrature=TetraQuadrature(order=2), grad=True):
         element = QuadraticTetra()
         super().__init__(mesh, element, quadrature, grad=grad)
+
+
+class RegionQuadraticTetraBoundary(RegionBoundary):
+    """A boundary region with a quadratic tetra element.
+
+    Examples
+    --------
+    Plot the element with its point-ids and the applied quadrature rule.
+
+    .. pyvista-plot::
+       :include-source: True
+
+       >>> import felupe as fem
+       >>>
+       >>> mesh = fem.Cube(n=3).triangulate().add_midpoints_edges()
+       >>> region = fem.RegionQuadraticTetraBoundary(mesh)
+       >>> region
+       <felupe Region object>
+         Element formulation: QuadraticTetra
+         Quadrature rule: TetrahedronBoundary
+         Gradient evaluated: True
+
+       >>> region.plot().show()
+    """
+
+    def __init__(
+        self,
+        mesh,
+        quadrature=TetraQuadratureBoundary(order=5),
+        grad=True,
+        only_surface=True,
+        mask=None,
+    ):
+        element = QuadraticTetra()
+
+        super().__init__(
+            mesh, element, quadrature, grad=grad, only_surface=only_surface, mask=mask
+        )
@@ -1,3 +1,4 @@
-from ._solve import partition, solve
+from ._schur import SchurComplementSolver
+from ._solve import FactorizedSolver, partition, solve
 
-__all__ = ["partition", "solve"]
+__all__ = ["FactorizedSolver", "SchurComplementSolver", "partition", "solve"]
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import inspect
+
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.linalg import LinearOperator, cg, gmres, splu
+
+
+class SchurComplementSolver:
+    r"""A substructuring solver which eliminates the interior degrees of freedom of
+    subdomains and solves the interface problem by the Schur complement with an
+    iterative method.
+
+    Parameters
+    ----------
+    labels : ndarray of int
+        The subdomain ids of the degrees of freedom of the system. Interface degrees of
+        freedom, which are shared by several subdomains, are marked by ``-1``.
+    method : str, optional
+        The iterative method for the interface problem, ``"cg"`` for the conjugate
+        gradient method (symmetric positive definite systems) or ``"gmres"`` (default
+        is ``"cg"``).
+    rtol : float, optional
+        The relative tolerance of the iterative method (default is 1e-10).
+    maxiter : int or None, optional
+        The maximum number of iterations of the iterative method (default is None).
+    factorize : callable, optional
+        A callable which returns a factorization object with a ``solve(b)``-method for a
+        given sparse matrix in CSC-format (default is
+        :func:`scipy.sparse.linalg.splu`).
+
+    Attributes
+    ----------
+    iterations : int
+        The number of iterations of the iterative method of the last call.
+
+    Notes
+    -----
+    The degrees of freedom are split into the interior degrees of freedom
+    :math:`i` of the subdomains :math:`k` and the interface degrees of freedom
+    :math:`\Gamma`. The interior blocks of the subdomains are factorized independently.
+    The Schur complement of the interface
+
+    ..  math::
+
+        \boldsymbol{S} = \boldsymbol{A}_{\Gamma\Gamma} - \sum_k
+            \boldsymbol{A}_{\Gamma k} \boldsymbol{A}_{kk}^{-1} \boldsymbol{A}_{k\Gamma}
+
+    is never assembled. Its products with vectors are evaluated subdomain by subdomain
+    and the interface problem
+
+    ..  math::
+
+        \boldsymbol{S}\ \boldsymbol{x}_\Gamma = \boldsymbol{b}_\Gamma - \sum_k
+            \boldsymbol{A}_{\Gamma k} \boldsymbol{A}_{kk}^{-1} \boldsymbol{b}_k
+
+    is solved by an iterative method, preconditioned by the factorized interface block
+    :math:`\boldsymbol{A}_{\Gamma\Gamma}`. Finally, the interior degrees of freedom are
+    recovered by back-substitution.
+
+    ..  math::
+
+        \boldsymbol{x}_k = \boldsymbol{A}_{kk}^{-1} \left(
+            \boldsymbol{b}_k - \boldsymbol{A}_{k\Gamma}\ \boldsymbol{x}_\Gamma \right)
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import felupe as fem
+    >>> from scipy.sparse import diags
+    >>>
+    >>> A = diags([-np.ones(4), 2 * np.ones(5), -np.ones(4)], [-1, 0, 1]).tocsr()
+    >>> solver = fem.solve.SchurComplementSolver(labels=[0, 0, -1, 1, 1])
+    >>> x = solver(A, np.ones(5))
+    >>> np.allclose(A @ x, 1)
+    True
+
+    See Also
+    --------
+    felupe.SolidBodyDecomposed : A solid body, decomposed into subdomains, which are
+        assembled in separate processes.
+    """
+
+    def __init__(self, labels, method="cg", rtol=1e-10, maxiter=None, factorize=splu):
+        self.labels = np.asarray(labels)
+        self.method = method
+        self.rtol = rtol
+        self.maxiter = maxiter
+        self.factorize = factorize
+        self.iterations = 0
+
+    def __call__(self, A, b):
+        A = csr_matrix(A)
+        b = np.asarray(b, dtype=float)
+
+        interface = np.nonzero(self.labels < 0)[0]
+        A_GG = A[interface][:, interface]
+
+        # factorized interior blocks and coupling blocks of the subdomains
+        subdomains = []
+        for label in np.unique(self.labels[self.labels >= 0]):
+            interior = np.nonzero(self.labels == label)[0]
+            A_kk = self.factorize(csc_matrix(A[interior][:, interior]))
+            A_kG = A[interior][:, interface]
+            A_Gk = A[interface][:, interior]
+            subdomains.append((interior, A_kk, A_kG, A_Gk))
+
+        x = np.zeros_like(b)
+
+        if len(interface) > 0:
+
+            def schur(v):
+                out = A_GG @ v
+                for interior, A_kk, A_kG, A_Gk in subdomains:
+                    out -= A_Gk @ A_kk.solve(A_kG @ v)
+                return out
+
+            rhs = b[interface].copy()
+            for interior, A_kk, A_kG, A_Gk in subdomains:
+                rhs -= A_Gk @ A_kk.solve(b[interior])
+
+            n = len(interface)
+            S = LinearOperator((n, n), matvec=schur, dtype=float)
+            preconditioner = self.factorize(csc_matrix(A_GG))
+            M = LinearOperator((n, n), matvec=preconditioner.solve, dtype=float)
+
+            self.iterations = 0
+
+            def callback(*args):
+                self.iterations += 1
+
+            krylov = {"cg": cg, "gmres": gmres}[self.method]
+            kwargs = {"callback_type": "pr_norm"} if self.method == "gmres" else {}
+
+            # the relative tolerance is named ``tol`` in SciPy < 1.12
+            if "rtol" in inspect.signature(krylov).parameters:
+                kwargs["rtol"] = self.rtol
+            else:
+                kwargs["tol"] = self.rtol
+
+            x[interface], info = krylov(
+                S,
+                rhs,
+                M=M,
+                atol=0.0,
+                maxiter=self.maxiter,
+                callback=callback,
+                **kwargs,
+            )
+
+            if info != 0:
+                raise RuntimeError(
+                    "The iterative solution of the interface problem did not converge."
+                )
+
+        for interior, A_kk, A_kG, A_Gk in subdomains:
+            x[interior] = A_kk.solve(b[interior] - A_kG @ x[interface])
+
+        return x
@@ -17,7 +17,8 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import numpy as np
-from scipy.sparse.linalg import spsolve
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import splu, spsolve
 
 from ..math import values
 
@@ -78,3 +79,58 @@ def solve(u, u0, K11, K10, dof1, dof0, r1=None, ext0=None, solver=spsolve):
 
     # reshape solution to shape of input
     return du.reshape(*u.shape)
+
+
+class FactorizedSolver:
+    r"""A sparse direct solver which factorizes the (partitioned) system matrix on
+    its first call and re-uses the factorization for all subsequent calls until it is
+    reset.
+
+    Parameters
+    ----------
+    factorize : callable, optional
+        A callable which returns a factorization object with a ``solve(b)``-method for a
+        given sparse matrix in CSC-format (default is
+        :func:`scipy.sparse.linalg.splu`).
+
+    Notes
+    -----
+    This solver is intended to be used with iteration methods which re-use the
+    Jacobian, like the modified Newton- or quasi-Newton methods of
+    :func:`~felupe.newtonrhapson`. The system matrix passed to the solver is ignored as
+    long as a factorization is available.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import felupe as fem
+    >>> from scipy.sparse import diags
+    >>>
+    >>> solver = fem.solve.FactorizedSolver()
+    >>> A = diags([2.0, 4.0, 8.0]).tocsr()
+    >>> solver(A, np.ones(3))
+    array([0.5  , 0.25 , 0.125])
+
+    The factorization of the first matrix is re-used until the solver is reset.
+
+    >>> solver(2 * A, np.ones(3))
+    array([0.5  , 0.25 , 0.125])
+
+    >>> solver.reset()
+    >>> solver(2 * A, np.ones(3))
+    array([0.25  , 0.125 , 0.0625])
+    """
+
+    def __init__(self, factorize=splu):
+        self.factorize = factorize
+        self.factorization = None
+
+    def reset(self):
+        "Discard the stored factorization."
+        self.factorization = None
+
+    def __call__(self, A, b):
+        if self.factorization is None:
+            self.factorization = self.factorize(csc_matrix(A))
+
+        return self.factorization.solve(np.asarray(b, dtype=float))
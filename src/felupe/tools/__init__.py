@@ -1,3 +1,4 @@
+from ._dump import dump, load
 from ._misc import logo, runs_on
 from ._newton import NewtonResult
 from ._newton import fun_items as fun
@@ -5,9 +6,12 @@ from ._newton import jac_items as jac
 from ._newton import newtonrhapson
 from ._plot import ViewField, ViewMesh, ViewSolid, ViewXdmf
 from ._post import curve, force, moment
-from ._project import extrapolate, project, topoints
+from ._project import Projector, extrapolate, project, topoints
 from ._save import save
 from ._solve import solve
+from ._sweep import parameter_sweep
+from ._timer import Timer
+from ._transfer import Transfer, interpolation_matrix
 
 __all__ = [
     "fun",
@@ -19,11 +23,18 @@ __all__ = [
     "extrapolate",
     "project",
     "topoints",
+    "Projector",
+    "Transfer",
+    "interpolation_matrix",
+    "parameter_sweep",
+    "dump",
+    "load",
     "logo",
     "runs_on",
     "save",
     "solve",
     "NewtonResult",
+    "Timer",
     "ViewMesh",
     "ViewField",
     "ViewXdmf",
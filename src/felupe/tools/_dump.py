@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import copyreg
+import os
+import pickle
+
+import numpy as np
+
+from ..mesh._discrete_geometry import DiscreteGeometry
+
+
+class _Pickler(pickle.Pickler):
+    """A pickler which stores large arrays as binary files in a directory and pickles
+    only the file names. Broadcasted arrays (with zero strides) are stored in their
+    compact form. Optionally, the caches of meshes are included."""
+
+    def __init__(self, file, directory, minsize=1024, cache=True):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.directory = directory
+        self.minsize = minsize
+        self.cache = cache
+        self.arrays = {}
+
+    def reducer_override(self, obj):
+        if self.cache and isinstance(obj, DiscreteGeometry):
+            # include the cache, which is excluded by ``__getstate__``
+            return copyreg.__newobj__, (type(obj),), obj.__dict__
+
+        return NotImplemented
+
+    def persistent_id(self, obj):
+        if (
+            type(obj) is not np.ndarray
+            or obj.dtype.hasobject
+            or obj.nbytes < self.minsize
+        ):
+            return None
+
+        if id(obj) not in self.arrays:
+            compact = obj[
+                tuple(slice(0, 1) if s == 0 else slice(None) for s in obj.strides)
+            ]
+            name = f"array_{len(self.arrays)}.npy"
+            np.save(os.path.join(self.directory, name), compact)
+
+            # keep a reference to the array, the id of the array must not be re-used
+            self.arrays[id(obj)] = (name, obj.shape, obj)
+
+        name, shape, obj = self.arrays[id(obj)]
+
+        return name, shape
+
+
+class _Unpickler(pickle.Unpickler):
+    """An unpickler which loads the arrays of a :class:`_Pickler` as memory-mapped
+    arrays. The memory pages of the files are shared by all processes."""
+
+    def __init__(self, file, directory, mmap_mode="r"):
+        super().__init__(file)
+        self.directory = directory
+        self.mmap_mode = mmap_mode
+        self.arrays = {}
+
+    def persistent_load(self, pid):
+        name, shape = pid
+
+        if name not in self.arrays:
+            path = os.path.join(self.directory, name)
+            self.arrays[name] = np.asarray(np.load(path, mmap_mode=self.mmap_mode))
+
+        array = self.arrays[name]
+
+        if array.shape != shape:
+            array = np.broadcast_to(array, shape)
+
+        return array
+
+
+def dump(obj, path, minsize=1024, cache=True):
+    r"""Save an object, e.g. a :class:`~felupe.Mesh`, a :class:`~felupe.Region` or a
+    :class:`~felupe.FieldContainer`, to a directory, where all large arrays are stored
+    as binary files.
+
+    Parameters
+    ----------
+    obj : object
+        The (picklable) object to be saved, e.g. a mesh, a region, a boundary region,
+        a field container or a list of these objects.
+    path : str
+        The path to the directory. It is created if it does not exist.
+    minsize : int, optional
+        The minimum size of an array in bytes to be stored as binary file (default is
+        1024).
+    cache : bool, optional
+        A flag to include the cached items of the meshes, like the sparsity patterns
+        of structured grids, the topology or the spatial search index (default is
+        True).
+
+    Returns
+    -------
+    str
+        The path to the directory.
+
+    Notes
+    -----
+    The object is pickled to the file ``object.pkl``. All arrays with at least
+    ``minsize`` bytes, e.g. the points and cells of a mesh, the shape functions,
+    their gradients and the differential volumes of a region as well as the indices
+    of a field, are stored as ``.npy``-files in the same directory. Broadcasted arrays,
+    like the geometry of a region with affine or uniform cells, are stored in their
+    compact form. Arrays which are shared by several objects are stored only once.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Cube(n=6)
+    >>> region = fem.RegionHexahedron(mesh)
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>>
+    >>> path = fem.tools.dump(field, "field")
+    >>> field = fem.tools.load(path)
+
+    See Also
+    --------
+    felupe.tools.load : Load an object from a directory with memory-mapped arrays.
+    """
+
+    os.makedirs(path, exist_ok=True)
+
+    with open(os.path.join(path, "object.pkl"), "wb") as file:
+        _Pickler(file, path, minsize=minsize, cache=cache).dump(obj)
+
+    return path
+
+
+def load(path, mmap_mode="c"):
+    r"""Load an object, saved by :func:`~felupe.tools.dump`, from a directory with
+    memory-mapped arrays.
+
+    Parameters
+    ----------
+    path : str
+        The path to the directory.
+    mmap_mode : str or None, optional
+        The mode of the memory-mapped arrays, see :func:`numpy.load`. With ``"r"``,
+        the arrays are read-only. With ``"c"`` (copy-on-write), the arrays are
+        writeable but changes are not written to the files. If None, the arrays are
+        read into memory (default is ``"c"``).
+
+    Returns
+    -------
+    object
+        The loaded object.
+
+    Notes
+    -----
+    Nothing is re-computed on load. The arrays are mapped into memory and read from
+    the files only on access. Hence, the memory pages of the arrays are shared by all
+    processes which load the same directory (as long as they are not modified).
+
+    See Also
+    --------
+    felupe.tools.dump : Save an object to a directory, where all large arrays are
+        stored as binary files.
+    """
+
+    with open(os.path.join(path, "object.pkl"), "rb") as file:
+        return _Unpickler(file, path, mmap_mode=mmap_mode).load()
@@ -26,6 +26,7 @@ from scipy.sparse.linalg import spsolve
 from .. import solve as fesolve
 from ..assembly import IntegralForm
 from ..math import norm
+from ._timer import Timer
 
 
 class NewtonResult:
@@ -159,11 +160,17 @@ def jac(x, umat, parallel=False, grad=True, add_identity=True, sym=False):
     ).assemble(parallel=parallel)
 
 
-def solve(A, b, x, dof1, dof0, offsets=None, ext0=None, solver=spsolve):
+def solve(A, b, x, dof1, dof0, offsets=None, ext0=None, solver=spsolve, timer=None):
     "Solve partitioned system."
 
-    system = fesolve.partition(x, A, dof1, dof0, -b)
-    dx = fesolve.solve(*system, ext0, solver=solver)
+    if timer is None:
+        timer = Timer()
+
+    with timer("partition"):
+        system = fesolve.partition(x, A, dof1, dof0, -b)
+
+    with timer("linear-solve"):
+        dx = fesolve.solve(*system, ext0, solver=solver)
 
     return dx
 
@@ -187,7 +194,7 @@ def check(dx, x, f, xtol, ftol, dof1=None, dof0=None, items=None, eps=1e-3):
 
     if success and items is not None:
         for item in items:
-            [item.results.update_statevars() for item in items]
+            item.results.update_statevars()
 
     return xnorm, fnorm, success
 
@@ -198,6 +205,39 @@ def update(x, dx):
     return x + dx
 
 
+def _active(array, dof1=None):
+    "Return a flattened copy of the active degrees of freedom of an array."
+
+    array = np.ravel(array)
+
+    if dof1 is None:
+        return array.copy()
+
+    return array[dof1]
+
+
+def _set_active(array, values, dof1=None):
+    "Set the values of the active degrees of freedom of an array (in-place)."
+
+    flat = array.reshape(-1)
+
+    if dof1 is None:
+        flat[:] = values
+    else:
+        flat[dof1] = values
+
+    return array
+
+
+def _prescribed(dx, dof0=None):
+    "Check if a solution increment has non-zero prescribed components."
+
+    if dof0 is None:
+        return False
+
+    return bool(np.any(np.ravel(dx)[dof0]))
+
+
 def newtonrhapson(
     x0=None,
     fun=fun,
@@ -215,6 +255,11 @@ def newtonrhapson(
     ext0=None,
     solver=spsolve,
     verbose=True,
+    method="newton",
+    refresh=None,
+    ratio=0.5,
+    jac0=None,
+    timer=None,
 ):
     r"""Find a root of a real function using the Newton-Raphson method.
 
@@ -262,6 +307,30 @@ def newtonrhapson(
         2 for a text-based logging output (default is True).If the environmental
         variable FELUPE_VERBOSE is set and its value is ``false``, then this argument is
         ignored and logging is turned off.
+    method : str, optional
+        The iteration method, one of ``"newton"``, ``"modified-newton"``, ``"bfgs"`` or
+        ``"broyden"`` (default is ``"newton"``). All methods except ``"newton"`` re-use
+        the Jacobian (and its factorization) of previous iterations, see Notes.
+    refresh : int or None, optional
+        Re-evaluate the Jacobian after every n-th iteration for all methods except
+        ``"newton"``. If None, the Jacobian is only re-evaluated on slow convergence
+        (default is None).
+    ratio : float or None, optional
+        Re-evaluate the Jacobian for all methods except ``"newton"`` if the norm of the
+        objective function is not reduced below this ratio of the norm of the previous
+        iteration. If None, the Jacobian is not re-evaluated on slow convergence
+        (default is 0.5).
+    jac0 : object or None, optional
+        An already assembled Jacobian which is re-used for the first iteration for all
+        methods except ``"newton"``, e.g. the Jacobian ``res.jac`` of a previous result
+        (default is None). If None, the Jacobian is evaluated at the starting point.
+    timer : felupe.tools.Timer or None, optional
+        A timer which records the runtimes of the evaluations of the objective function
+        (``"fun"``) and the Jacobian (``"jac"``), the solutions of the linear equation
+        systems (``"solve"``), the updates of the unknowns (``"update"``) and the
+        convergence checks (``"check"``). If ``timer`` is found in the signature of
+        ``solve``, it is passed to ``solve``, e.g. the default ``solve`` records
+        ``"partition"`` and ``"linear-solve"`` (default is None).
 
     Returns
     -------
@@ -318,6 +387,18 @@ def newtonrhapson(
     Then, the nonlinear equilibrium equations are evaluated with the updated unknowns
     :math:`f(x)`. The procedure is repeated until convergence is reached.
 
+    For ``method="modified-newton"``, the Jacobian :math:`K(x_0)` of the starting point
+    (or the given Jacobian ``jac0``) is re-used for all subsequent iterations. If the
+    default solver is used, it is replaced by a
+    :class:`~felupe.solve.FactorizedSolver` and the factorization of the Jacobian is
+    re-used too. The Jacobian (and its factorization) is refreshed after every
+    ``refresh``-th iteration or if the norm of the objective function converges slower
+    than the given ``ratio``. For ``method="bfgs"`` and ``method="broyden"``, the
+    solution increments of the re-used Jacobian are further improved by rank-updates of
+    the BFGS method (symmetric Jacobians) or Broyden's (good) method, based on the
+    history of solution increments and objective functions on the active degrees of
+    freedom. The history is cleared whenever the Jacobian is refreshed.
+
     Examples
     --------
     >>> import felupe as fem
@@ -344,6 +425,14 @@ def newtonrhapson(
     >>> np.linalg.norm(res.fun[loadcase["dof1"]])
     2.7482611016095555e-15
 
+    The quasi-Newton BFGS method re-uses the (factorized) Jacobian of the starting
+    point and needs more (but cheaper) iterations.
+
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>> boundaries, loadcase = fem.dof.uniaxial(field, move=0.2, clamped=True)
+    >>> solid = fem.SolidBody(umat=fem.NeoHooke(mu=1.0, bulk=2.0), field=field)
+    >>> res = fem.newtonrhapson(items=[solid], method="bfgs", **loadcase)
+
     """
     VERBOSE = os.environ.get("FELUPE_VERBOSE")
     if VERBOSE is None:
@@ -351,6 +440,18 @@ def newtonrhapson(
     else:
         verbose = VERBOSE == "true"
 
+    methods = ["newton", "modified-newton", "bfgs", "broyden"]
+    if method not in methods:
+        raise ValueError(f"Method must be one of {methods}, got '{method}'.")
+
+    reuse = method != "newton"
+
+    if reuse and solver is spsolve:
+        solver = fesolve.FactorizedSolver()
+
+    if timer is None:
+        timer = Timer()
+
     if verbose:
         runtimes = [perf_counter()]
         soltimes = []
@@ -364,10 +465,11 @@ def newtonrhapson(
     kwargs_solve = {}
     sig = inspect.signature(solve)
 
-    if items is not None:
-        f = fun_items(items, x, *args, **kwargs)
-    else:
-        f = fun(x, *args, **kwargs)
+    with timer("fun"):
+        if items is not None:
+            f = fun_items(items, x, *args, **kwargs)
+        else:
+            f = fun(x, *args, **kwargs)
 
     if verbose:
         print()
@@ -379,16 +481,29 @@ def newtonrhapson(
 
     xnorms, fnorms = [], []
 
+    # re-use a given Jacobian for the first iteration
+    K = jac0 if reuse else None
+
+    # history of the quasi-Newton methods
+    history = []
+
     # iteration loop
     for iteration in range(maxiter):
-        if items is not None:
-            K = jac_items(items, x, *args, **kwargs)
-        else:
-            K = jac(x, *args, **kwargs)
+        if K is None:
+            with timer("jac"):
+                if items is not None:
+                    K = jac_items(items, x, *args, **kwargs)
+                else:
+                    K = jac(x, *args, **kwargs)
+
+            # a new Jacobian requires a new factorization and invalidates the history
+            history = []
+            if hasattr(solver, "reset"):
+                solver.reset()
 
         # create keyword-arguments for solving the linear system
-        keys = ["x", "dof1", "dof0", "ext0", "solver"]
-        values = [x, dof1, dof0, ext0, solver]
+        keys = ["x", "dof1", "dof0", "ext0", "solver", "timer"]
+        values = [x, dof1, dof0, ext0, solver, timer]
 
         for key, value in zip(keys, values):
             if key in sig.parameters:
@@ -397,22 +512,71 @@ def newtonrhapson(
         if verbose:
             soltime_start = perf_counter()
 
-        dx = solve(K, -f, **kwargs_solve)
+        with timer("solve"):
+            if method == "bfgs" and len(history) > 0:
+                # two-loop recursion of the BFGS inverse update
+                q = _active(f, dof1)
+                alphas = []
+
+                for s, y, rho in history[::-1]:
+                    alphas.append(rho * (s @ q))
+                    q -= alphas[-1] * y
+
+                dx = solve(K, _set_active(np.zeros_like(f), -q, dof1), **kwargs_solve)
+                r = -_active(dx, dof1)
+
+                for (s, y, rho), alpha in zip(history, alphas[::-1]):
+                    r += s * (alpha - rho * (y @ r))
+
+                dx = _set_active(dx, -r, dof1)
+
+            else:
+                dx = solve(K, -f, **kwargs_solve)
+
+            prescribed = _prescribed(dx, dof0)
+
+            if method == "broyden":
+                # recursion of the inverse update of Broyden's (good) method
+                if prescribed:
+                    history = []
+                else:
+                    z = _active(dx, dof1)
+
+                    for step, next_step in zip(history[:-1], history[1:]):
+                        z += next_step * (step @ z) / (step @ step)
+
+                    if len(history) > 0:
+                        z /= 1 - (history[-1] @ z) / (history[-1] @ history[-1])
+
+                    dx = _set_active(dx, z, dof1)
+                    history.append(z)
 
         if verbose:
             soltime_end = perf_counter()
             soltimes.append([soltime_start, soltime_end])
 
-        x = update(x, dx)
-
-        if items is not None:
-            f = fun_items(items, x, *args, **kwargs)
-        else:
-            f = fun(x, *args, **kwargs)
-
-        xnorm, fnorm, success = check(
-            dx=dx, x=x, f=f, xtol=np.inf, ftol=tol, dof1=dof1, dof0=dof0, items=items
-        )
+        with timer("update"):
+            x = update(x, dx)
+
+        f_old = f
+
+        with timer("fun"):
+            if items is not None:
+                f = fun_items(items, x, *args, **kwargs)
+            else:
+                f = fun(x, *args, **kwargs)
+
+        with timer("check"):
+            xnorm, fnorm, success = check(
+                dx=dx,
+                x=x,
+                f=f,
+                xtol=np.inf,
+                ftol=tol,
+                dof1=dof1,
+                dof0=dof0,
+                items=items,
+            )
         xnorms.append(xnorm)
         fnorms.append(fnorm)
 
@@ -425,12 +589,31 @@ def newtonrhapson(
         if np.any(np.isnan([xnorm, fnorm])):
             raise ValueError("Norm of unknowns is NaN.")
 
+        if method == "bfgs" and not prescribed:
+            s = _active(dx, dof1)
+            y = _active(f, dof1) - _active(f_old, dof1)
+
+            # skip pairs which violate the curvature condition
+            if s @ y > 0:
+                history.append((s, y, 1 / (s @ y)))
+
+        # decide whether the Jacobian is re-evaluated in the next iteration
+        if not reuse:
+            K = None
+
+        elif refresh is not None and (1 + iteration) % refresh == 0:
+            K = None
+
+        elif ratio is not None and len(fnorms) > 1 and fnorm > ratio * fnorms[-2]:
+            K = None
+
     if 1 + iteration == maxiter and not success:
         raise ValueError("Maximum number of iterations reached (not converged).\n")
 
     Res = NewtonResult(
         x=x,
         fun=f,
+        jac=K,
         success=success,
         iterations=1 + iteration,
         xnorms=xnorms,
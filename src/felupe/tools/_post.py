@@ -17,7 +17,6 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import numpy as np
-from scipy.interpolate import interp1d
 from scipy.sparse import issparse
 
 from ..math import cross
@@ -58,6 +57,8 @@ def moment(field, forces, boundary, centerpoint=np.zeros(3)):
 def curve(x, y, num=50):
     "Interpolate a curve from given (x, y) data."
 
+    from scipy.interpolate import interp1d
+
     kind = [None, "linear", "quadratic", "cubic"][min(len(y), 4) - 1]
 
     f = interp1d(x[: len(y)], y, kind=kind)
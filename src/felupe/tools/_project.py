@@ -18,7 +18,7 @@ along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
 from scipy.sparse import csr_matrix as sparsematrix
-from scipy.sparse.linalg import spsolve
+from scipy.sparse.linalg import splu, spsolve
 
 from ..assembly import IntegralFormCartesian
 from ..element import (
@@ -32,7 +32,47 @@ from ..element import (
 from ..field import Field
 from ..quadrature import Tetrahedron as TetrahedronQuadrature
 from ..quadrature import Triangle as TriangleQuadrature
-from ..region import Region
+
+
+def _projection_region(region, average=True):
+    """Return a region with a quadrature scheme suitable for projection. If not
+    average, the region is copied with a disconnected mesh."""
+
+    mesh = None
+    if not average:
+        mesh = region.mesh.disconnect()  # for non-continuous results
+
+    # quadrature schemes for projection
+    # triangles and tetrahedrons require quadratic quadratures for projection
+    quadrature = None
+    schemes = {
+        Triangle: TriangleQuadrature(order=2),
+        Tetra: TetrahedronQuadrature(order=2),
+        TriangleMINI: TriangleQuadrature(order=5),
+        TetraMINI: TetrahedronQuadrature(order=5),
+        QuadraticTriangle: TriangleQuadrature(order=5),
+        QuadraticTetra: TetrahedronQuadrature(order=5),
+    }
+    scheme = schemes.get(type(region.element))
+    if scheme is not None and region.quadrature.npoints < scheme.npoints:
+        if region.quadrature.npoints == 1:
+            quadrature = scheme
+        else:
+            raise ValueError(
+                " ".join(
+                    [
+                        "Quadrature not supported (order is too low).",
+                        "Take the cell-means with `project(mean=True)` or use a",
+                        "higher-order quadrature scheme.",
+                    ]
+                )
+            )
+
+    # copy and reload the region if necessary
+    if mesh is not None or quadrature is not None:
+        region = region.copy(mesh=mesh, quadrature=quadrature)
+
+    return region
 
 
 def topoints(values, region, average=True, mean=False):
@@ -82,33 +122,15 @@ def topoints(values, region, average=True, mean=False):
         # trim the values to the number of points-per-cell
         values = values[..., :points_per_cell, :]
 
+    # values at the points of the cells in cell-major order
+    out = np.einsum("...qc->cq...", values).reshape(-1, size)
+
     if average:
-        # trailing axes (of broadcasted and trimmed values)
-        axes = values.shape[-2:]
-
-        # create a field to output the values at mesh-points
-        field = Field(region, dim=size)
-
-        # field-values as column vector for result of sparse-matrix
-        field.values = field.values.reshape(-1, 1)
-        field.values = sparsematrix(
-            (values.reshape(-1, *axes).T.ravel(), field.indices.ai),
-            shape=field.indices.shape,
-        ).toarray(out=field.values)
-
-        # reshape field-values to original shape
-        field.values = field.values.reshape(-1, *shape)
-
-        # divide the result by the number of cells per mesh-point
-        out = np.einsum(
-            "a...,a->a...",
-            field.values,
-            1 / region.mesh.cells_per_point,
-            out=field.values,
-        )
-    else:
-        out = np.einsum("...qc->cq...", values)
-        out = out.reshape(-1, *shape)
+        # sum the values at the mesh-points and divide the result by the number of
+        # cells per mesh-point by the (cached) sparse averaging matrix of the mesh
+        out = region.mesh.averaging_matrix @ out
+
+    out = out.reshape(-1, *shape)
 
     return out
 
@@ -139,7 +161,7 @@ def extrapolate(values, region, average=True, mean=False):
 
     dim = values.shape[:-2]
     size = int(np.prod(dim))
-    weights = region.quadrature.weights
+    points_per_cell = region.mesh.cells.shape[1]
 
     if mean:
         weights = region.quadrature.weights
@@ -149,55 +171,35 @@ def extrapolate(values, region, average=True, mean=False):
         values = np.expand_dims(values, axis=-2)
 
         # broadcast mean values to number of points-per-cell
-        points_per_cell = region.mesh.cells.shape[1]
         values = np.broadcast_to(values, (*dim, points_per_cell, values.shape[-1]))
 
-    # transpose values
-    idx = np.arange(len(values.shape))
-    idx[: len(dim)] = idx[: len(dim)][::-1]
-    values = values.transpose(idx)
-
-    # reshape from (shape, nint.points, nelements) to 1d-values
-    u = values.T.reshape(-1, size)
-
-    # disconnect the mesh
-    m = region.mesh.disconnect()
-
-    if mean:
-        # region on disconnected mesh with original quadrature scheme
-        # a single-point quadrature would be sufficient
-        # but would require additional (not available) informations
-        r = Region(m, region.element, region.quadrature, grad=False)
     else:
-        # region on disconnected mesh with inverse quadrature scheme
-        r = Region(m, region.element, region.quadrature.inv(), grad=False)
-
-    # field for values on disconnected mesh; project values to mesh-points
-    f = Field(r, dim=size, values=u)
-    v = f.interpolate()
+        if values.shape[-2] != points_per_cell:
+            raise ValueError(
+                " ".join(
+                    [
+                        "The number of quadrature-points must be equal to the number",
+                        "of points-per-cell. Take the cell-means with",
+                        "`extrapolate(mean=True)`.",
+                    ]
+                )
+            )
 
-    if mean:
-        # due to the usage of the original quadrature scheme the averaging must be
-        # applied again
-        # np.average(keepdims=True) requires numpy >= 1.23.0
-        v = np.average(v, axis=-2, weights=weights).reshape(size, 1, -1)
+        # the values at the quadrature-points are treated as values at the points of
+        # the cells which are interpolated at the points of the inverse quadrature
+        inverse = region.quadrature.inv()
+        if getattr(region.element, "batched", False):
+            h = region.element.function(inverse.points).T
+        else:
+            h = np.array([region.element.function(r) for r in inverse.points])
+        values = np.einsum("aq,...qc->...ac", h, values)
 
-        # broadcast averaged values to match the number of element-points
-        shape = np.array([*v.shape[:-2], len(region.element.points), v.shape[-1]])
-        v = np.broadcast_to(v, shape=shape)
+    # values at the points of the cells in cell-major order
+    w = np.einsum("...ac->ca...", values).reshape(-1, size)
 
     if average:
-        # create dummy field for values on original mesh
-        # (used for calculation of sparse-matrix indices)
-        g = Field(region, dim=size)
-
-        # average values
-        w = sparsematrix(
-            (v.T.ravel(), g.indices.ai), shape=(size * region.mesh.npoints, 1)
-        ).toarray().reshape(-1, size) / region.mesh.cells_per_point.reshape(-1, 1)
-
-    else:
-        w = v.T
+        # average the values at the mesh-points by the (cached) sparse matrix
+        w = region.mesh.averaging_matrix @ w
 
     return w.reshape(-1, *dim)
 
@@ -315,40 +317,7 @@ def project(values, region, average=True, mean=False, dV=None, solver=spsolve):
     if mean:
         return extrapolate(values, region, average=average, mean=mean)
 
-    mesh = None
-    if not average:
-        mesh = region.mesh.disconnect()  # for non-continuous results
-
-    # quadrature schemes for projection
-    # triangles and tetrahedrons require quadratic quadratures for projection
-    element = None
-    quadrature = None
-    schemes = {
-        Triangle: TriangleQuadrature(order=2),
-        Tetra: TetrahedronQuadrature(order=2),
-        TriangleMINI: TriangleQuadrature(order=5),
-        TetraMINI: TetrahedronQuadrature(order=5),
-        QuadraticTriangle: TriangleQuadrature(order=5),
-        QuadraticTetra: TetrahedronQuadrature(order=5),
-    }
-    scheme = schemes.get(type(region.element))
-    if scheme is not None and region.quadrature.npoints < scheme.npoints:
-        if region.quadrature.npoints == 1:
-            quadrature = scheme
-        else:
-            raise ValueError(
-                " ".join(
-                    [
-                        "Quadrature not supported (order is too low).",
-                        "Take the cell-means with `project(mean=True)` or use a",
-                        "higher-order quadrature scheme.",
-                    ]
-                )
-            )
-
-    # copy and reload the region if necessary
-    if mesh is not None or element is not None or quadrature is not None:
-        region = region.copy(mesh, element, quadrature)
+    region = _projection_region(region, average=average)
 
     shape = values.shape[:-2]  # tensor-components
     size = np.prod(shape).astype(int)  # tensor-size (enforce int for empty tuple)
@@ -373,6 +342,241 @@ def project(values, region, average=True, mean=False, dV=None, solver=spsolve):
 
     # solve with individual right-hand-sides (per tensor-component of values)
     b = IntegralFormCartesian(values.reshape(size, *axes), v=x, dV=dV).assemble()
-    x.values[:] = spsolve(A, b.toarray().reshape(-1, size)).reshape(x.values.shape)
+    x.values[:] = solver(A, b.toarray().reshape(-1, size)).reshape(x.values.shape)
 
     return x.values.reshape(-1, *shape)
+
+
+class Projector:
+    r"""A projector of values at quadrature-points to mesh-points, bound to a region.
+    The (volume) matrix of the projection is assembled and factorized (or lumped) only
+    once on creation and is re-used for all projections.
+
+    Parameters
+    ----------
+    region : Region
+        A region used to project the values to the mesh-points.
+    method : str, optional
+        The projection method, one of ``"consistent"`` for the :math:`L^2`-projection
+        with the consistent volume matrix, ``"lumped"`` for the :math:`L^2`-projection
+        with the row-sum lumped volume matrix or ``"spr"`` for the superconvergent
+        patch recovery (default is ``"consistent"``).
+    average : bool, optional
+        A flag to return values averaged at mesh-points if True and the mesh of the
+        region is not already disconnected or to return values on a disconnected mesh
+        with discontinuous values at cell transitions if False (default is True).
+    dV : ndarray of shape (q, c) or None, optional
+        Differential volumes located at the quadrature points of the cells. If None,
+        the differential volumes are taken from the region (default is None). Only
+        used for the :math:`L^2`-projections.
+    factorize : callable, optional
+        A function which factorizes a sparse matrix in CSC-format and returns an
+        object with a ``solve(b)``-method, used for the consistent projection. Default
+        is :func:`scipy.sparse.linalg.splu`.
+
+    Notes
+    -----
+    All tensor components of the values are projected in one multi-RHS solve. The
+    right-hand-side vectors are evaluated by a precomputed operator which maps the
+    (weighted) values at the quadrature-points of the cells to the mesh-points, see
+    :func:`~felupe.project` for the underlying equations.
+
+    The superconvergent patch recovery fits a linear polynomial
+
+    ..  math::
+
+        u(\boldsymbol{X}) = a_0 + \boldsymbol{a} \cdot (\boldsymbol{X} - \boldsymbol{X}_p)
+
+    in a least-squares sense to the values at the quadrature-points of all cells
+    connected to a mesh-point :math:`\boldsymbol{X}_p`. The recovered value at the
+    mesh-point is given by :math:`a_0`. The fit is linear in the values, i.e. it is
+    precomputed as a sparse operator on creation. For patches with not enough
+    quadrature-points (rank-deficient least-squares problems) the mean of the values
+    of the patch is taken.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Cube(n=6)
+    >>> region = fem.RegionHexahedron(mesh)
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>> boundaries, loadcase = fem.dof.uniaxial(field, move=-0.3)
+    >>> solid = fem.SolidBody(umat=fem.NeoHooke(mu=1, bulk=2), field=field)
+    >>> res = fem.newtonrhapson(items=[solid], **loadcase)
+    >>>
+    >>> projector = fem.tools.Projector(region)
+    >>> stress = projector(solid.evaluate.cauchy_stress())
+    >>> stress.shape
+    (216, 3, 3)
+
+    A projector may be passed as the ``project``-argument of views.
+
+    >>> view = solid.view(project=projector)
+
+    See Also
+    --------
+    felupe.project : Project given values at quadrature-points to mesh-points.
+    """
+
+    def __init__(
+        self, region, method="consistent", average=True, dV=None, factorize=splu
+    ):
+        if method not in ["consistent", "lumped", "spr"]:
+            raise ValueError('Method must be one of "consistent", "lumped" or "spr".')
+
+        self.region = region
+        self.method = method
+        self.average = average
+
+        if method == "spr":
+            self._init_spr(region, average=average)
+        else:
+            self._init_l2(region, average=average, dV=dV, factorize=factorize)
+
+    def _init_l2(self, region, average, dV, factorize):
+        "Assemble and factorize (or lump) the volume matrix."
+
+        region = _projection_region(region, average=average)
+
+        if dV is None:
+            dV = region.dV
+
+        self.mesh = region.mesh
+        self._incidence_matrix = region.mesh.incidence_matrix
+
+        # weighted element shape functions (point-per-cell, quadrature-point, cell)
+        self._weights = region.h * dV
+        self._solve = None
+
+        if self.method == "lumped":
+            diagonal = self._incidence_matrix @ self._weights.sum(axis=1).T.ravel()
+            diagonal[diagonal == 0] = 1
+            self._diagonal = diagonal.reshape(-1, 1)
+
+        else:
+            v = u = Field(region, dim=1)
+            A = IntegralFormCartesian(np.ones((1, 1)), v=v, dV=dV, u=u).assemble()
+
+            # fix diagonal items of the matrix for points not connected to cells
+            zeros_on_diagonal = A.diagonal() == 0
+            if np.any(zeros_on_diagonal):
+                A = A.tolil()
+                A[zeros_on_diagonal, zeros_on_diagonal] = 1
+
+            self._solve = factorize(A.tocsc()).solve
+
+    def _init_spr(self, region, average):
+        "Precompute the linear operator of the superconvergent patch recovery."
+
+        mesh = region.mesh
+        if not average:
+            mesh = mesh.disconnect()
+
+        points = mesh.points
+        cells = mesh.cells
+        npoints, dim = points.shape
+        ncells, points_per_cell = cells.shape
+
+        # coordinates of the quadrature-points, relative to the cell-centers
+        x = np.einsum("aqc,cad->cqd", region.h, points[cells])
+        center = x.mean(axis=1)
+        nquadraturepoints = x.shape[1]
+
+        # global length-scale for well-conditioned patch-matrices
+        scale = np.linalg.norm(points[cells] - center[:, None], axis=-1).mean()
+        scale = scale if scale > 0 else 1.0
+
+        dx = (x - center[:, None]) / scale
+        shift = (center[:, None] - points[cells]) / scale
+
+        # assembled moment matrices of the linear polynomial per patch
+        m = 1 + dim
+        moments = np.einsum("cqi,cqj->cij", dx, dx)
+        A = np.zeros((ncells, points_per_cell, m, m))
+        A[..., 0, 0] = nquadraturepoints
+        A[..., 0, 1:] = A[..., 1:, 0] = nquadraturepoints * shift
+        A[..., 1:, 1:] = moments[:, None] + nquadraturepoints * np.einsum(
+            "cai,caj->caij", shift, shift
+        )
+
+        incidence = mesh.incidence_matrix
+        A = (incidence @ A.reshape(-1, m * m)).reshape(npoints, m, m)
+
+        # first row of the inverse of the patch-matrices, fallback to the patch-mean
+        count = A[:, 0, 0]
+        g = np.zeros((npoints, m))
+        g[:, 0] = np.divide(1, count, out=np.zeros(npoints), where=count > 0)
+
+        regular = np.linalg.cond(A) < 1e8
+        e0 = np.zeros((regular.sum(), m, 1))
+        e0[:, 0] = 1
+        g[regular] = np.linalg.solve(A[regular], e0)[..., 0]
+
+        alpha = g[cells, 0] + np.einsum("cai,cai->ca", g[cells, 1:], shift)
+
+        self.mesh = mesh
+        self._alpha = sparsematrix(
+            (
+                alpha.ravel(),
+                (cells.ravel(), np.repeat(np.arange(ncells), points_per_cell)),
+            ),
+            shape=(npoints, ncells),
+        )
+        self._moments = sparsematrix(
+            (
+                np.ones(cells.size),
+                (cells.ravel(), np.repeat(np.arange(ncells), points_per_cell)),
+            ),
+            shape=(npoints, ncells),
+        )
+        self._gradient = g[:, 1:]
+        self._dx = dx
+
+    def __call__(self, values, region=None):
+        """Project given values at quadrature-points to mesh-points.
+
+        Parameters
+        ----------
+        values : ndarray of shape (..., q, c)
+            Array with values located at the quadrature points ``q`` of cells ``c``.
+        region : Region or None, optional
+            If given, the region must be the region of the projector (default is None).
+            This argument is only available for compatibility with
+            :func:`~felupe.project`.
+
+        Returns
+        -------
+        ndarray of shape (p, ...)
+            Array of values projected to the mesh-points ``p``.
+        """
+
+        if region is not None and region is not self.region:
+            raise ValueError("The region must be the region of the projector.")
+
+        shape = values.shape[:-2]  # tensor-components
+        size = np.prod(shape).astype(int)  # tensor-size (enforce int for empty tuple)
+        values = values.reshape(size, *values.shape[-2:])
+
+        if self.method == "spr":
+            ncells, nquadraturepoints, dim = self._dx.shape
+            values = np.broadcast_to(values, (size, nquadraturepoints, ncells))
+
+            sums = values.sum(axis=1).T
+            moments = np.einsum("cqi,sqc->cis", self._dx, values)
+            moments = self._moments @ moments.reshape(ncells, -1)
+
+            out = self._alpha @ sums + np.einsum(
+                "pi,pis->ps", self._gradient, moments.reshape(-1, dim, size)
+            )
+
+        else:
+            b = np.einsum("aqc,sqc->cas", self._weights, values)
+            b = self._incidence_matrix @ b.reshape(-1, size)
+
+            if self.method == "lumped":
+                out = b / self._diagonal
+            else:
+                out = self._solve(b)
+
+        return out.reshape(-1, *shape)
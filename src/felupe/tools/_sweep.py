@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import multiprocessing
+import os
+import tempfile
+from functools import partial
+
+from ._dump import dump, load
+
+# the shared object of a worker process
+_shared = {}
+
+
+def _init(path):
+    "Load the shared object once per worker process with read-only arrays."
+
+    _shared["region"] = load(path, mmap_mode="r")
+
+
+def _evaluate(fun, parameters):
+    "Evaluate the function with the shared object of the worker process."
+
+    return fun(_shared["region"], parameters)
+
+
+def parameter_sweep(
+    fun,
+    region,
+    parameters,
+    processes=None,
+    chunksize=1,
+    context=None,
+    minsize=1024,
+):
+    r"""Evaluate a model for a sequence of parameter sets in a pool of processes, where
+    the region is created only once and its (large) arrays are shared read-only by all
+    processes.
+
+    Parameters
+    ----------
+    fun : callable
+        The model function with signature ``fun(region, parameters)``, which is
+        called once for each parameter set. It must be picklable, i.e. defined on the
+        top-level of a module, and return picklable results, e.g. the force-
+        displacement data ``curve.x`` and ``curve.y`` of a
+        :class:`~felupe.CharacteristicCurve`.
+    region : Region
+        The region (or any other picklable object, e.g. a list of regions) which is
+        passed to the model function.
+    parameters : list
+        The sequence of parameter sets (e.g. dicts of material parameters or load
+        magnitudes).
+    processes : int or None, optional
+        The number of worker processes. If None, :func:`os.cpu_count` is used. If 1,
+        the parameter sets are evaluated in the current process (default is None).
+    chunksize : int, optional
+        The number of parameter sets which are submitted to a worker process at once
+        (default is 1).
+    context : str or None, optional
+        The start method of the worker processes, one of ``"fork"``, ``"spawn"`` or
+        ``"forkserver"``. If None, the default start method is used (default is
+        None).
+    minsize : int, optional
+        The minimum size of an array in bytes to be shared (default is 1024).
+
+    Returns
+    -------
+    list
+        The results of the model function in the order of the parameter sets.
+
+    Notes
+    -----
+    The region is saved only once by :func:`~felupe.tools.dump`. All arrays with at
+    least ``minsize`` bytes, e.g. the points and cells of the mesh and the shape
+    functions, their gradients and the differential volumes of the region, are stored
+    as binary files in a temporary directory. Each worker process loads the region
+    once and maps the arrays read-only into memory. Hence, the memory pages of the
+    arrays are shared by all processes instead of being copied for each worker or
+    re-computed for each parameter set. Broadcasted arrays, like the geometry of a
+    region with affine or uniform cells, are shared in their compact form. The
+    temporary directory is removed after all parameter sets are evaluated.
+
+    ..  note::
+        The arrays of the region are read-only in the worker processes. New fields,
+        solid bodies, steps and jobs must be created inside the model function.
+
+    Examples
+    --------
+    The model function must be defined on the top-level of a module.
+
+    >>> import felupe as fem
+    >>>
+    >>> def model(region, mu):
+    ...     field = fem.FieldContainer([fem.Field(region, dim=3)])
+    ...     boundaries, loadcase = fem.dof.uniaxial(field, clamped=True)
+    ...     solid = fem.SolidBody(umat=fem.NeoHooke(mu=mu, bulk=5000), field=field)
+    ...     move = fem.math.linsteps([0, 0.3], num=3)
+    ...     step = fem.Step(
+    ...         items=[solid], ramp={boundaries["move"]: move}, boundaries=boundaries
+    ...     )
+    ...     curve = fem.CharacteristicCurve(steps=[step], boundary=boundaries["move"])
+    ...     curve.evaluate()
+    ...     return curve.x, curve.y
+    >>>
+    >>> region = fem.RegionHexahedron(fem.Cube(n=6))
+    >>> results = fem.tools.parameter_sweep(model, region, [1.0, 2.0, 3.0])
+
+    See Also
+    --------
+    felupe.CharacteristicCurve : A job with a list of steps and a method to evaluate
+        them, which tracks force-displacement curve data.
+    """
+
+    if processes is None:
+        processes = os.cpu_count()
+
+    if processes == 1:
+        return [fun(region, p) for p in parameters]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = dump(region, directory, minsize=minsize)
+
+        ctx = multiprocessing.get_context(context)
+        with ctx.Pool(processes, initializer=_init, initargs=(path,)) as pool:
+            results = pool.map(partial(_evaluate, fun), parameters, chunksize)
+
+    return results
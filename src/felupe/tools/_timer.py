@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class Timer:
+    r"""A timer which accumulates the wall-clock runtimes and the number of calls of
+    named events.
+
+    Parameters
+    ----------
+    callback : callable or None, optional
+        A callable which is called after each completed event. Function signature must
+        be ``lambda name, time: None``, where ``time`` is the runtime of the event in
+        seconds (default is None).
+
+    Attributes
+    ----------
+    times : dict of float
+        The accumulated runtimes of the events in seconds.
+    counts : dict of int
+        The number of calls of the events.
+
+    Notes
+    -----
+    Runtimes of nested events are inclusive, i.e. the runtime of an outer event
+    contains the runtimes of all its inner events. A timer is attached to the
+    :class:`~felupe.SolidBody`, :class:`~felupe.SolidBodyNearlyIncompressible` and
+    :class:`~felupe.MultiPointConstraint` items as ``item.timer``. Per-substep reports
+    of all timers are collected by :meth:`Job.evaluate(profile=True)
+    <felupe.Job.evaluate>`.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> timer = fem.tools.Timer()
+    >>> with timer("assemble"):
+    >>>     pass
+    >>>
+    >>> timer.counts
+    {'assemble': 1}
+
+    The timers of solid bodies record the runtimes of the evaluation of the kinematics,
+    the constitutive material formulation and the integration and assembly.
+
+    >>> mesh = fem.Cube(n=6)
+    >>> region = fem.RegionHexahedron(mesh)
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>> boundaries, loadcase = fem.dof.uniaxial(field, clamped=True)
+    >>> solid = fem.SolidBody(umat=fem.NeoHooke(mu=1, bulk=2), field=field)
+    >>> res = fem.newtonrhapson(items=[solid], **loadcase)
+    >>> list(solid.timer.report().keys())
+    ['extract', 'gradient', 'integrate', 'assemble', 'hessian']
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.reset()
+
+    def reset(self):
+        "Reset all accumulated runtimes and counters."
+        self.times = {}
+        self.counts = {}
+
+    def add(self, name, time, count=1):
+        "Add a runtime and a number of calls to a named event."
+
+        self.times[name] = self.times.get(name, 0.0) + time
+        self.counts[name] = self.counts.get(name, 0) + count
+
+        if self.callback is not None:
+            self.callback(name, time)
+
+    @contextmanager
+    def __call__(self, name):
+        "Measure the runtime of a named event within a with-statement."
+
+        start = perf_counter()
+
+        try:
+            yield self
+
+        finally:
+            self.add(name, perf_counter() - start)
+
+    def report(self):
+        "Return a dict with the accumulated runtimes and counts of all events."
+
+        return {
+            name: {"time": self.times[name], "count": self.counts[name]}
+            for name in self.times.keys()
+        }
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+This file is part of FElupe.
+
+FElupe is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FElupe is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FElupe.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix as sparsematrix
+
+from ..region._region import _inverse_mapping, _is_simplex, _shape_functions
+from ._project import extrapolate as extrapolate_values
+
+
+def _clip(r, simplex):
+    "Clip natural element coordinates to the reference domain of an element."
+
+    r = np.nan_to_num(r)
+
+    if simplex:
+        r = np.maximum(r, 0)
+        total = r.sum(axis=1)
+        outside = total > 1
+        r[outside] /= total[outside].reshape(-1, 1)
+
+    else:
+        r = np.clip(r, -1, 1)
+
+    return r
+
+
+def interpolation_matrix(region, points, extrapolate=True):
+    r"""Return the sparse interpolation matrix of the point values of a region at given
+    points.
+
+    Parameters
+    ----------
+    region : Region
+        The region of the point values.
+    points : ndarray
+        The coordinates of the points of shape ``(npoints, dim)``.
+    extrapolate : bool, optional
+        A flag to evaluate the values at points outside of the region by the cells with
+        the nearest centroids, where the natural element coordinates are clipped to the
+        reference domain of the elements. If False, the rows of points outside of the
+        region are empty (default is True).
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The sparse interpolation matrix of shape ``(npoints, region.mesh.npoints)``
+        with the element shape functions of the cells which contain the points.
+
+    See Also
+    --------
+    felupe.Region.locate : Locate the cells and the natural element coordinates of
+        given points.
+    felupe.tools.Transfer : A transfer operator of values from a source region to a
+        target region.
+    """
+
+    points = np.asarray(points, dtype=float)
+    mesh = region.mesh
+    element = region.element
+
+    cells, coords = region.locate(points)
+    missing = np.nonzero(cells < 0)[0]
+
+    if extrapolate and len(missing) > 0:
+        nearest = mesh.spatial_index.nearest(points[missing], k=1)[:, 0]
+        r = _inverse_mapping(
+            element, mesh.points[mesh.cells[nearest]], points[missing]
+        )[0]
+        cells[missing] = nearest
+        coords[missing] = _clip(r, _is_simplex(element))
+
+    found = np.nonzero(cells >= 0)[0]
+    cells_found = mesh.cells[cells[found]]
+    h = _shape_functions(element, coords[found])[0]
+
+    return sparsematrix(
+        (
+            h.T.ravel(),
+            (np.repeat(found, cells_found.shape[1]), cells_found.ravel()),
+        ),
+        shape=(len(points), mesh.npoints),
+    )
+
+
+class Transfer:
+    r"""A transfer operator of values from a source region to a target region (or a
+    target mesh), e.g. for submodelling or remeshing. The sparse interpolation matrices
+    are evaluated only once and are re-used for all transfers.
+
+    Parameters
+    ----------
+    region : Region
+        The source region.
+    target : Region or Mesh
+        The target region or mesh.
+    extrapolate : bool, optional
+        A flag to evaluate the values at target points outside of the source region by
+        the cells with the nearest centroids. If False, these values are zero (default
+        is True).
+
+    Attributes
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        The sparse interpolation matrix of the source point values at the target
+        points.
+
+    Notes
+    -----
+    The points of the target are located in the source region, see
+    :meth:`Region.locate() <felupe.Region.locate>`. The interpolation matrix
+    contains the shape functions of the source cells, evaluated at the natural element
+    coordinates of the target points. Values at the quadrature-points of the source
+    region are shifted to the mesh-points of the source region first, e.g. by
+    :func:`~felupe.tools.extrapolate`. These point values are interpolated at the
+    quadrature-points of the target region.
+
+    Examples
+    --------
+    >>> import felupe as fem
+    >>>
+    >>> mesh = fem.Cube(n=6)
+    >>> region = fem.RegionHexahedron(mesh)
+    >>> field = fem.FieldContainer([fem.Field(region, dim=3)])
+    >>> boundaries, loadcase = fem.dof.uniaxial(field, move=-0.3)
+    >>> solid = fem.SolidBody(umat=fem.NeoHooke(mu=1, bulk=2), field=field)
+    >>> res = fem.newtonrhapson(items=[solid], **loadcase)
+    >>>
+    >>> new_mesh = fem.Cube(n=11).triangulate()
+    >>> new_region = fem.RegionTetra(new_mesh)
+    >>> new_field = fem.FieldContainer([fem.Field(new_region, dim=3)])
+    >>>
+    >>> transfer = fem.tools.Transfer(region, new_region)
+    >>> new_field[0].values[:] = transfer.point_data(field[0].values)
+    >>> stress = transfer.quadrature_data(solid.evaluate.cauchy_stress())
+    >>> stress.shape
+    (3, 3, 1, 6000)
+
+    See Also
+    --------
+    felupe.tools.interpolation_matrix : Return the sparse interpolation matrix of the
+        point values of a region at given points.
+    felupe.Field.probe : Interpolate the field values (or the gradient) at given
+        points.
+    """
+
+    def __init__(self, region, target, extrapolate=True):
+        self.region = region
+        self.target = target
+        self.extrapolate = extrapolate
+
+        mesh = getattr(target, "mesh", target)
+        self.matrix = interpolation_matrix(region, mesh.points, extrapolate)
+        self._quadrature_matrix = None
+
+    def point_data(self, values):
+        """Transfer values at the mesh-points of the source to the points of the target.
+
+        Parameters
+        ----------
+        values : ndarray of shape (p, ...)
+            The values at the mesh-points ``p`` of the source region.
+
+        Returns
+        -------
+        ndarray of shape (P, ...)
+            The values at the mesh-points ``P`` of the target.
+        """
+
+        values = np.asarray(values)
+        shape = values.shape[1:]
+
+        return (self.matrix @ values.reshape(len(values), -1)).reshape(-1, *shape)
+
+    def quadrature_data(self, values, project=None):
+        """Transfer values at the quadrature-points of the source region to the
+        quadrature-points of the target region.
+
+        Parameters
+        ----------
+        values : ndarray of shape (..., q, c)
+            The values at the quadrature-points ``q`` of the cells ``c`` of the source
+            region.
+        project : callable or None, optional
+            A callable which shifts the values from the quadrature-points to the
+            mesh-points of the source region, see :func:`~felupe.tools.extrapolate`,
+            :func:`~felupe.tools.project` or :class:`~felupe.tools.Projector`.
+            Function signature must be ``project(values, region)``. If None,
+            :func:`~felupe.tools.extrapolate` is used (default is None).
+
+        Returns
+        -------
+        ndarray of shape (..., Q, C)
+            The values at the quadrature-points ``Q`` of the cells ``C`` of the target
+            region.
+        """
+
+        if project is None:
+            project = extrapolate_values
+
+        target = self.target
+        h = target.h
+
+        if self._quadrature_matrix is None:
+            # coordinates of the quadrature-points of the target region
+            points = np.einsum(
+                "caI,aqc->qcI", target.mesh.points[target.mesh.cells], h
+            ).reshape(-1, target.mesh.dim)
+
+            self._quadrature_matrix = interpolation_matrix(
+                self.region, points, self.extrapolate
+            )
+
+        point_values = project(values, self.region)
+        shape = point_values.shape[1:]
+
+        out = self._quadrature_matrix @ point_values.reshape(len(point_values), -1)
+        out = out.reshape(*h.shape[1:], *shape)
+
+        return np.einsum("qc...->...qc", out)
@@ -269,6 +269,44 @@ def test_aol():
     assert aol23.shape == dhdr.shape
 
 
+def test_batched():
+    elements = [
+        fem.element.Line(),
+        fem.element.ConstantQuad(),
+        fem.element.Quad(),
+        fem.element.QuadraticQuad(),
+        fem.element.BiQuadraticQuad(),
+        fem.element.ConstantHexahedron(),
+        fem.element.Hexahedron(),
+        fem.element.QuadraticHexahedron(),
+        fem.element.TriQuadraticHexahedron(),
+        fem.element.Triangle(),
+        fem.element.QuadraticTriangle(),
+        fem.element.TriangleMINI(),
+        fem.element.Tetra(),
+        fem.element.QuadraticTetra(),
+        fem.element.TetraMINI(),
+        fem.element.ArbitraryOrderLagrange(order=3, dim=2),
+        fem.element.ArbitraryOrderLagrange(order=2, dim=3),
+    ]
+
+    for element in elements:
+        assert element.batched
+
+        r = np.random.default_rng(5).uniform(0, 0.3, (7, element.dim))
+
+        h = element.function(r)
+        dhdr = element.gradient(r)
+
+        assert h.shape == (element.shape[0], len(r))
+        assert dhdr.shape == (*element.shape, len(r))
+
+        # compare with the evaluation at single points
+        for q, rq in enumerate(r):
+            assert np.allclose(h[..., q], element.function(rq))
+            assert np.allclose(dhdr[..., q], element.gradient(rq))
+
+
 if __name__ == "__main__":
     test_line2()
 
@@ -292,3 +330,5 @@ if __name__ == "__main__":
     test_tet10()
 
     test_aol()
+
+    test_batched()
@@ -238,9 +238,79 @@ def test_view():
     # ax = mesh.imshow()
 
 
+def test_probe():
+    np.random.seed(0)
+    points = np.vstack([np.random.rand(50, 3), [[1.5, 0.5, 0.5]]])
+    A = np.array([[1.0, 2.0, 0.0], [0.0, 3.0, 1.0], [2.0, 0.0, 1.0]])
+
+    for mesh, Region in [
+        (fem.Cube(n=4), fem.RegionHexahedron),
+        (fem.Cube(n=4).triangulate(), fem.RegionTetra),
+        (fem.Cube(n=3).add_midpoints_edges(), fem.RegionQuadraticHexahedron),
+        (fem.Cube(n=3).triangulate().add_midpoints_edges(), fem.RegionQuadraticTetra),
+    ]:
+        x, y, z = mesh.points.T
+        mesh.points[:, 0] += 0.2 * x * (1 - x) * y * z
+        region = Region(mesh)
+
+        cells, r = region.locate(points)
+        assert np.all(cells[:-1] >= 0)
+        assert cells[-1] == -1
+        assert np.all(np.isnan(r[-1]))
+
+        # a linear field is reproduced exactly
+        field = fem.FieldContainer([fem.Field(region, dim=3, values=mesh.points @ A.T)])
+        u, dudX = field.probe(points, grad=True), field[0].probe(points, grad=True)
+
+        assert np.allclose(field[0].probe(points)[:, :-1], A @ points[:-1].T)
+        assert np.allclose(dudX[..., :-1], A.reshape(3, 3, 1))
+        assert np.allclose(u[0], dudX, equal_nan=True)
+        assert np.all(np.isnan(dudX[..., -1]))
+
+
+def test_grad_interpolate():
+    mesh = fem.Cube(n=4)
+    mesh.points[:, 0] += 0.1 * mesh.points[:, 1] ** 2
+    region = fem.RegionHexahedron(mesh)
+
+    for dim in [1, 3]:
+        field = fem.Field(region, dim=dim)
+        field.values[:] = np.random.rand(*field.values.shape)
+        values = field.values[mesh.cells]
+
+        dudX = np.einsum("ca...,aJqc->...Jqc", values, region.dhdX)
+        u = np.einsum("ca...,aqc->...qc", values, region.h)
+
+        assert np.allclose(field.grad(), dudX)
+        assert np.allclose(field.interpolate(), u)
+
+        # the results are stored in the given arrays
+        out = np.zeros_like(dudX)
+        assert field.grad(out=out) is out
+        assert np.allclose(out, dudX)
+
+        out = np.zeros_like(u)
+        assert field.interpolate(out=out) is out
+        assert np.allclose(out, u)
+
+        # values of all cells are evaluated in blocks of cells
+        for blocksize in [1, 5, 100]:
+            out = fem.field._base._contract(
+                field.values, mesh.cells, region.dhdX, blocksize=blocksize
+            )
+            assert np.allclose(out, dudX)
+
+    # one-dimensional values of a scalar field
+    values = np.random.rand(mesh.npoints)
+    u = fem.field._base._contract(values, mesh.cells, region.h)
+    assert np.allclose(u, np.einsum("ca,aqc->qc", values[mesh.cells], region.h))
+
+
 if __name__ == "__main__":
     test_axi()
     test_3d()
     test_3d_mixed()
     test_mixed_lagrange()
     test_view()
+    test_probe()
+    test_grad_interpolate()
@@ -271,6 +271,45 @@ def test_mixed():
         assert b.shape == (z, 1)
 
 
+def test_bilinearform_structured():
+    for mesh in [fem.Cube(n=(3, 4, 5)), fem.Rectangle(n=(5, 2)), fem.mesh.Line(n=5)]:
+        assert mesh.structured is not None
+        other = fem.Mesh(mesh.points, mesh.cells, mesh.cell_type)
+
+        matrices = []
+        forms = []
+
+        for m in [mesh, other]:
+            if m.dim == 1:
+                region = fem.Region(m, fem.Line(), fem.GaussLegendre(order=1, dim=1))
+            else:
+                region = fem.RegionHexahedron(m) if m.dim == 3 else fem.RegionQuad(m)
+
+            u = fem.Field(region, dim=m.dim)
+            p = fem.Field(region)
+            field = fem.FieldContainer([u, p])
+
+            A = np.random.default_rng(5).random((m.dim, m.dim, m.dim, m.dim, 1, 1))
+            B = np.ones((m.dim, m.dim, 1, 1))
+            C = np.ones((1, 1))
+
+            form = fem.IntegralForm(
+                fun=[A, B, C],
+                v=field,
+                dV=region.dV,
+                u=field,
+                grad_v=[True, False],
+                grad_u=[True, False],
+            )
+            matrices.append(form.assemble())
+            forms.append(form.forms[0])
+
+        assert forms[0].indices is None
+        assert forms[1].indices is not None
+        assert np.allclose(matrices[0].toarray(), matrices[1].toarray())
+        assert matrices[0].has_sorted_indices
+
+
 if __name__ == "__main__":
     test_linearform()
     test_linearform_broadcast()
@@ -278,3 +317,4 @@ if __name__ == "__main__":
     test_bilinearform_broadcast()
     test_axi()
     test_mixed()
+    test_bilinearform_structured()
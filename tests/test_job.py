@@ -59,6 +59,55 @@ def test_job():
     )
 
 
+def test_job_methods():
+    for method in ["modified-newton", "bfgs", "broyden"]:
+        field, step = pre()
+        job = fem.CharacteristicCurve(steps=[step], boundary=step.boundaries["move"])
+        job.evaluate(method=method, maxiter=32)
+
+        stretch = 1 + np.array(job.x)[:, 0]
+        area = 1**2 * np.pi
+        force = (stretch - 1 / stretch**2) * area
+
+        assert np.allclose(np.array(job.y)[:, 0], force, rtol=0.01)
+
+
+def test_job_profile():
+    field, step = pre()
+    job = fem.Job(steps=[step])
+    job.evaluate(profile=True)
+
+    assert len(job.profiles) == step.nsubsteps
+
+    profile = job.profiles[-1]
+    assert profile["iterations"] == len(job.fnorms[-1])
+    assert profile["newtonrhapson"]["jac"]["count"] == profile["iterations"]
+    assert profile["memory"] > 0
+    assert profile["items"][0]["type"] == "SolidBody"
+    assert "hessian" in profile["items"][0]["timer"].keys()
+    assert "timer" not in profile["items"][1].keys()
+
+    events = []
+    timer = fem.tools.Timer(callback=lambda name, time: events.append(name))
+
+    with timer("event"):
+        pass
+
+    assert events == ["event"]
+    assert timer.counts["event"] == 1
+
+    # tracing of the memory is stopped if a substep raises an error
+    import tracemalloc
+
+    field, step = pre()
+    job = fem.Job(steps=[step])
+
+    with pytest.raises(ValueError):
+        job.evaluate(profile=True, maxiter=1)
+
+    assert not tracemalloc.is_tracing()
+
+
 def test_job_xdmf():
     field, step = pre()
     job = fem.Job(steps=[step])
@@ -165,6 +214,8 @@ def test_noramp():
 
 if __name__ == "__main__":
     test_job()
+    test_job_methods()
+    test_job_profile()
     test_job_xdmf()
     test_job_xdmf_global_field()
     test_curve()
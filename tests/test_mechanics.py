@@ -540,6 +540,393 @@ def test_threefield():
     assert np.isclose(job.fnorms[0][-1], 0)
 
 
+def test_solidbody_decomposed():
+    mesh = fem.Cube(n=5)
+    region = fem.RegionHexahedron(mesh)
+    umat = fem.NeoHooke(mu=1, bulk=2)
+
+    results = []
+
+    for kwargs in [None, dict(parts=4), dict(parts=3, method="rcm", processes=2)]:
+        field = fem.FieldContainer([fem.Field(region, dim=3)])
+        boundaries, loadcase = fem.dof.uniaxial(field, clamped=True)
+
+        if kwargs is None:
+            solid = fem.SolidBody(umat, field)
+            evaluate = {}
+        else:
+            solid = fem.SolidBodyDecomposed(umat, field, **kwargs)
+            evaluate = {"solve": solid.solve}
+
+            assert np.all(solid.dof_labels()[solid.interface] == -1)
+
+        move = fem.math.linsteps([0, 1], num=2)
+        step = fem.Step(
+            items=[solid], ramp={boundaries["move"]: move}, boundaries=boundaries
+        )
+        curve = fem.CharacteristicCurve(steps=[step], boundary=boundaries["move"])
+        curve.evaluate(**evaluate)
+
+        results.append((field[0].values.copy(), np.array(curve.y)))
+
+        if kwargs is not None:
+            assert "matrix" in solid.timer.report()
+            solid.close()
+
+    for values, force in results[1:]:
+        assert np.allclose(values, results[0][0])
+        assert np.allclose(force, results[0][1])
+
+    # mixed fields on the same region
+    umat = fem.ThreeFieldVariation(fem.NeoHooke(mu=1, bulk=5000))
+    field = fem.FieldContainer(
+        [fem.Field(region, dim=3), fem.Field(region), fem.Field(region, values=1)]
+    )
+    field[0].values[:] = np.random.rand(*field[0].values.shape) / 10
+    solid = fem.SolidBody(umat, field)
+    solid_decomposed = fem.SolidBodyDecomposed(umat, field, parts=3)
+
+    vector = solid_decomposed.assemble.vector(field=field)
+    matrix = solid_decomposed.assemble.matrix()
+
+    assert np.allclose(vector.toarray(), solid.assemble.vector(field=field).toarray())
+    assert np.allclose(matrix.toarray(), solid.assemble.matrix().toarray())
+
+    region_constant = fem.RegionConstantHexahedron(mesh.dual(points_per_cell=1))
+    field = fem.FieldContainer([fem.Field(region, dim=3), fem.Field(region_constant)])
+
+    with pytest.raises(NotImplementedError):
+        fem.SolidBodyDecomposed(umat, field)
+
+
+def test_solidbody_hourglass():
+    mesh = fem.Cube(b=(10, 1, 1), n=(21, 3, 3))
+    umat = fem.NeoHooke(mu=1)
+
+    forces = []
+    for region, hourglass in [
+        (fem.RegionHexahedron(mesh), None),
+        (fem.RegionReducedHexahedron(mesh), 1.0),
+    ]:
+        field = fem.FieldContainer([fem.Field(region, dim=3)])
+        boundaries = {
+            "fixed": fem.Boundary(field[0], fx=0),
+            "move": fem.Boundary(field[0], fx=10, skip=(1, 1, 0)),
+        }
+        solid = fem.SolidBodyNearlyIncompressible(
+            umat, field, bulk=5000, hourglass=hourglass
+        )
+        step = fem.Step(
+            items=[solid], ramp={boundaries["move"]: [0.5, 1]}, boundaries=boundaries
+        )
+        fem.Job(steps=[step]).evaluate()
+
+        force = solid.assemble.vector(field).toarray().ravel()
+        forces.append(force[boundaries["move"].dof].sum())
+
+    assert np.isclose(forces[0], forces[1], rtol=0.1)
+
+    # rigid body rotations don't activate the hourglass control
+    region = fem.RegionReducedHexahedron(fem.Cube(n=3))
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+    solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=2), field, hourglass=1.0)
+
+    X = region.mesh.points
+    R = fem.math.rotation_matrix(30, axis=2)
+    field[0].values[:] = X @ R.T - X
+    assert np.allclose(solid.assemble.vector(field).toarray(), 0)
+
+    # the stiffness matrix is regular with hourglass control
+    field[0].values[:] = 0
+    boundaries, loadcase = fem.dof.uniaxial(field, clamped=True)
+    K = solid.assemble.matrix()[loadcase["dof1"]][:, loadcase["dof1"]]
+    assert np.linalg.matrix_rank(K.toarray()) == len(loadcase["dof1"])
+
+    # mixed-field formulations
+    region_constant = fem.RegionConstantHexahedron(region.mesh.dual(points_per_cell=1))
+    field = fem.FieldContainer(
+        [
+            fem.Field(region, dim=3),
+            fem.Field(region_constant),
+            fem.Field(region_constant, values=1),
+        ]
+    )
+    umat = fem.ThreeFieldVariation(fem.NeoHooke(mu=1, bulk=5000))
+    solid = fem.SolidBody(umat, field, hourglass=1.0)
+    assert solid.assemble.vector().shape == (sum(field.fieldsizes), 1)
+    assert solid.assemble.matrix().shape == (sum(field.fieldsizes),) * 2
+
+    # plane strain quads
+    region = fem.RegionReducedQuad(fem.Rectangle(n=3))
+    field = fem.FieldContainer([fem.FieldPlaneStrain(region, dim=2)])
+    solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=2), field, hourglass=1.0)
+    assert solid.assemble.matrix().shape == (18, 18)
+
+    # other elements are not supported
+    region = fem.RegionTetra(fem.Cube(n=3).triangulate())
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+
+    with pytest.raises(NotImplementedError):
+        fem.SolidBody(fem.NeoHooke(mu=1, bulk=2), field, hourglass=1.0)
+
+    region = fem.RegionQuad(fem.Rectangle(n=3))
+    field = fem.FieldContainer([fem.FieldAxisymmetric(region, dim=2)])
+
+    with pytest.raises(NotImplementedError):
+        fem.SolidBody(fem.NeoHooke(mu=1, bulk=2), field, hourglass=1.0)
+
+
+def test_explicit_step():
+    mesh = fem.Cube(b=(5, 1, 1), n=(6, 2, 2))
+    region = fem.RegionReducedHexahedron(mesh)
+
+    # rigid body motion with a constant initial velocity
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+    solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=5), field, hourglass=1.0)
+    velocity = np.tile([1.0, 0.5, 0.0], mesh.npoints)
+    step = fem.ExplicitStep(
+        items=[solid], density=1.0, time=[0, 1, 2], velocity=velocity
+    )
+    job = fem.Job(steps=[step]).evaluate()
+
+    assert np.allclose(field[0].values, [2.0, 1.0, 0.0])
+    assert np.allclose(step.velocity, velocity)
+    assert step.increments > 2
+    assert np.isclose(step.mass.sum(), 3 * 5 * 1.0)
+    assert len(job.timetrack) == 3
+
+    # the estimated time increment is stable
+    K = solid.assemble.matrix().toarray()
+    omega = np.sqrt(np.linalg.eigvals(K / step.mass.reshape(-1, 1)).real.max())
+    assert step.stable_time_step() < 2 / omega
+
+    # quasi-static loading with damping, compared to the static solution
+    forces = []
+    for explicit in [False, True]:
+        field = fem.FieldContainer([fem.Field(region, dim=3)])
+        boundaries = {
+            "fixed": fem.Boundary(field[0], fx=0),
+            "move": fem.Boundary(field[0], fx=5, skip=(1, 1, 0)),
+        }
+        solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=5), field, hourglass=1.0)
+
+        if explicit:
+            time = np.linspace(0, 60, 3)
+            step = fem.ExplicitStep(
+                items=[solid],
+                density=1.0,
+                time=time,
+                ramp={boundaries["move"]: np.minimum(time / 30, 1) / 2},
+                boundaries=boundaries,
+                damping=0.5,
+            )
+        else:
+            step = fem.Step(
+                items=[solid], ramp={boundaries["move"]: [0.5]}, boundaries=boundaries
+            )
+
+        job = fem.CharacteristicCurve(steps=[step], boundary=boundaries["move"])
+        job.evaluate(profile=True)
+        forces.append(job.y[-1][2])
+
+    assert np.isclose(forces[0], forces[1], rtol=1e-2)
+    assert "fun" in job.profiles[-1]["newtonrhapson"]
+
+    with pytest.raises(ValueError):
+        fem.ExplicitStep(items=[], density=1.0, time=[0, 1]).stable_time_step()
+
+    field = fem.FieldContainer([fem.Field(region, dim=3), fem.Field(region)])
+    step = fem.ExplicitStep(items=[solid], density=1.0, time=[0, 1], dt=0.1)
+
+    with pytest.raises(NotImplementedError):
+        next(step.generate(x0=field))
+
+    # the lumped mass of quadratic cells is positive
+    mesh = fem.Cube(n=3).triangulate().add_midpoints_edges()
+    region = fem.RegionQuadraticTetra(mesh)
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+    solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=5), field)
+    velocity = np.zeros(field[0].values.size)
+    velocity[::3] = mesh.points[:, 0]
+
+    step = fem.ExplicitStep(
+        items=[solid], density=1.0, time=[0, 0.5, 1], velocity=velocity
+    )
+    timer = fem.tools.Timer()
+    [substep for substep in step.generate(timer=timer)]
+
+    assert np.all(step.mass > 0)
+    assert np.isclose(step.mass.sum(), 3 * 1.0)
+
+    # the internal forces act on all points, compared to an implicit time integration
+    field_implicit = fem.FieldContainer([fem.Field(region, dim=3)])
+    solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=5), field_implicit)
+    inertia = fem.SolidBodyInertia(field_implicit, density=1.0, velocity=velocity)
+    time = np.linspace(0, 1, 21)[1:]
+    fem.Job(steps=[fem.Step(items=[solid, inertia], ramp={inertia: time})]).evaluate()
+
+    assert not np.allclose(field[0].values.ravel(), velocity, atol=0.2)
+    assert np.allclose(field[0].values, field_implicit[0].values, atol=0.1)
+
+    # the stable time increment is re-estimated at each of the given times
+    assert timer.counts["time-step"] == 3
+
+
+def test_solidbody_inertia():
+    mesh = fem.Cube(b=(5, 1, 1), n=(6, 2, 2))
+    region = fem.RegionHexahedron(mesh)
+
+    # rigid body motion with a constant initial velocity
+    for method in ["newmark", "hht", "generalized-alpha"]:
+        field = fem.FieldContainer([fem.Field(region, dim=3)])
+        solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=5), field)
+        velocity = np.tile([1.0, 0.5, 0.0], mesh.npoints)
+        inertia = fem.SolidBodyInertia(
+            field, density=1.0, method=method, velocity=velocity
+        )
+        step = fem.Step(items=[solid, inertia], ramp={inertia: [0.5, 1, 2]})
+        fem.Job(steps=[step]).evaluate()
+
+        assert np.allclose(field[0].values, [2.0, 1.0, 0.0])
+        assert np.allclose(inertia.results.velocity, velocity)
+        assert np.isclose(inertia.results.time, 2)
+
+    # the Newmark method conserves the energy of linear-elastic vibrations
+    umat = fem.LinearElastic(E=1, nu=0.3)
+    energies = []
+
+    for method in ["newmark", "generalized-alpha"]:
+        field = fem.FieldContainer([fem.Field(region, dim=3)])
+        boundaries = {"fixed": fem.Boundary(field[0], fx=0)}
+        dof0, dof1 = fem.dof.partition(field, boundaries)
+
+        solid = fem.SolidBody(umat, field)
+        velocity = np.zeros(field[0].values.size)
+        velocity[dof1] = 1e-3
+        inertia = fem.SolidBodyInertia(
+            field, density=1.0, method=method, velocity=velocity
+        )
+        K = solid.assemble.matrix()
+
+        def energy(u, v):
+            return (u @ K @ u + v @ inertia.mass @ v) / 2
+
+        time = np.linspace(0, 50, 21)[1:]
+        step = fem.Step(
+            items=[solid, inertia], ramp={inertia: time}, boundaries=boundaries
+        )
+        fem.Job(steps=[step]).evaluate()
+
+        u = field[0].values.ravel()
+        energy_0 = energy(np.zeros_like(u), velocity)
+        energies.append(energy_0 - energy(u, inertia.results.velocity))
+
+    assert np.isclose(energies[0], 0)
+    assert energies[1] > 0
+
+    inertia = fem.SolidBodyInertia(field, density=2.0, lumped=True)
+    assert np.isclose(inertia.mass.sum(), 3 * 2 * 5)
+    assert np.allclose(inertia.mass.diagonal(), inertia.mass.sum(axis=1).A1)
+
+    # the lumped mass of quadratic cells is positive
+    mesh_quadratic = fem.Cube(n=3).triangulate().add_midpoints_edges()
+    region_quadratic = fem.RegionQuadraticTetra(mesh_quadratic)
+    field_quadratic = fem.FieldContainer([fem.Field(region_quadratic, dim=3)])
+    inertia_quadratic = fem.SolidBodyInertia(field_quadratic, density=2.0, lumped=True)
+    assert np.all(inertia_quadratic.mass.diagonal() > 0)
+    assert np.isclose(inertia_quadratic.mass.sum(), 3 * 2 * 1)
+
+    with pytest.raises(ValueError):
+        inertia.assemble.vector()
+
+    with pytest.raises(ValueError):
+        fem.SolidBodyInertia(field, density=1.0, method="central-difference")
+
+    with pytest.raises(ValueError):
+        fem.SolidBodyInertia(field, density=1.0, method="hht", alpha=0.1)
+
+    with pytest.raises(ValueError):
+        fem.SolidBodyInertia(field, density=1.0, method="generalized-alpha", rho=2)
+
+
+def test_arclength_step():
+    mesh = fem.Cube(n=2)
+    region = fem.RegionHexahedron(mesh)
+    umat = fem.Hyperelastic(fem.yeoh, C10=0.5, C20=-0.25, C30=0.025)
+    right = mesh.points[:, 0] == 1
+
+    # snap-through of an unstable material under a (dead) point load
+    for method in ["newton", "modified-newton"]:
+        field = fem.FieldContainer([fem.Field(region, dim=3)])
+        boundaries = fem.dof.symmetry(field[0])
+        solid = fem.SolidBody(umat & fem.Volumetric(bulk=5), field)
+        load = fem.PointLoad(field, right)
+
+        step = fem.ArcLengthStep(
+            items=[solid, load],
+            ramp={load: [0.01, 0, 0]},
+            boundaries=boundaries,
+            arclength=0.1,
+            nsubsteps=25,
+        )
+
+        results = []
+        fem.Job(
+            steps=[step], callback=lambda j, i, substep: results.append(substep)
+        ).evaluate(method=method)
+
+        lpf = np.array([res.lpf for res in results])
+
+        assert len(results) == 25
+        assert np.all([res.success for res in results])
+        assert 13 < lpf.max() < 14.1
+        assert lpf[-1] < lpf.max()
+        assert np.isclose(step.lpf, lpf[-1])
+        assert np.allclose(load.values, [0.01 * step.lpf, 0, 0])
+
+    # compare the first increment with a force-controlled step
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+    boundaries = fem.dof.symmetry(field[0])
+    solid = fem.SolidBody(umat & fem.Volumetric(bulk=5), field)
+    load = fem.PointLoad(field, right)
+
+    step = fem.ArcLengthStep(
+        items=[solid, load],
+        ramp={load: [0.01, 0, 0]},
+        boundaries=boundaries,
+        arclength=0.1,
+        lpfmax=1e-3,
+        psi=1.0,
+    )
+    fem.Job(steps=[step]).evaluate()
+
+    assert 0 < step.lpf < 14
+
+    field_static = fem.FieldContainer([fem.Field(region, dim=3)])
+    boundaries = fem.dof.symmetry(field_static[0])
+    solid = fem.SolidBody(umat & fem.Volumetric(bulk=5), field_static)
+    load = fem.PointLoad(field_static, right)
+    step_static = fem.Step(
+        items=[solid, load],
+        ramp={load: [[0.01 * step.lpf, 0, 0]]},
+        boundaries=boundaries,
+    )
+    fem.Job(steps=[step_static]).evaluate()
+
+    assert np.allclose(field_static[0].values, field[0].values)
+
+    with pytest.raises(ValueError):
+        fem.ArcLengthStep(items=[solid, load], ramp={})
+
+    with pytest.raises(ValueError):
+        fem.ArcLengthStep(items=[solid], ramp={boundaries["symx"]: 1})
+
+    step = fem.ArcLengthStep(items=[solid, load], ramp={load: 1})
+
+    with pytest.raises(ValueError):
+        next(step.generate(method="bfgs"))
+
+
 if __name__ == "__main__":
     test_simple()
     test_solidbody()
@@ -552,3 +939,8 @@ if __name__ == "__main__":
     test_load()
     test_view()
     test_threefield()
+    test_solidbody_decomposed()
+    test_solidbody_hourglass()
+    test_explicit_step()
+    test_solidbody_inertia()
+    test_arclength_step()
@@ -553,6 +553,270 @@ def test_expand():
     assert np.allclose(cube.points.max(axis=0), [1, 2, 3])
 
 
+def test_mesh_averaging_matrix():
+    mesh = fem.Rectangle(n=3)
+    mesh.update(points=np.vstack([mesh.points, [2, 2]]))
+
+    summed = mesh.incidence_matrix @ np.ones(mesh.cells.size)
+    assert np.allclose(summed[:-1], mesh.cells_per_point[:-1])
+    assert summed[-1] == 0
+
+    values = np.arange(mesh.ncells).repeat(mesh.cells.shape[1])
+    averaged = mesh.averaging_matrix @ values
+    assert np.allclose(averaged, [0, 0.5, 1, 1, 1.5, 2, 2, 2.5, 3, 0])
+
+    # the matrices are cached
+    assert mesh.averaging_matrix is mesh.averaging_matrix
+
+    # the cache is cleared on update
+    matrix = mesh.averaging_matrix
+    mesh.update(cells=mesh.cells[:2])
+    assert mesh.averaging_matrix is not matrix
+    assert mesh.averaging_matrix.shape == (mesh.npoints, 8)
+
+
+def test_mesh_renumber():
+    mesh = fem.Cube(n=5)
+
+    # shuffle the points and cells
+    points_order = np.random.default_rng(4).permutation(mesh.npoints)
+    inverse = np.argsort(points_order)
+    cells = inverse[mesh.cells][::-1]
+    shuffled = fem.Mesh(mesh.points[points_order], cells, mesh.cell_type)
+
+    def bandwidth(m):
+        return (m.cells.max(axis=1) - m.cells.min(axis=1)).max()
+
+    for method in ["rcm", "hilbert", "morton"]:
+        new, points_order, cells_order = shuffled.renumber(
+            method=method, return_permutations=True
+        )
+        assert np.allclose(new.points, shuffled.points[points_order])
+        assert np.allclose(
+            new.points[new.cells], shuffled.points[shuffled.cells[cells_order]]
+        )
+        assert np.isclose(
+            fem.RegionHexahedron(new).dV.sum(),
+            fem.RegionHexahedron(shuffled).dV.sum(),
+        )
+
+    new = shuffled.renumber(method="rcm")
+    assert bandwidth(new) < bandwidth(shuffled)
+
+    new = fem.mesh.renumber(shuffled, method="hilbert", sort_cells=False)
+    assert new.ncells == shuffled.ncells
+
+    points, cells, cell_type = fem.mesh.renumber(
+        mesh.points, mesh.cells, mesh.cell_type, method="morton"
+    )
+    assert points.shape == mesh.points.shape
+
+    with pytest.raises(ValueError):
+        mesh.renumber(method="invalid")
+
+
+def test_mesh_topology():
+    mesh = fem.Rectangle(n=3)
+    topology = mesh.topology
+
+    assert topology is mesh.topology
+    assert np.allclose(topology.point_cells[4].indices, [0, 1, 2, 3])
+    assert np.allclose(mesh.get_cell_ids([0, 4]), [0, 1, 2, 3])
+    assert np.allclose(mesh.get_cell_ids_neighbours([0]), [0, 1, 2, 3])
+
+    assert topology.edges.shape == (12, 2)
+    assert topology.cells_edges.shape == (4, 4)
+    assert topology.faces.shape == (4, 4)
+    assert topology.boundary.sum() == 8
+    assert np.allclose(topology.neighbours[0], [-1, 1, 2, -1])
+    assert np.all(topology.facets_cells[topology.boundary, 1] == -1)
+
+    # the topology is re-created on update
+    mesh.update(points=mesh.points)
+    assert topology is not mesh.topology
+
+    # the topology is not copied
+    assert "_cache" not in mesh.copy().__dict__
+
+    for mesh in [
+        fem.Cube(n=4),
+        fem.Cube(n=4).add_midpoints_edges(),
+        fem.Cube(n=4).triangulate(),
+        fem.Rectangle(n=4).triangulate(),
+    ]:
+        topology = mesh.topology
+        neighbours = topology.neighbours
+        assert neighbours.shape == mesh.topology.cells_facets.shape
+
+        # neighbours are symmetric
+        cell_ids, facet_ids = np.nonzero(neighbours >= 0)
+        other = neighbours[neighbours[cell_ids, facet_ids]]
+        assert np.all(np.any(other == cell_ids.reshape(-1, 1), axis=1))
+
+        # the edges are identical to the collected edges
+        if mesh.cell_type in ["hexahedron", "tetra", "triangle"]:
+            points_edges, cells_edges, cell_type = fem.mesh.collect_edges(
+                mesh.points, mesh.cells, mesh.cell_type
+            )
+            assert np.allclose(cells_edges, topology.cells_edges)
+
+    mesh = fem.mesh.Line(n=3)
+    assert np.allclose(mesh.topology.neighbours, [[-1, 1], [0, -1]])
+
+    with pytest.raises(NotImplementedError):
+        fem.Cube(n=3).convert(1, 0).topology.edges
+
+    array = np.random.default_rng(5).integers(0, 2**40, size=(100, 4))
+    array[50:] = array[:50]
+    unique, index, inverse, counts = fem.mesh._topology.unique_rows(
+        array, return_index=True, return_inverse=True, return_counts=True
+    )
+    expected = np.unique(array, True, True, True, axis=0)
+    for a, b in zip([unique, index, inverse, counts], expected):
+        assert np.allclose(a, b.reshape(a.shape))
+
+
+def test_mesh_spatial_index():
+    mesh = fem.Rectangle(n=5)
+    index = mesh.spatial_index
+
+    assert index is mesh.spatial_index
+    assert np.allclose(index.radius, np.sqrt(2) / 8)
+
+    point_ids, cell_ids = index.candidates([[0.3, 0.6], [0.5, 0.5], [2.0, 0.0]])
+    assert np.all(point_ids[:1] == 0)
+    assert cell_ids[0] == 9
+    assert np.sum(point_ids == 1) == 4
+    assert np.sum(point_ids == 2) == 0
+
+    assert np.all(index.nearest([[0.3, 0.6]], k=2)[0, :1] == 9)
+
+    # the index is re-created on update
+    mesh.update(points=mesh.points * 2)
+    assert index is not mesh.spatial_index
+
+
+def test_mesh_structured():
+    assert fem.Rectangle(n=(3, 4)).structured == (3, 4)
+    assert fem.Cube(n=3).structured == (3, 3, 3)
+    assert fem.Grid(np.linspace(0, 1, 3), np.linspace(0, 1, 5)).structured == (3, 5)
+    assert fem.Grid(*[np.linspace(0, 1, 3)] * 2, indexing="xy").structured is None
+
+    mesh = fem.Cube(n=3)
+    assert mesh.copy().structured == (3, 3, 3)
+    assert mesh.triangulate().structured is None
+
+    mesh.update(cells=mesh.cells[::-1])
+    assert mesh.structured is None
+
+
+def test_mesh_merge_duplicate_points():
+    rect1 = fem.Rectangle(n=11)
+    rect2 = fem.Rectangle(a=(0.9, 0), b=(1.9, 1), n=11)
+    rect2.points[:, 1] += 1e-9 * (rect2.points[:, 0] - 0.9)
+    stack = fem.mesh.stack(fem.MeshContainer([rect1, rect2]).meshes)
+
+    # exact duplicates, points are sorted lexicographically
+    mesh = stack.merge_duplicate_points()
+    assert mesh.npoints == 231
+    assert np.all(np.diff(mesh.points[:, 0]) >= 0)
+    assert np.allclose(mesh.points[mesh.cells], stack.points[stack.cells])
+
+    # duplicates within a tolerance (also only on the boundary)
+    for boundary in [False, True]:
+        mesh = stack.merge_duplicate_points(tol=1e-6, boundary=boundary)
+        assert mesh.npoints == 220
+        assert np.allclose(mesh.points[mesh.cells], stack.points[stack.cells])
+
+    assert stack.merge_duplicate_points(decimals=6, boundary=True).npoints == 220
+
+    container = fem.MeshContainer([rect1, rect2], merge=True, tol=1e-6)
+    assert container.points.shape == (220, 2)
+
+
+def test_container_blocks():
+    cube = fem.Cube(n=3)
+    block_1, block_2 = cube.copy(), cube.copy()
+    block_1.update(cells=cube.cells[:3])
+    block_2.update(points=block_1.points, cells=cube.cells[3:])
+
+    # meshes with a shared points array refer to the same block of points
+    container = fem.MeshContainer([block_1, block_2, fem.Rectangle(n=3).expand(n=2)])
+    assert container.points.shape == (27 + 18, 3)
+    assert np.all([mesh.points is container.points for mesh in container.meshes])
+    assert np.allclose(container.meshes[1].cells, cube.cells[3:])
+    assert container.meshes[1].npoints == 45
+
+    # the points are concatenated on demand
+    container.append(fem.Cube(a=(1, 0, 0), b=(2, 1, 1), n=3))
+    container.append(container.meshes[0])
+    assert container.points.shape == (72, 3)
+    assert np.all([mesh.points is container.points for mesh in container.meshes])
+    assert np.allclose(container.meshes[-1].cells, cube.cells[:3])
+
+    meshes = container.meshes
+    container.merge_duplicate_points()
+    assert container.points.shape == (45, 3)
+    assert container.meshes[0] is meshes[0]
+    assert np.all([mesh.points is container.points for mesh in container.meshes])
+    assert np.isclose(container.points[container.meshes[3].cells][..., 0].min(), 1)
+
+
+def test_mesh_partition():
+    mesh = fem.Cube(n=7)
+
+    for method in ["bisection", "rcm", "hilbert", "morton"]:
+        labels = fem.mesh.partition(mesh, parts=5, method=method)
+        counts = np.bincount(labels)
+
+        assert len(counts) == 5
+        assert counts.max() - counts.min() <= 1
+
+    labels = fem.mesh.partition(fem.Rectangle(n=5), parts=4)
+    assert np.all(labels.reshape(4, 4)[:2, :2] == 0)
+
+    assert np.all(fem.mesh.partition(mesh, parts=1) == 0)
+
+    with pytest.raises(ValueError):
+        fem.mesh.partition(mesh, parts=0)
+
+    with pytest.raises(ValueError):
+        fem.mesh.partition(mesh, parts=2, method="unknown")
+
+
+def test_mesh_points_without_cells():
+    mesh = fem.Rectangle(n=3)
+    mesh.update(points=np.vstack((mesh.points, [0, 2])))
+
+    assert np.allclose(mesh.points_without_cells, [9])
+
+    # a mesh-point without cells is used as the center point of a MPC
+    mesh.points_without_cells = np.array([], dtype=bool)
+
+    assert len(mesh.points_without_cells) == 0
+
+    region = fem.RegionQuad(mesh)
+    field = fem.FieldContainer([fem.Field(region, dim=2)])
+    boundaries = {"center": fem.Boundary(field[0], fy=2)}
+    dof0, dof1 = fem.dof.partition(field, boundaries)
+
+    assert np.allclose(dof0, [18, 19])
+    assert 18 not in dof1
+
+    # the cache is cleared on update
+    mesh.update(points=mesh.points)
+
+    assert np.allclose(mesh.points_without_cells, [9])
+
+    # the points and meshes of a mesh container are assignable
+    container = fem.MeshContainer([fem.Rectangle(n=3), fem.Rectangle(n=2)])
+    container.points = container.points + 1
+    container.meshes = container.meshes[:1]
+
+    assert np.isclose(container.points.min(), 1)
+    assert len(container.meshes) == 1
+
+
 if __name__ == "__main__":
     test_meshes()
     test_mirror()
@@ -572,3 +836,12 @@ if __name__ == "__main__":
     test_mesh_update()
     test_modify_corners()
     test_expand()
+    test_mesh_averaging_matrix()
+    test_mesh_renumber()
+    test_mesh_topology()
+    test_mesh_spatial_index()
+    test_mesh_structured()
+    test_mesh_merge_duplicate_points()
+    test_container_blocks()
+    test_mesh_partition()
+    test_mesh_points_without_cells()
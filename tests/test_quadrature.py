@@ -120,6 +120,18 @@ def test_tetra():
         fem.TetrahedronQuadrature(order=4)
 
 
+def test_triangle_tetra_boundary():
+    q = fem.quadrature.TriangleBoundary(order=2)
+    assert q.points.shape == (3, 2)
+    assert np.allclose(q.points[:, 1], 0)
+    assert np.isclose(q.weights.sum(), 1)
+
+    q = fem.quadrature.TetrahedronBoundary(order=2)
+    assert q.points.shape == (3, 3)
+    assert np.allclose(q.points[:, 2], 0)
+    assert np.isclose(q.weights.sum(), 1 / 2)
+
+
 def test_sphere():
     q = fem.BazantOh(n=21)
     assert q.points.shape == (21, 3)
@@ -131,4 +143,5 @@ if __name__ == "__main__":
     test_gausslegendre_boundary()
     test_triangle()
     test_tetra()
+    test_triangle_tetra_boundary()
     test_sphere()
@@ -147,5 +147,142 @@ def test_region():
     assert not np.any(r.dV <= 0)
 
 
+def test_region_boundary_simplex():
+    rectangle = fem.Rectangle(n=4).triangulate()
+    cube = fem.Cube(n=4).triangulate()
+
+    for mesh, Region, area in [
+        (rectangle, fem.RegionTriangleBoundary, 4),
+        (rectangle.add_midpoints_edges(), fem.RegionQuadraticTriangleBoundary, 4),
+        (rectangle.add_midpoints_faces(), fem.RegionTriangleMINIBoundary, 4),
+        (cube, fem.RegionTetraBoundary, 6),
+        (cube.add_midpoints_edges(), fem.RegionQuadraticTetraBoundary, 6),
+        (cube.add_midpoints_volumes(), fem.RegionTetraMINIBoundary, 6),
+    ]:
+        region = Region(mesh)
+        assert np.isclose(region.dV.sum(), area)
+
+        # outward normals: integral of x * n dA is equal to the dimension times volume
+        x = np.einsum("aqc,cad->dqc", region.h, mesh.points[region.mesh.cells])
+        xn = np.einsum("dqc,dqc,qc->", x, region.normals, region.dV)
+        assert np.isclose(xn, mesh.dim)
+
+        # the boundary cells are cached on the mesh and re-used with masks
+        region = Region(mesh, mask=mesh.x == 1)
+        assert np.isclose(region.dV.sum(), 1)
+
+        region = Region(mesh, only_surface=False)
+        assert region.dV.sum() > area
+
+    region = fem.RegionQuadraticTetraBoundary(cube.add_midpoints_edges())
+    assert region.mesh_faces().cell_type == "triangle6"
+
+
+def test_region_affine():
+    mesh = fem.Cube(n=4)
+    distorted = mesh.copy()
+    distorted.points[:, 0] += 0.1 * mesh.points[:, 1] * mesh.points[:, 2]
+
+    for region, affine in [
+        (fem.RegionHexahedron(mesh), True),
+        (fem.RegionHexahedron(distorted), False),
+        (fem.RegionTetra(mesh.triangulate()), True),
+        (fem.RegionQuadraticTetra(mesh.triangulate().add_midpoints_edges()), True),
+        (fem.RegionTetraMINI(mesh.triangulate().add_midpoints_volumes()), False),
+    ]:
+        assert region.affine == affine
+
+        # geometric gradients of affine cells are views without copies
+        assert region.dXdr.flags.writeable != affine
+        assert not region.h.flags.writeable
+
+        # compare with the evaluation at all quadrature points
+        dhdr = region.element.dhdr
+        dXdr = np.einsum("caI,aJq->IJqc", region.mesh.points[region.mesh.cells], dhdr)
+        dhdX = np.einsum("aIq,IJqc->aJqc", dhdr, fem.math.inv(dXdr))
+        dV = fem.math.det(dXdr) * region.quadrature.weights.reshape(-1, 1)
+
+        assert np.allclose(region.dXdr, dXdr)
+        assert np.allclose(region.dhdX, dhdX)
+        assert np.allclose(region.dV, dV)
+        assert np.isclose(region.dV.sum(), 1)
+
+        region.copy()
+
+
+def test_region_reload():
+    for mesh, Region in [
+        (fem.Cube(n=4), fem.RegionHexahedron),
+        (fem.Cube(n=4).triangulate(), fem.RegionTetra),
+        (fem.Cube(n=3).add_midpoints_edges(), fem.RegionQuadraticHexahedron),
+    ]:
+        region = Region(mesh)
+        element = region.element
+
+        # move all points, a single point and modify the points inplace
+        points = mesh.points.copy()
+        points[:, 0] += 0.1 * mesh.points[:, 1] * mesh.points[:, 2]
+        mesh.update(points=points, callback=region.reload)
+
+        points = mesh.points.copy()
+        points[5] += 0.02
+        mesh.update(points=points, callback=region.reload)
+
+        mesh.points[7] -= 0.01
+        region.reload(mesh)
+
+        assert region.element is element
+
+        other = Region(mesh)
+        assert region.affine == other.affine
+
+        for key in ["h", "dhdr", "dXdr", "drdX", "dV", "dhdX"]:
+            assert np.allclose(getattr(region, key), getattr(other, key))
+
+    mesh = fem.Cube(n=3)
+    region = fem.RegionHexahedron(mesh)
+    region.reload(fem.Cube(n=4))
+    assert region.dV.shape == (8, 27)
+    assert np.isclose(region.dV.sum(), 1)
+
+
+def test_region_uniform():
+    rectangle = fem.Rectangle(n=4)
+    rectangle.points[:] = rectangle.rotate(30, axis=2).points
+
+    for mesh, Region in [
+        (fem.Cube(a=(0, 0, 0), b=(1, 2, 3), n=(3, 4, 5)), fem.RegionHexahedron),
+        (rectangle, fem.RegionQuad),
+        (fem.Grid(np.linspace(0, 1, 4), np.linspace(1, 3, 5)), fem.RegionQuad),
+    ]:
+        region = Region(mesh)
+        other = Region(fem.Mesh(mesh.points, mesh.cells, mesh.cell_type))
+
+        assert region.uniform
+        assert not other.uniform
+
+        for key in ["dXdr", "drdX", "dV", "dhdX"]:
+            assert np.allclose(getattr(region, key), getattr(other, key))
+
+        # the geometry is re-evaluated for all cells if the points are moved
+        mesh.points[-1] += 0.1
+        region.reload(mesh)
+        assert not region.uniform
+        assert np.allclose(region.dV, Region(mesh).dV)
+
+    mesh = fem.Grid(np.linspace(0, 1, 4) ** 2, np.linspace(1, 3, 5))
+    assert not fem.RegionQuad(mesh).uniform
+
+    # a slightly non-uniform grid, far away from the origin
+    x = np.linspace(0, 1, 4)
+    x[1] += 1e-7
+    mesh = fem.Grid(x + 1e6, np.linspace(1, 3, 5) + 1e6)
+    assert not fem.RegionQuad(mesh).uniform
+
+
 if __name__ == "__main__":
     test_region()
+    test_region_boundary_simplex()
+    test_region_affine()
+    test_region_reload()
+    test_region_uniform()
@@ -72,5 +72,42 @@ def test_solve():
     assert np.allclose(du, 0)
 
 
+def test_schur_complement_solver():
+    mesh = fem.Cube(n=5)
+    region = fem.RegionHexahedron(mesh)
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+    boundaries, loadcase = fem.dof.uniaxial(field, clamped=True)
+
+    umat = fem.LinearElastic(E=1, nu=0.3)
+    solid = fem.SolidBody(umat, field)
+    A = solid.assemble.matrix()
+    b = solid.assemble.vector().toarray()[:, 0]
+
+    labels = fem.mesh.partition(mesh, parts=3)
+    dof_labels = np.zeros((mesh.npoints, 3), dtype=int)
+
+    for label in range(3):
+        points = np.unique(mesh.cells[labels == label])
+        dof_labels[points] = np.where(dof_labels[points] != 0, -1, label + 1)
+
+    dof_labels = dof_labels.ravel() - 1
+    dof_labels[dof_labels == -2] = -1
+
+    system = fem.solve.partition(field, A, loadcase["dof1"], loadcase["dof0"], b)
+    ext0 = loadcase["ext0"]
+
+    du = fem.solve.solve(*system, ext0)
+
+    for method in ["cg", "gmres"]:
+        solver = fem.solve.SchurComplementSolver(
+            dof_labels[loadcase["dof1"]], method=method
+        )
+        du_schur = fem.solve.solve(*system, ext0, solver=solver)
+
+        assert np.allclose(du_schur, du)
+        assert solver.iterations > 0
+
+
 if __name__ == "__main__":
     test_solve()
+    test_schur_complement_solver()
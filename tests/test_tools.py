@@ -25,6 +25,8 @@ along with Felupe.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
+import tempfile
+
 import numpy as np
 import pytest
 
@@ -196,6 +198,66 @@ def test_newton():
         )
 
 
+def test_newton_methods():
+    region = fem.RegionHexahedron(fem.Cube(n=4))
+    umat = fem.NeoHooke(mu=1.0, bulk=2.0)
+
+    for method in ["newton", "modified-newton", "bfgs", "broyden"]:
+        field = fem.FieldContainer([fem.Field(region, dim=3)])
+        boundaries, loadcase = fem.dof.uniaxial(field, move=0.2, clamped=True)
+        solid = fem.SolidBody(umat=umat, field=field)
+
+        res = fem.newtonrhapson(items=[solid], method=method, maxiter=32, **loadcase)
+
+        assert res.success
+        assert res.jac is not None
+        assert np.linalg.norm(res.fun[loadcase["dof1"]]) < 1e-6
+
+    # re-use a given jacobian and refresh it after every second iteration
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+    boundaries, loadcase = fem.dof.uniaxial(field, move=0.2, clamped=True)
+    solid = fem.SolidBody(umat=umat, field=field)
+
+    res = fem.newtonrhapson(
+        items=[solid],
+        method="modified-newton",
+        refresh=2,
+        ratio=None,
+        jac0=res.jac,
+        maxiter=32,
+        **loadcase,
+    )
+    assert res.success
+
+    def fun(x):
+        return x**3 + x - 2
+
+    def jac(x):
+        return np.diag(3 * x**2 + 1)
+
+    for method in ["modified-newton", "bfgs", "broyden"]:
+        res = fem.newtonrhapson(
+            np.array([1.5, 0.5]),
+            fun,
+            jac,
+            solve=np.linalg.solve,
+            method=method,
+            maxiter=32,
+            verbose=False,
+        )
+        assert np.allclose(res.x, 1)
+
+    with pytest.raises(ValueError):
+        fem.newtonrhapson(np.ones(2), fun, jac, method="secant")
+
+    solver = fem.solve.FactorizedSolver()
+    A = np.diag([2.0, 4.0])
+    assert np.allclose(solver(A, np.ones(2)), [0.5, 0.25])
+    assert np.allclose(solver(2 * A, np.ones(2)), [0.5, 0.25])
+    solver.reset()
+    assert np.allclose(solver(2 * A, np.ones(2)), [0.25, 0.125])
+
+
 def test_newton_plane():
     # create a quad-region on a rectangle
     region = fem.RegionQuad(fem.Rectangle(n=6))
@@ -308,6 +370,41 @@ def test_newton_body():
     )
 
 
+def test_newton_update_statevars():
+    mesh = fem.Cube(n=3)
+    region = fem.RegionHexahedron(mesh)
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+
+    boundaries, loadcase = fem.dof.uniaxial(field, move=0.2, clamped=True)
+
+    umat = fem.NeoHooke(mu=1.0, bulk=2.0)
+    body = fem.SolidBody(umat, field)
+
+    regionp = fem.RegionHexahedronBoundary(mesh, only_surface=True)
+    fieldp = fem.FieldContainer([fem.Field(regionp, dim=3)])
+    bodyp = fem.SolidBodyPressure(fieldp, pressure=0.1)
+
+    items = [body, bodyp]
+    counts = {id(item): 0 for item in items}
+
+    def counter(item):
+        update_statevars = item.results.update_statevars
+
+        def wrapper():
+            counts[id(item)] += 1
+            return update_statevars()
+
+        return wrapper
+
+    for item in items:
+        item.results.update_statevars = counter(item)
+
+    res = fem.newtonrhapson(items=items, **loadcase)
+
+    assert res.success
+    assert all(count == 1 for count in counts.values())
+
+
 def test_project():
     # rectangle (triangle)
     mesh = fem.Rectangle(n=2).triangulate()
@@ -383,6 +480,54 @@ def test_project():
         projected = fem.project(values, region, average=True)
 
 
+def test_projector():
+    mesh = fem.Cube(n=4)
+    mesh.update(points=np.vstack([mesh.points, [1000, 1000, 1000]]))
+    region = fem.RegionHexahedron(mesh)
+    field = fem.Field(region, dim=3)
+
+    # linear field
+    x = np.einsum("aqc,cad->dqc", region.h, mesh.points[mesh.cells])
+    values = np.stack([1 + 2 * x[0] - x[1], 3 * x[2]])
+    X = mesh.points
+    expected = np.stack([1 + 2 * X[:, 0] - X[:, 1], 3 * X[:, 2]], axis=1)
+
+    for method in ["consistent", "lumped", "spr"]:
+        projector = fem.tools.Projector(region, method=method)
+        projected = projector(values)
+        assert projected.shape == (mesh.npoints, 2)
+        assert not np.any(np.isnan(projected))
+
+        if method != "lumped":
+            assert np.allclose(projected[:-1], expected[:-1])
+
+        projected = projector(field.extract(), region)
+        assert projected.shape == (mesh.npoints, 3, 3)
+        assert np.all([np.allclose(np.eye(3), res) for res in projected[:-1]])
+
+    projector = fem.tools.Projector(region)
+    assert np.allclose(projector(values), fem.project(values, region))
+
+    projector = fem.tools.Projector(region, average=False)
+    assert np.allclose(projector(values), fem.project(values, region, average=False))
+
+    with pytest.raises(ValueError):
+        projector(values, region.copy())
+
+    with pytest.raises(ValueError):
+        fem.tools.Projector(region, method="invalid")
+
+    # rectangle (triangle)
+    mesh = fem.Rectangle(n=3).triangulate()
+    region = fem.RegionTriangle(mesh)
+    field = fem.FieldAxisymmetric(region, dim=2)
+
+    for method in ["consistent", "lumped", "spr"]:
+        projected = fem.tools.Projector(region, method=method)(field.extract())
+        assert projected.shape == (mesh.npoints, 3, 3)
+        assert np.all([np.allclose(np.eye(3), res) for res in projected])
+
+
 def test_topoints():
     mesh = fem.Rectangle(n=2).triangulate()
     region = fem.RegionTriangle(mesh)
@@ -487,15 +632,172 @@ def test_extrapolate():
         projected = fem.tools.extrapolate(values, region, average=True)
 
 
+def test_transfer():
+    mesh = fem.Cube(n=4)
+    region = fem.RegionHexahedron(mesh)
+    field = fem.Field(region, dim=3, values=mesh.points * [1, 2, 3])
+
+    for target in [
+        fem.RegionTetra(fem.Cube(n=6).triangulate()),
+        fem.RegionQuadraticHexahedron(fem.Cube(n=3).add_midpoints_edges()),
+    ]:
+        transfer = fem.tools.Transfer(region, target)
+        assert transfer.matrix.shape == (target.mesh.npoints, mesh.npoints)
+
+        # a linear field is transferred exactly
+        values = transfer.point_data(field.values)
+        assert np.allclose(values, target.mesh.points * [1, 2, 3])
+
+        # values at quadrature-points
+        dudX = transfer.quadrature_data(field.grad())
+        assert dudX.shape == (3, 3, *target.dV.shape)
+        assert np.allclose(dudX, np.diag([1, 2, 3]).reshape(3, 3, 1, 1))
+
+        projector = fem.tools.Projector(region)
+        dudX = transfer.quadrature_data(field.grad(), project=projector)
+        assert np.allclose(dudX, np.diag([1, 2, 3]).reshape(3, 3, 1, 1))
+
+    # points outside of the source region
+    circle = fem.Circle(radius=0.6, centerpoint=[0.5, 0.5], n=6)
+    rectangle = fem.Rectangle(n=5)
+    transfer = fem.tools.Transfer(fem.RegionQuad(rectangle), circle)
+    values = transfer.point_data(rectangle.points)
+    assert np.allclose(values, np.clip(circle.points, 0, 1))
+
+    transfer = fem.tools.Transfer(fem.RegionQuad(rectangle), circle, extrapolate=False)
+    outside = np.any((circle.points < 0) | (circle.points > 1), axis=1)
+    assert np.allclose(transfer.matrix.sum(axis=1).A1[~outside], 1)
+    assert np.allclose(transfer.matrix.sum(axis=1).A1[outside], 0)
+
+    matrix = fem.tools.interpolation_matrix(region, [[0.5, 0.5, 0.5]])
+    assert np.isclose(matrix.sum(), 1)
+
+
+def test_lazy_import():
+    import subprocess
+    import sys
+
+    # heavy (optional) dependencies are not imported by ``import felupe`` and the
+    # number of modules added by ``import felupe`` is kept within a budget which (in
+    # contrast to the import time) does not depend on the load of the machine
+    code = "\n".join(
+        [
+            "import sys",
+            "before = set(sys.modules)",
+            "import felupe as fem",
+            "added = set(sys.modules) - before",
+            "assert len(added) <= 5, sorted(added)",
+            "modules = ['numpy', 'scipy', 'tensortrax', 'einsumt', 'meshio',",
+            "           'pyvista', 'matplotlib', 'felupe.mesh', 'felupe.tools']",
+            "assert not [m for m in modules if m in sys.modules], sys.modules.keys()",
+            "mesh = fem.Cube(n=3)",
+            "assert 'felupe.mesh' in sys.modules",
+            "modules = ['scipy.interpolate', 'scipy.spatial', 'scipy.special',",
+            "           'einsumt', 'pyvista', 'matplotlib']",
+            "assert not [m for m in modules if m in sys.modules], sys.modules.keys()",
+            "assert fem.View is fem.ViewSolid",
+            "assert fem.UserMaterial is fem.Material",
+            "assert 'Region' in dir(fem)",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    with pytest.raises(AttributeError):
+        fem.ThisIsNotAnAttribute
+
+
+def test_dump_load():
+    mesh = fem.Cube(n=4)
+    region = fem.RegionHexahedron(mesh)
+    boundary = fem.RegionHexahedronBoundary(mesh)
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+    solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=2), field)
+    solid.assemble.matrix()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = fem.tools.dump([field, boundary], directory)
+        field_loaded, boundary_loaded = fem.tools.load(path)
+
+        region_loaded = field_loaded[0].region
+        mesh_loaded = region_loaded.mesh
+
+        assert isinstance(field_loaded, fem.FieldContainer)
+        assert np.allclose(mesh_loaded.points, mesh.points)
+        assert np.allclose(region_loaded.dhdX, region.dhdX)
+        assert np.allclose(boundary_loaded.normals, boundary.normals)
+        assert np.all(field_loaded[0].indices.cai == field[0].indices.cai)
+
+        # the cache of the mesh is included
+        assert mesh_loaded._cache["cells"] is mesh_loaded.cells
+        assert ("stencil", 3, 3) in mesh_loaded._cache
+
+        # copy-on-write arrays are writeable, but read-only arrays are not
+        field_loaded[0].values[:] = 0.1
+        assert np.allclose(fem.tools.load(path)[0][0].values, 0)
+        assert not fem.tools.load(path, mmap_mode="r")[0][0].values.flags.writeable
+
+        boundaries, loadcase = fem.dof.uniaxial(field_loaded, clamped=True)
+        solid = fem.SolidBody(fem.NeoHooke(mu=1, bulk=2), field_loaded)
+        res = fem.newtonrhapson(items=[solid], **loadcase)
+        assert res.success
+
+        path = fem.tools.dump(mesh, directory, minsize=0, cache=False)
+        assert "_cache" not in vars(fem.tools.load(path, mmap_mode=None))
+
+
+def sweep_model(region, mu):
+    field = fem.FieldContainer([fem.Field(region, dim=3)])
+    boundaries, loadcase = fem.dof.uniaxial(field, clamped=True)
+    solid = fem.SolidBody(umat=fem.NeoHooke(mu=mu, bulk=5000), field=field)
+    move = fem.math.linsteps([0, 0.5], num=2)
+    step = fem.Step(
+        items=[solid], ramp={boundaries["move"]: move}, boundaries=boundaries
+    )
+    curve = fem.CharacteristicCurve(steps=[step], boundary=boundaries["move"])
+    curve.evaluate()
+
+    shared = not region.dhdX.flags.writeable and not region.mesh.points.flags.writeable
+    return np.array(curve.y), shared
+
+
+def test_parameter_sweep():
+    region = fem.RegionHexahedron(fem.Cube(n=4))
+    mu = [1.0, 2.0, 3.0]
+
+    serial = fem.tools.parameter_sweep(sweep_model, region, mu, processes=1)
+    results = fem.tools.parameter_sweep(sweep_model, region, mu, processes=2)
+
+    for (y, shared), (y_serial, shared_serial) in zip(results, serial):
+        assert np.allclose(y, y_serial)
+        assert shared and not shared_serial
+
+    assert not np.allclose(results[1][0], results[0][0])
+
+    # arrays are shared in their compact form and loaded as read-only arrays
+    with tempfile.TemporaryDirectory() as directory:
+        region_shared = fem.tools.load(fem.tools.dump(region, directory), "r")
+
+        assert np.allclose(region_shared.dV, region.dV)
+        assert region_shared.mesh.cells is region_shared._cells
+        assert 0 in region_shared.dhdX.strides
+
+
 if __name__ == "__main__":
     test_solve()
     test_solve_mixed()
     test_newton_simple()
+    test_newton_methods()
     test_newton()
     test_newton_mixed()
     test_newton_plane()
     test_newton_linearelastic()
     test_newton_body()
+    test_newton_update_statevars()
     test_project()
+    test_projector()
     test_topoints()
     test_extrapolate()
+    test_transfer()
+    test_lazy_import()
+    test_dump_load()
+    test_parameter_sweep()